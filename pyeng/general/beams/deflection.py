@@ -100,6 +100,7 @@ class BeamPointLoad(object):
         self._supporttype_right = supporttype_right
         self._seed = seed
         self._fail_silently = fail_silently
+        self._grid_key = None
         self.calculate()
 
     @property
@@ -297,39 +298,41 @@ class BeamPointLoad(object):
                                        (2.0 * (beam_length ** 2.0) + 2.0 * a * beam_length -
                                         (a ** 2.0))
 
-            self.x = np.linspace(0.0, beam_length, seed)
+            # The grid and the load multiplier only depend on the beam length, the number of nodes and the
+            # position of the load. They are reused when only the stiffness or the supports change
+            grid_key = (beam_length, seed, a)
+            if grid_key != self._grid_key:
+                self.x = np.linspace(0.0, beam_length, seed)
+                self.multiplier = np.piecewise(self.x, [self.x < a, self.x >= a], [0, 1.0])
+                self._grid_key = grid_key
 
-            self.multiplier = np.piecewise(self.x, [self.x < a, self.x >= a], [0, 1.0])
+            # The shear forces, bending moments, slopes and deflections are evaluated for all nodes at once,
+            # the load terms only act beyond the point load where the multiplier equals 1
+            x = self.x
+            load_lever = self.multiplier * (x - a)
 
-            self.shear_force = list(map(lambda mult: self.reaction_left - point_load*(mult**0.0),
-                                        self.multiplier))
+            self.shear_force = self.reaction_left - point_load * (self.multiplier ** 0.0)
             if flip:
                 self.shear_force = np.flipud(self.shear_force)
 
-            self.bending_moment =  list(map(lambda x, mult: self.moment_left +
-                                                            self.reaction_left*x -
-                                                            point_load*mult*(x - a),
-                                            self.x,
-                                            self.multiplier))
+            self.bending_moment = self.moment_left + \
+                                  self.reaction_left * x - \
+                                  point_load * load_lever
             if flip:
                 self.bending_moment = np.flipud(self.bending_moment)
 
-            self.slope = list(map(lambda x,mult: self.slope_left +
-                                                 (self.moment_left * x / rigidity) +
-                                                 ((self.reaction_left * (x ** 2.0)) / (2.0 * rigidity)) -
-                                                 ((point_load * ((mult*(x - a)) ** 2.0)) / (2.0 * rigidity)),
-                            self.x,
-                            self.multiplier))
+            self.slope = self.slope_left + \
+                         (self.moment_left * x / rigidity) + \
+                         ((self.reaction_left * (x ** 2.0)) / (2.0 * rigidity)) - \
+                         ((point_load * (load_lever ** 2.0)) / (2.0 * rigidity))
             if flip:
                 self.slope = np.flipud(self.slope)
 
-            self.deflection = list(map(lambda x, mult: self.deflection_left +
-                                                       (self.slope_left*x) +
-                                                       ((self.moment_left*(x**2.0))/(2.0*rigidity)) +
-                                                       ((self.reaction_left * (x**3.0))/(6.0 * rigidity)) -
-                                                       ((point_load*((mult*(x - a))**3.0))/(6.0 * rigidity)),
-                                       self.x,
-                                       self.multiplier))
+            self.deflection = self.deflection_left + \
+                              (self.slope_left * x) + \
+                              ((self.moment_left * (x ** 2.0)) / (2.0 * rigidity)) + \
+                              ((self.reaction_left * (x ** 3.0)) / (6.0 * rigidity)) - \
+                              ((point_load * (load_lever ** 3.0)) / (6.0 * rigidity))
             if flip:
                 self.deflection = np.flipud(self.deflection)
 
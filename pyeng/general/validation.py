@@ -5,20 +5,29 @@ __author__ = 'Bruno Stuyts'
 
 import re
 import numpy as np
-from functools import wraps, partial
+from functools import wraps, partial, lru_cache
 import inspect
-from copy import deepcopy
 from collections import OrderedDict
 
+@lru_cache(maxsize=512)
+def _compile_regex(regex):
+    """
+    Returns the compiled regex pattern, patterns are only compiled on first use
+    """
+    return re.compile(regex)
+
 def validate_float(var_name,value,min_value=None,max_value=None):
     """
     Validates whether a variable can be used as a floating point number and whether it is within specified bounds
     If a value equals one of the bounds, the validation passes
     """
-    try:
-        float(value)
-    except Exception as err:
-        raise TypeError("%s (%s) is not a floating point number - %s" % (var_name,str(value),str(err)))
+    # Plain floats and integers are accepted without attempting the conversion
+    value_type = type(value)
+    if value_type is not float and value_type is not int:
+        try:
+            float(value)
+        except Exception as err:
+            raise TypeError("%s (%s) is not a floating point number - %s" % (var_name,str(value),str(err)))
         
     if min_value!=None and value<min_value:
         raise ValueError("%s (%s) cannot be smaller than %s" % (var_name,str(value),str(min_value)))
@@ -33,13 +42,14 @@ def validate_integer(var_name,value,min_value=None,max_value=None):
     Validates whether a variable can be used as an integer and whether it is within specified bounds
     If a value equals one of the bounds, the validation passes
     """
-    try:
-        if int(value)==value:
-            pass
-        else:
-            raise TypeError("Value can be converted to integer (%s) but converted integer does not equal %s" % (str(int(value)),str(value)))
-    except Exception as err:
-        raise TypeError("%s (%s) is not an integer number - %s" % (var_name,str(value),str(err)))
+    if type(value) is not int:
+        try:
+            if int(value)==value:
+                pass
+            else:
+                raise TypeError("Value can be converted to integer (%s) but converted integer does not equal %s" % (str(int(value)),str(value)))
+        except Exception as err:
+            raise TypeError("%s (%s) is not an integer number - %s" % (var_name,str(value),str(err)))
         
     if min_value!=None and value<min_value:
         raise ValueError("%s (%s) cannot be smaller than %s" % (var_name,str(value),str(min_value)))
@@ -53,13 +63,14 @@ def validate_boolean(var_name,value):
     """
     Validates whether a variable can be used as a boolean
     """
-    try:
-        if bool(value)==value:
-            pass
-        else:
-            raise TypeError("Value can be converted to boolean (%s) but converted boolean does not equal %s" % (str(bool(value)),str(value)))
-    except Exception as err:
-        raise TypeError("%s (%s) is not a boolean - %s" % (var_name,str(value),str(err)))
+    if type(value) is not bool:
+        try:
+            if bool(value)==value:
+                pass
+            else:
+                raise TypeError("Value can be converted to boolean (%s) but converted boolean does not equal %s" % (str(bool(value)),str(value)))
+        except Exception as err:
+            raise TypeError("%s (%s) is not a boolean - %s" % (var_name,str(value),str(err)))
     
     return True
     
@@ -69,77 +80,104 @@ def validate_string(var_name,value,options=None,regex=None):
     The routine also allows checking whether the string is in a list of strings
     or whether it matches a specific regex pattern
     """
-    try:
-        if str(value)==value:
-            pass
-        else:
-            raise TypeError("Value can be converted to string (%s) but converted string does not equal %s" % (str(value),str(value)))
-    except Exception as err:
-        raise TypeError("%s (%s) is not a string - %s" % (var_name,str(value),str(err)))
+    if type(value) is not str:
+        try:
+            if str(value)==value:
+                pass
+            else:
+                raise TypeError("Value can be converted to string (%s) but converted string does not equal %s" % (str(value),str(value)))
+        except Exception as err:
+            raise TypeError("%s (%s) is not a string - %s" % (var_name,str(value),str(err)))
     
     if options!=None and value not in options:
         raise ValueError("%s (%s) not included in list of allowable strings (%s)" % (var_name,str(value),str(options)))
         
-    if regex!=None and not bool(re.match(re.compile(regex), value)):
+    if regex!=None and not bool(_compile_regex(regex).match(value)):
         raise ValueError("%s (%s) does not match the required string format (%s)" % (var_name,str(value),str(regex)))
     
     return True
    
+# Below this length, the Python checks are faster than the conversion to a numpy array
+LIST_VECTORISATION_SIZE = 100
+
 def validate_list(var_name,value,elementtype=None,order=None,unique=None,empty_allowed=None):
     """
     Validates whether a list contains numbers. It allows checking whether these numbers are ascending or descending
     and whether non-unique values exist 
     """
-    try:
-        if type(value)==np.ndarray:
-            value=list(value)
+    value_type = type(value)
+    if value_type is not list and value_type is not tuple:
+        try:
+            if value_type is np.ndarray:
+                value=list(value)
 
-        if list(value)==value or tuple(value)==value:
-            pass
-        else:
-            raise TypeError("Value can be converted to list (%s) but converted list does not equal %s" % (str(value),str(value)))
-    except Exception as err:
-        raise TypeError("%s (%s) is not a list or tuple - %s" % (var_name,str(value),str(err)))
+            if list(value)==value or tuple(value)==value:
+                pass
+            else:
+                raise TypeError("Value can be converted to list (%s) but converted list does not equal %s" % (str(value),str(value)))
+        except Exception as err:
+            raise TypeError("%s (%s) is not a list or tuple - %s" % (var_name,str(value),str(err)))
     
-    if elementtype!=None:
+    # Long lists of numbers are checked with numpy instead of checking the elements one by one in Python
+    # A numeric array contains valid elements, the order and uniqueness are checked on the array
+    numeric_values = None
+    if (elementtype=="float" or elementtype=="int") and type(value) is list and \
+            len(value) >= LIST_VECTORISATION_SIZE:
+        try:
+            numeric_values = np.asarray(value)
+        except Exception:
+            numeric_values = None
+        # Nested lists give multidimensional arrays, these are rejected by the element checks in Python
+        if numeric_values is not None and (numeric_values.ndim != 1 or
+                                           numeric_values.dtype.kind not in ('iu' if elementtype=="int" else 'iuf')):
+            numeric_values = None
+
+    if elementtype!=None and numeric_values is None:
+        # The element validator is looked up once instead of for every element
+        validate_element = LIST_ELEMENT_VALIDATORS.get(elementtype)
         try:
             for i,el in enumerate(value):
-                if elementtype=="float":
-                    validate_float(var_name,el)
-                elif elementtype=="string":
-                    validate_string(var_name,el)
-                elif elementtype=="int":
-                    validate_integer(var_name,el)
-                elif elementtype=="boolean":
-                    validate_boolean(var_name,el)
-                else:
+                if validate_element is None:
                     raise ValueError("Unspecified elementtype")
+                validate_element(var_name,el)
         except Exception as err:
             raise ValueError("Invalid element type for %s, %s required" % (str(el),elementtype))
     
     if order=='ascending':
-        try:
-            if sorted(value)==value and (np.nan not in value):
-                pass
-            else:
+        if numeric_values is not None:
+            if np.isnan(numeric_values).any() or (np.diff(numeric_values) < 0).any():
                 raise ValueError("List %s is not ascending" % str(value))
-        except Exception as err:
-            raise ValueError("%s" % str(err))
+        else:
+            try:
+                if sorted(value)==value and (np.nan not in value):
+                    pass
+                else:
+                    raise ValueError("List %s is not ascending" % str(value))
+            except Exception as err:
+                raise ValueError("%s" % str(err))
     elif order=='descending':
-        try:
-            if sorted(value)==list(reversed(value)) and (np.nan not in value):
-                pass
-            else:
+        if numeric_values is not None:
+            if np.isnan(numeric_values).any() or (np.diff(numeric_values) > 0).any():
                 raise ValueError("List %s is not descending" % str(value))
-        except Exception as err:
-            raise ValueError("%s" % str(err))
+        else:
+            try:
+                if sorted(value)==list(reversed(value)) and (np.nan not in value):
+                    pass
+                else:
+                    raise ValueError("List %s is not descending" % str(value))
+            except Exception as err:
+                raise ValueError("%s" % str(err))
     elif order is None:
         pass # Nothing happens when order is not specified
     else:
         raise ValueError("Incorrect string for list order")
     
     if unique==True:
-        if len(value) > len(set(value)):
+        if numeric_values is not None:
+            non_unique = numeric_values.size > np.unique(numeric_values).size
+        else:
+            non_unique = len(value) > len(set(value))
+        if non_unique:
             raise ValueError("%s (%s) contains non-unique elements" % (var_name,str(value)))
     elif unique is None or unique==False:
         pass # Nothing happens when unique is None or unspecified
@@ -152,6 +190,32 @@ def validate_list(var_name,value,elementtype=None,order=None,unique=None,empty_a
         
     return True
 
+LIST_ELEMENT_VALIDATORS = {
+    'float': validate_float,
+    'string': validate_string,
+    'int': validate_integer,
+    'boolean': validate_boolean,
+}
+
+def _signature_defaults(method):
+    """
+    Inspects the signature of a function. Returns the names of the positional or keyword parameters as a frozenset
+    and a tuple of (name, default value) pairs, with None for parameters without a default value. The parameter
+    ``self`` of methods is left out. The decorators call this function once when decorating and keep the result.
+    """
+    parameters = inspect.signature(method).parameters.values()
+    parameter_names = frozenset(parameter.name for parameter in parameters \
+                                if ((parameter.kind == parameter.POSITIONAL_OR_KEYWORD) and (parameter.name!='self')))
+    all_vars = OrderedDict((parameter.name, None) for parameter in parameters \
+                           if ((parameter.kind == parameter.POSITIONAL_OR_KEYWORD) and (parameter.name!='self')))
+
+    for parameter in parameters:
+        if str(parameter) != 'self':
+            if not isinstance(parameter.default, type):
+                all_vars[parameter.name] = parameter.default
+
+    return parameter_names, tuple(all_vars.items())
+
 def map_args(method,var,*args,**kwargs):
     
     """
@@ -166,36 +230,44 @@ def map_args(method,var,*args,**kwargs):
     :returns dictionary var_validation which is a copy of the validation data structure
              it is possible to override __min and __max arguments
     """
+    try:
+        signature = _signature_defaults(method)
+    except Exception as err:
+        raise ValueError("Error during mapping of validation parameters to function parameters - %s" % str(err))
+    return _map_signature_args(signature, var, args, kwargs)
+
+def _map_signature_args(signature, var, args, kwargs):
+    """
+    Implementation of ``map_args`` for a signature returned by ``_signature_defaults``, which allows the decorators
+    to inspect the signature of the decorated function only once.
+    """
     try:
         # Construct a data structure with all function arguments, defaults are used
-        # Remove self for validators applied to class methods
-        parameter_names = [parameter.name for parameter in inspect.signature(method).parameters.values() \
-                           if ((parameter.kind == parameter.POSITIONAL_OR_KEYWORD) and (parameter.name!='self'))]
-        all_vars = OrderedDict.fromkeys(parameter_names)
+        parameter_names, defaults = signature
+        all_vars = OrderedDict(defaults)
 
         args = tuple(x for x in args if isinstance(x, (int, float, str, bool, complex, list, tuple, np.ndarray)))
 
-        for parameter in inspect.signature(method).parameters.values():
-            if str(parameter) != 'self':
-                if not isinstance(parameter.default, type):
-                    all_vars[parameter.name] = parameter.default
-
         for key, value in kwargs.items():
             if key in parameter_names:
                 all_vars[key] = value
 
-        for i, arg in enumerate(args):
-            all_vars[list(all_vars.keys())[i]] = args[i]
+        if args:
+            names = list(all_vars.keys())
+            for i, arg in enumerate(args):
+                all_vars[names[i]] = arg
 
-        var_validation = deepcopy(var)
+        # The entries of the validation data structure only contain immutable settings, copying each entry is
+        # sufficient to keep the values and overrides of this call out of the decorator's data structure
+        var_validation = {key: dict(value) for key, value in var.items()}
         
         for key in kwargs.keys():
             # Modification of min and max ranges with override
             # To be changed for not permanent override of min and max
             if key.endswith('__min'):
-                var_validation[key.replace('__min','')]['min_value'] = kwargs[key]
+                var_validation[key[:-5]]['min_value'] = kwargs[key]
             elif key.endswith('__max'):
-                var_validation[key.replace('__max','')]['max_value'] = kwargs[key]
+                var_validation[key[:-5]]['max_value'] = kwargs[key]
             # Bind the actual function arguments, this is required because the defaults are otherwise used 
             else:
                 all_vars[key]=kwargs[key]
@@ -212,12 +284,75 @@ def map_args(method,var,*args,**kwargs):
     except Exception as err:
         raise ValueError("Error during mapping of validation parameters to function parameters - %s" % str(err))
 
+def _check_float(var_name, var_spec):
+    validate_float(var_name, var_spec['value'], var_spec['min_value'], var_spec['max_value'])
+
+def _check_integer(var_name, var_spec):
+    validate_integer(var_name, var_spec['value'], var_spec['min_value'], var_spec['max_value'])
+
+def _check_string(var_name, var_spec):
+    validate_string(var_name, var_spec['value'], options=var_spec['options'], regex=var_spec['regex'])
+
+def _check_boolean(var_name, var_spec):
+    validate_boolean(var_name, var_spec['value'])
+
+def _check_list(var_name, var_spec):
+    validate_list(var_name, var_spec['value'], var_spec['elementtype'], var_spec['order'], var_spec['unique'],
+                  var_spec['empty_allowed'])
+
+VALIDATION_CHECKS = {
+    'float': _check_float,
+    'int': _check_integer,
+    'string': _check_string,
+    'bool': _check_boolean,
+    'list': _check_list,
+}
+
+def compile_validation(var):
+    """
+    Resolves the validation routine for each parameter of a validation data structure. This is done once when a
+    decorator is created instead of comparing the type strings on every function call. Parameters with a type
+    without validation routine are not checked.
+
+    :param var: The validation data structure, entered as argument of the function decorator
+
+    :returns tuple with a (parameter name, validation routine) pair for each parameter which is checked
+    """
+    for value in var.values():
+        # Regex patterns are known when the decorator is created and are compiled upfront
+        if value['type'] == 'string' and value.get('regex') is not None:
+            _compile_regex(value['regex'])
+    return tuple((key, VALIDATION_CHECKS[value['type']]) for key, value in var.items()
+                 if value['type'] in VALIDATION_CHECKS)
+
+def validate_arguments(checks, var_validation):
+    """
+    Applies the validation routines obtained with ``compile_validation`` to the data structure returned by
+    ``map_args``. An error is raised for the first parameter which does not pass the validation.
+    """
+    for var_name, check in checks:
+        check(var_name, var_validation[var_name])
+
 class ValidationDecorator(object):
+    """
+    Validates the function arguments and passes the outcome to the function in the keyword arguments ``validated``
+    and ``errorstring``.
+
+    For functions which are repeatedly called with the same arguments, the results can be cached by specifying
+    ``cache_size``. The validation and calculation are then only done on the first call with a given set of arguments.
+    Calls with unhashable arguments (e.g. lists or arrays) are not cached. A copy of the cached result is returned
+    so modifications by the caller do not end up in the cache.
+    """
 
-    def __init__(self, argument):
+    def __init__(self, argument, cache_size=None):
         self.arg = argument
+        self.checks = compile_validation(argument)
+        self.cache_size = cache_size
 
     def __call__(self, fn):
+        # Inspect the signature when decorating rather than on every call
+        signature = _signature_defaults(fn)
+
         @wraps(fn)
         def decorated(*args, **kwargs):
             validated = True
@@ -236,30 +371,8 @@ class ValidationDecorator(object):
             if validate or validate is None:
 
                 try:
-                    var_validation = map_args(fn, self.arg, *args, **kwargs)
-
-                    for v in var_validation.keys():
-
-                        if var_validation[v]['type'] == 'float':
-                            validate_float(v, var_validation[v]['value'],
-                                           var_validation[v]['min_value'],
-                                           var_validation[v]['max_value'])
-                        elif var_validation[v]['type'] == 'int':
-                            validate_integer(v, var_validation[v]['value'],
-                                             var_validation[v]['min_value'],
-                                             var_validation[v]['max_value'])
-                        elif var_validation[v]['type'] == 'string':
-                            validate_string(v, var_validation[v]['value'],
-                                            options=var_validation[v]['options'],
-                                            regex=var_validation[v]['regex'])
-                        elif var_validation[v]['type'] == 'bool':
-                            validate_boolean(v, var_validation[v]['value'])
-                        elif var_validation[v]['type'] == 'list':
-                            validate_list(v, var_validation[v]['value'],
-                                          var_validation[v]['elementtype'],
-                                          var_validation[v]['order'],
-                                          var_validation[v]['unique'],
-                                          var_validation[v]['empty_allowed'])
+                    var_validation = _map_signature_args(signature, self.arg, args, kwargs)
+                    validate_arguments(self.checks, var_validation)
 
                 except Exception as err:
                     validated = False
@@ -269,7 +382,26 @@ class ValidationDecorator(object):
 
             return fn(*args, validated=validated, errorstring=errorstring, **kwargs)
 
-        return decorated
+        if self.cache_size is None:
+            return decorated
+
+        @lru_cache(maxsize=self.cache_size)
+        def cached(args, kwargs):
+            return decorated(*args, **dict(kwargs))
+
+        @wraps(fn)
+        def decorated_cached(*args, **kwargs):
+            # Overrides of the validation ranges are part of the keyword arguments and therefore of the cache key
+            key = (args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return decorated(*args, **kwargs)
+            return cached(*key).copy()
+
+        decorated_cached.cache_info = cached.cache_info
+        decorated_cached.cache_clear = cached.cache_clear
+        return decorated_cached
 
 
 class Validator(object):
@@ -285,8 +417,12 @@ class Validator(object):
     def __init__(self, validationspec, outputonerrorspec):
         self.validationspec = validationspec
         self.outputonerror = outputonerrorspec
+        self.checks = compile_validation(validationspec)
 
     def __call__(self, fn):
+        # Inspect the signature when decorating rather than on every call
+        signature = _signature_defaults(fn)
+
         @wraps(fn)
         def decorated(*args, **kwargs):
 
@@ -313,30 +449,13 @@ class Validator(object):
             if validate or validate is None:
                 # Execute validation
                 try:
-                    var_validation = map_args(fn, validation_params, *args, **kwargs)
-
-                    for v in var_validation.keys():
-
-                        if var_validation[v]['type'] == 'float':
-                            validate_float(v, var_validation[v]['value'],
-                                           var_validation[v]['min_value'],
-                                           var_validation[v]['max_value'])
-                        elif var_validation[v]['type'] == 'int':
-                            validate_integer(v, var_validation[v]['value'],
-                                             var_validation[v]['min_value'],
-                                             var_validation[v]['max_value'])
-                        elif var_validation[v]['type'] == 'string':
-                            validate_string(v, var_validation[v]['value'],
-                                            options=var_validation[v]['options'],
-                                            regex=var_validation[v]['regex'])
-                        elif var_validation[v]['type'] == 'bool':
-                            validate_boolean(v, var_validation[v]['value'])
-                        elif var_validation[v]['type'] == 'list':
-                            validate_list(v, var_validation[v]['value'],
-                                          var_validation[v]['elementtype'],
-                                          var_validation[v]['order'],
-                                          var_validation[v]['unique'],
-                                          var_validation[v]['empty_allowed'])
+                    var_validation = _map_signature_args(signature, validation_params, args, kwargs)
+                    # The routines of a custom validation data structure are only resolved when it is used
+                    if validation_params is self.validationspec:
+                        checks = self.checks
+                    else:
+                        checks = compile_validation(validation_params)
+                    validate_arguments(checks, var_validation)
 
                 except:
                     raise
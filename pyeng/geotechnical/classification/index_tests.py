@@ -12,7 +12,7 @@ PLASTICITY_CHART = {
 }
 
 
-@ValidationDecorator(PLASTICITY_CHART)
+@ValidationDecorator(PLASTICITY_CHART, cache_size=128)
 def plasticity_chart(liquid_limit, plasticity_index, fail_silently=True, **kwargs):
     """
     Classification of fine-grained soils according to their plasticity. The plasticity chart comprises six regions divided by the so-called A-line. Soil above the A-line are inorganic clays and soils below the A-line are inorganic silts, organic silts or organic clays.
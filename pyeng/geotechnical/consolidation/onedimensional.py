@@ -16,7 +16,7 @@ CONSOLIDATION_DRAINAGE_JANBU = {
 }
 
 
-@ValidationDecorator(CONSOLIDATION_DRAINAGE_JANBU)
+@ValidationDecorator(CONSOLIDATION_DRAINAGE_JANBU, cache_size=128)
 def consolidation_drainage_janbu(time, consolidation_coefficient, drainage_path_length, drainage_type="double",
                                  stress_distribution="constant", fail_silently=True, **kwargs):
     """
@@ -167,4 +167,39 @@ def gmax_cptclay_maynerix95(
     return {
         'Vs [m/s]': _vs,
         'Gmax [kPa]': _gmax,
-    }
\ No newline at end of file
+    }
+
+
+def gmax_cptclay_maynerix95_soa(
+        cone_resistance, density, vs_out, gmax_out,
+        coefficient_1=1.75, coefficient_2=0.627):
+    """
+    Array version of ``gmax_cptclay_maynerix95`` for the interpretation of a complete CPT profile. The shear wave velocity and small-strain shear modulus are written in-place into the preallocated output arrays, no temporary arrays are allocated.
+
+    No parameter validation is performed, the caller is responsible for checking that the inputs are within the ranges of ``gmax_cptclay_maynerix95``.
+
+    :param cone_resistance: Array with the cone tip resistance (:math:`q_c`) [:math:`MPa`]
+    :param density: Array with the density of the soil material (:math:`\\rho`) [:math:`kg/m3`]
+    :param vs_out: Preallocated float array receiving the shear wave velocity (:math:`V_s`) [:math:`m/s`]
+    :param gmax_out: Preallocated float array receiving the small-strain shear modulus (:math:`G_{max}`) [:math:`kPa`]
+    :param coefficient_1: First coefficient (multiplier) in the correlation (:math:``) [:math:`-`] (optional, default= 1.75)
+    :param coefficient_2: Second coefficient (exponent) in the correlation (:math:``) [:math:`-`] (optional, default= 0.627)
+
+    :returns: Dictionary with the following keys:
+
+        - 'Vs [m/s]': The array ``vs_out``
+        - 'Gmax [kPa]': The array ``gmax_out``
+
+    """
+
+    np.multiply(cone_resistance, 1e3, out=vs_out)
+    np.power(vs_out, coefficient_2, out=vs_out)
+    np.multiply(vs_out, coefficient_1, out=vs_out)
+    np.multiply(vs_out, vs_out, out=gmax_out)
+    np.multiply(gmax_out, density, out=gmax_out)
+    np.multiply(gmax_out, 1e-3, out=gmax_out)
+
+    return {
+        'Vs [m/s]': vs_out,
+        'Gmax [kPa]': gmax_out,
+    }
@@ -4,8 +4,57 @@
 __author__ = 'Bruno Stuyts'
 
 from pyeng.general.validation import ValidationDecorator
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_left
+from functools import lru_cache
+import json
+import math
+import os
 import numpy as np
 
+# Constant factors of the Boussinesq solutions
+INV_PI = 1.0 / np.pi
+INV_TWO_PI = 0.5 / np.pi
+THREE_OVER_TWO_PI = 1.5 / np.pi
+LN10 = np.log(10.0)
+
+
+def _stresses_pointload_boussinesq_raw(point_load, x, y, z, poisson_coefficient):
+    """
+    Point load stresses without validation or error handling, see ``stresses_pointload_boussinesq``.
+    Returns the tuple (sigma_z, sigma_x, sigma_y, tau_zx, tau_yz, tau_xy, radius).
+    """
+    x_2 = x * x
+    y_2 = y * y
+    z_2 = z * z
+    radius = np.sqrt(x_2 + y_2 + z_2)
+    radius_3 = radius * radius * radius
+    radius_5 = radius_3 * radius * radius
+    radius_plus_z = radius + z
+    two_radius_plus_z = 2.0 * radius + z
+    inv_radius_radius_plus_z = 1.0 / (radius * radius_plus_z)
+    radius_3_radius_plus_z_2 = radius_3 * radius_plus_z * radius_plus_z
+
+    prefactor = THREE_OVER_TWO_PI * point_load
+    nu_term = (1.0 - 2.0 * poisson_coefficient) / 3.0
+
+    sigma_z = prefactor * ((z_2 * z) / radius_5)
+    sigma_x = prefactor * (((x_2 * z) / radius_5) + nu_term *
+                           (-inv_radius_radius_plus_z -
+                            ((x_2 * two_radius_plus_z) / radius_3_radius_plus_z_2) -
+                            (z / radius_3)))
+    sigma_y = prefactor * (((y_2 * z) / radius_5) + nu_term *
+                           (-inv_radius_radius_plus_z -
+                            ((y_2 * two_radius_plus_z) / radius_3_radius_plus_z_2) -
+                            (z / radius_3)))
+    tau_zx = -prefactor * ((x * z_2) / radius_5)
+    tau_yz = -prefactor * ((y * z_2) / radius_5)
+    tau_xy = prefactor * (((x * y * z) / radius_5) -
+                          nu_term * ((x * y * two_radius_plus_z) / radius_3_radius_plus_z_2))
+
+    return sigma_z, sigma_x, sigma_y, tau_zx, tau_yz, tau_xy, radius
+
+
 STRESSES_POINTLOAD_BOUSSINESQ = {
     'point_load': {'type': 'float', 'min_value': None, 'max_value': None},
     'x': {'type': 'float', 'min_value': None, 'max_value': None},
@@ -14,10 +63,20 @@ STRESSES_POINTLOAD_BOUSSINESQ = {
     'poisson_coefficient': {'type': 'float', 'min_value': 0.0, 'max_value': 0.5},
 }
 
+STRESSES_POINTLOAD_BOUSSINESQ_ERRORRETURN = {
+    'sigma_z [kPa]': np.nan,
+    'sigma_x [kPa]': np.nan,
+    'sigma_y [kPa]': np.nan,
+    'tau_zx [kPa]': np.nan,
+    'tau_yz [kPa]': np.nan,
+    'tau_xy [kPa]': np.nan,
+    'radius [m]': np.nan,
+}
+
 @ValidationDecorator(STRESSES_POINTLOAD_BOUSSINESQ)
 def stresses_pointload_boussinesq(point_load, x, y, z, poisson_coefficient=0.3, fail_silently=True, **kwargs):
     """
-    Calculates stresses in a linear elastic half space due to a point load. Although most geotechnical material behave in a non-linear manner, these formulae can be applied provided that the hypothesis of linear elasticity is a reasonable approximation for the actual behaviour of the soil.
+    Calculates stresses in a linear elastic half space due to a point load. Although most geotechnical material behave in a non-linear manner, these formulae can be applied provided that the hypothesis of linear elasticity is a reasonable approximation for the actual behaviour of the soil. Use ``stresses_pointload_boussinesq_vec`` to evaluate a stress field on a large number of points.
 
     :param point_load: Point load acting on the half-space (:math:`P`) [:math:`kPa`]
     :param x: x-coordinate of the point where stresses are calculated (:math:`x`) [:math:`m`]
@@ -62,27 +121,8 @@ def stresses_pointload_boussinesq(point_load, x, y, z, poisson_coefficient=0.3,
         if not kwargs['validated']:
             raise ValueError("Error during function validation, %s" % kwargs['errorstring'])
 
-        radius_xy = np.sqrt(x**2.0 + y**2.0)
-        radius = np.sqrt(radius_xy**2.0 + z**2.0)
-
-        sigma_z = ((3.0*point_load)/(2.0*np.pi))*((z**3.0)/(radius**5.0))
-        sigma_x = ((3.0*point_load)/(2.0*np.pi)) * \
-                  ((((x**2.0) * z)/(radius**5.0)) + ((1.0 - 2.0*poisson_coefficient)/3.0) *
-                   (-(1.0/(radius * (radius + z))) -
-                    (((x**2.0)*(2.0*radius + z))/((radius**3.0)*((radius + z)**2.0))) -
-                    (z/(radius**3.0))))
-        sigma_y = ((3.0 * point_load) / (2.0 * np.pi)) * \
-                  ((((y ** 2.0) * z) / (radius ** 5.0)) + ((1.0 - 2.0 * poisson_coefficient) / 3.0) *
-                   (-(1.0 / (radius * (radius + z))) -
-                    (((y ** 2.0) * (2.0 * radius + z)) / ((radius ** 3.0) * ((radius + z) ** 2.0))) -
-                    (z / (radius ** 3.0))))
-        tau_zx = -((3.0 * point_load) / (2.0 * np.pi)) * \
-                  ((x * (z ** 2.0))/(radius**5.0))
-        tau_yz = -((3.0 * point_load) / (2.0 * np.pi)) * \
-                  ((y * (z ** 2.0)) / (radius ** 5.0))
-        tau_xy = ((3.0 * point_load) / (2.0 * np.pi)) * \
-                 (((x*y*z) / (radius ** 5.0)) -
-                  ((1.0 - 2.0 * poisson_coefficient)/3.0)*((x*y*(2.0*radius + z))/((radius**3.0)*((radius + z)**2.0))))
+        sigma_z, sigma_x, sigma_y, tau_zx, tau_yz, tau_xy, radius = _stresses_pointload_boussinesq_raw(
+            point_load, x, y, z, poisson_coefficient)
 
         return {
             'sigma_z [kPa]': sigma_z,
@@ -94,26 +134,161 @@ def stresses_pointload_boussinesq(point_load, x, y, z, poisson_coefficient=0.3,
             'radius [m]': radius,
         }
 
-    except:
+    except (ValueError, TypeError, ArithmeticError):
         if fail_silently or fail_silently is None:
-            return {
-                'sigma_z [kPa]': np.nan,
-                'sigma_x [kPa]': np.nan,
-                'sigma_y [kPa]': np.nan,
-                'tau_zx [kPa]': np.nan,
-                'tau_yz [kPa]': np.nan,
-                'tau_xy [kPa]': np.nan,
-                'radius [m]': np.nan,
-            }
+            return STRESSES_POINTLOAD_BOUSSINESQ_ERRORRETURN.copy()
         else:
             raise
 
+
+# Number of points evaluated at once by the vectorised point load kernel, chosen such that
+# the temporary arrays of a block remain in the processor cache
+POINTLOAD_BLOCK_SIZE = 4096
+
+
+def _pointload_kernel(prefactor, nu_prefactor, x, y, z,
+                      sigma_z, sigma_x, sigma_y, tau_zx, tau_yz, tau_xy, radius):
+    """
+    Evaluates the point load stresses for the 1D arrays ``x``, ``y`` and ``z`` and writes them into the
+    preallocated output arrays of the same length. The load and the Poisson coefficient enter through the
+    constant factors :math:`3P / (2 \\pi)` (``prefactor``) and :math:`3P / (2 \\pi) (1 - 2 \\nu) / 3` (``nu_prefactor``).
+    """
+    # The kernel is called once per block, bind the ufuncs to locals to avoid repeated module lookups
+    multiply = np.multiply
+    x_2 = x * x
+    y_2 = y * y
+    z_2 = z * z
+    np.sqrt(x_2 + y_2 + z_2, out=radius)
+    inv_radius = 1.0 / radius
+    inv_radius_3 = inv_radius * inv_radius * inv_radius
+    inv_radius_plus_z = 1.0 / (radius + z)
+
+    # 3P/(2 pi) z/R^5, shared by all stress components
+    kz_r5 = (prefactor * z) * inv_radius_3 * inv_radius * inv_radius
+    # 3P/(2 pi) (1 - 2 nu)/3 (1/(R (R + z)) + z/R^3), shared by sigma_x and sigma_y
+    normal_term = nu_prefactor * (inv_radius * inv_radius_plus_z + z * inv_radius_3)
+    # 3P/(2 pi) (z/R^5 - (1 - 2 nu)/3 (2R + z)/(R^3 (R + z)^2)), multiplied by x^2, y^2 and xy
+    shape_term = kz_r5 - (nu_prefactor * (2.0 * radius + z)) * inv_radius_3 * inv_radius_plus_z * inv_radius_plus_z
+
+    multiply(kz_r5, z_2, out=sigma_z)
+    multiply(x_2, shape_term, out=sigma_x)
+    sigma_x -= normal_term
+    multiply(y_2, shape_term, out=sigma_y)
+    sigma_y -= normal_term
+    multiply(kz_r5, -x * z, out=tau_zx)
+    multiply(kz_r5, -y * z, out=tau_yz)
+    multiply(x * y, shape_term, out=tau_xy)
+
+
+def _flatten_grid(coordinate, shape):
+    """
+    Prepares a coordinate array for block-wise evaluation on a grid with the given shape. Coordinates which are
+    constant over the grid (e.g. x and y for a vertical profile) are returned as scalars and broadcast by the
+    kernel, only the varying coordinates are expanded to a contiguous array of the full grid size.
+    """
+    if coordinate.size == 1:
+        return coordinate.reshape(())[()]
+    return np.ascontiguousarray(np.broadcast_to(coordinate, shape)).ravel()
+
+
+def stresses_pointload_boussinesq_vec(point_load, x, y, z, poisson_coefficient=0.3, workers=1, dtype=np.float64):
+    """
+    Vectorised version of ``stresses_pointload_boussinesq`` for the evaluation of a stress field on a large number of points. The coordinates ``x``, ``y`` and ``z`` can be NumPy arrays (or anything which can be converted to a float array) and are broadcast against each other. Validation is limited to a single range check on ``z`` and ``poisson_coefficient`` instead of the per-call validation of the scalar function.
+
+    The points are processed in blocks of ``POINTLOAD_BLOCK_SIZE`` to keep the intermediate results in the processor cache. As NumPy releases the GIL during the array operations, the blocks can be distributed over several threads with ``workers`` to use multiple processor cores for large grids. Points coinciding with the point load (:math:`R = 0`) return ``inf`` or ``nan`` instead of raising an error.
+
+    :param point_load: Point load acting on the half-space (:math:`P`) [:math:`kPa`]
+    :param x: Array with x-coordinates of the points where stresses are calculated (:math:`x`) [:math:`m`]
+    :param y: Array with y-coordinates of the points where stresses are calculated (:math:`y`) [:math:`m`]
+    :param z: Array with z-coordinates of the points where stresses are calculated (:math:`z`) [:math:`m`]  - Suggested range: 0.0<=z
+    :param poisson_coefficient: Poisson coefficient (:math:`\\nu`) [:math:`-`] (optional, default=0.3) - Suggested range: 0.0<=poisson_coefficient<=0.5
+    :param workers: Number of threads over which the blocks are distributed (optional, default=1)
+    :param dtype: Floating point type used for the calculation and the output, ``np.float32`` halves the memory traffic for large grids at the expense of precision (optional, default=np.float64)
+
+    :returns: Same output as ``stresses_pointload_boussinesq`` with arrays instead of scalars
+
+    :rtype: Python dictionary with keys ['sigma_z [kPa]','sigma_x [kPa]','sigma_y [kPa]','tau_zx [kPa]','tau_yz [kPa]','tau_xy [kPa]','radius [m]']
+
+    """
+
+    dtype = np.dtype(dtype)
+    x = np.asarray(x, dtype=dtype)
+    y = np.asarray(y, dtype=dtype)
+    z = np.asarray(z, dtype=dtype)
+    grid = np.broadcast(x, y, z)
+    shape = grid.shape
+    size = grid.size
+
+    if np.any(z < 0.0):
+        raise ValueError("z (%s) cannot be smaller than 0.0" % str(z.min()))
+    if poisson_coefficient < 0.0 or poisson_coefficient > 0.5:
+        raise ValueError("poisson_coefficient (%s) must be between 0.0 and 0.5" % str(poisson_coefficient))
+
+    x = _flatten_grid(x, shape)
+    y = _flatten_grid(y, shape)
+    z = _flatten_grid(z, shape)
+    # The factors depending on the load and the Poisson coefficient are evaluated once for all blocks,
+    # they are converted to the calculation type to avoid upcasting of the arrays
+    prefactor = THREE_OVER_TWO_PI * point_load
+    nu_prefactor = dtype.type(prefactor * (1.0 - 2.0 * poisson_coefficient) / 3.0)
+    prefactor = dtype.type(prefactor)
+    results = np.empty((7, size), dtype=dtype)
+
+    def calculate_block(start):
+        block = slice(start, start + POINTLOAD_BLOCK_SIZE)
+        x_block, y_block, z_block = [coordinate[block] if coordinate.ndim else coordinate for coordinate in (x, y, z)]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            _pointload_kernel(prefactor, nu_prefactor, x_block, y_block, z_block, *results[:, block])
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(calculate_block, range(0, size, POINTLOAD_BLOCK_SIZE)))
+    else:
+        for start in range(0, size, POINTLOAD_BLOCK_SIZE):
+            calculate_block(start)
+
+    results = results.reshape((7,) + shape)
+
+    return {
+        'sigma_z [kPa]': results[0],
+        'sigma_x [kPa]': results[1],
+        'sigma_y [kPa]': results[2],
+        'tau_zx [kPa]': results[3],
+        'tau_yz [kPa]': results[4],
+        'tau_xy [kPa]': results[5],
+        'radius [m]': results[6],
+    }
+
+
+def _stresses_lineload_boussinesq_raw(line_load, x, z):
+    """
+    Line load stresses without validation or error handling, see ``stresses_lineload_boussinesq``.
+    Returns the tuple (sigma_z, sigma_x, tau_zx).
+    """
+    x_2 = x * x
+    z_2 = z * z
+    r_2 = x_2 + z_2
+    factor = (2.0 * INV_PI * line_load) / (r_2 * r_2)
+
+    sigma_z = factor * z_2 * z
+    sigma_x = factor * x_2 * z
+    tau_zx = factor * x * z_2
+
+    return sigma_z, sigma_x, tau_zx
+
+
 STRESSES_LINELOAD_BOUSSINESQ = {
     'line_load': {'type': 'float', 'min_value': None, 'max_value': None},
     'x': {'type': 'float', 'min_value': None, 'max_value': None},
     'z': {'type': 'float', 'min_value': 0.0, 'max_value': None},
 }
 
+STRESSES_LINELOAD_BOUSSINESQ_ERRORRETURN = {
+    'sigma_z [kPa]': np.nan,
+    'sigma_x [kPa]': np.nan,
+    'tau_zx [kPa]': np.nan,
+}
+
 @ValidationDecorator(STRESSES_LINELOAD_BOUSSINESQ)
 def stresses_lineload_boussinesq(line_load, x, z, fail_silently=True, **kwargs):
     """
@@ -150,9 +325,7 @@ def stresses_lineload_boussinesq(line_load, x, z, fail_silently=True, **kwargs):
         if not kwargs['validated']:
             raise ValueError("Error during function validation, %s" % kwargs['errorstring'])
 
-        sigma_z = (2.0 * line_load * z**3.0)/(np.pi * (x**2.0 + z**2.0)**2.0)
-        sigma_x = (2.0 * line_load * (x**2.0) * z)/(np.pi * (x**2.0 + z**2.0)**2.0)
-        tau_zx = (2.0 * line_load * x * (z ** 2.0)) / (np.pi * (x ** 2.0 + z ** 2.0) ** 2.0)
+        sigma_z, sigma_x, tau_zx = _stresses_lineload_boussinesq_raw(line_load, x, z)
 
         return {
             'sigma_z [kPa]': sigma_z,
@@ -160,16 +333,38 @@ def stresses_lineload_boussinesq(line_load, x, z, fail_silently=True, **kwargs):
             'tau_zx [kPa]': tau_zx,
         }
 
-    except:
+    except (ValueError, TypeError, ArithmeticError):
         if fail_silently or fail_silently is None:
-            return {
-                'sigma_z [kPa]': np.nan,
-                'sigma_x [kPa]': np.nan,
-                'tau_zx [kPa]': np.nan,
-            }
+            return STRESSES_LINELOAD_BOUSSINESQ_ERRORRETURN.copy()
         else:
             raise
 
+
+def _stresses_striploadconstant_boussinesq_raw(strip_load, load_width, x, z):
+    """
+    Constant strip load stresses without validation or error handling, see
+    ``stresses_striploadconstant_boussinesq``. Returns the tuple (sigma_z, sigma_x, tau_zx).
+    """
+    # With tan(theta_1) = x/z and tan(beta) = (x-B)/z, alpha = theta_1 - beta and alpha + 2 beta = theta_1 + beta.
+    # The products of sines and cosines then reduce to double angle terms which are rational in x, z and B:
+    # sin(alpha) cos(alpha + 2 beta) = (sin(2 theta_1) - sin(2 beta)) / 2
+    # sin(alpha) sin(alpha + 2 beta) = (cos(2 beta) - cos(2 theta_1)) / 2
+    x_b = x - load_width
+    z_2 = z * z
+    r1_2 = x * x + z_2
+    r2_2 = x_b * x_b + z_2
+    alpha = np.arctan2(load_width * z, z_2 + x * x_b)
+    sin_term = x * z / r1_2 - x_b * z / r2_2
+    cos_term = 0.5 * (z_2 - x_b * x_b) / r2_2 - 0.5 * (z_2 - x * x) / r1_2
+
+    factor = INV_PI * strip_load
+    sigma_z = factor * (alpha + sin_term)
+    sigma_x = factor * (alpha - sin_term)
+    tau_zx = factor * cos_term
+
+    return sigma_z, sigma_x, tau_zx
+
+
 STRESSES_STRIPLOADCONSTANT_BOUSSINESQ = {
     'strip_load': {'type': 'float', 'min_value': None, 'max_value': None},
     'load_width': {'type': 'float', 'min_value': 0.0, 'max_value': None},
@@ -177,6 +372,12 @@ STRESSES_STRIPLOADCONSTANT_BOUSSINESQ = {
     'z': {'type': 'float', 'min_value': 0.0, 'max_value': None},
 }
 
+STRESSES_STRIPLOADCONSTANT_BOUSSINESQ_ERRORRETURN = {
+    'sigma_z [kPa]': np.nan,
+    'sigma_x [kPa]': np.nan,
+    'tau_zx [kPa]': np.nan,
+}
+
 @ValidationDecorator(STRESSES_STRIPLOADCONSTANT_BOUSSINESQ)
 def stresses_striploadconstant_boussinesq(strip_load, load_width, x, z, fail_silently=True, **kwargs):
     """
@@ -214,14 +415,7 @@ def stresses_striploadconstant_boussinesq(strip_load, load_width, x, z, fail_sil
         if not kwargs['validated']:
             raise ValueError("Error during function validation, %s" % kwargs['errorstring'])
 
-        beta = np.arctan((x - load_width) / z)
-        alpha = np.arctan(x / z) - beta
-
-        sigma_z = (strip_load/np.pi) * (alpha +
-                                        np.sin(alpha)*np.cos(alpha + 2.0*beta))
-        sigma_x = (strip_load / np.pi) * (alpha -
-                                          np.sin(alpha) * np.cos(alpha + 2.0 * beta))
-        tau_zx = (strip_load / np.pi) * (np.sin(alpha)*np.sin(alpha + 2.0*beta))
+        sigma_z, sigma_x, tau_zx = _stresses_striploadconstant_boussinesq_raw(strip_load, load_width, x, z)
 
         return {
             'sigma_z [kPa]': sigma_z,
@@ -229,16 +423,39 @@ def stresses_striploadconstant_boussinesq(strip_load, load_width, x, z, fail_sil
             'tau_zx [kPa]': tau_zx,
         }
 
-    except:
+    except (ValueError, TypeError, ArithmeticError):
         if fail_silently or fail_silently is None:
-            return {
-                'sigma_z [kPa]': np.nan,
-                'sigma_x [kPa]': np.nan,
-                'tau_zx [kPa]': np.nan,
-            }
+            return STRESSES_STRIPLOADCONSTANT_BOUSSINESQ_ERRORRETURN.copy()
         else:
             raise
 
+
+def _stresses_striploadtriangular_boussinesq_raw(strip_load_max, load_width, x, z):
+    """
+    Triangular strip load stresses without validation or error handling, see
+    ``stresses_striploadtriangular_boussinesq``. Returns the tuple (sigma_z, sigma_x, tau_zx).
+    """
+    # alpha = arctan(x/z) - arctan((x-B)/z) is evaluated with a single arctan2 and the double angle terms of
+    # beta = arctan((x-B)/z) follow from sin(2 beta) = 2 (x-B) z / R_2^2 and cos(2 beta) = (z^2 - (x-B)^2) / R_2^2
+    x_b = x - load_width
+    z_2 = z * z
+    r2_2 = x_b * x_b + z_2
+    alpha = np.arctan2(load_width * z, z_2 + x * x_b)
+    sin_2beta = 2.0 * x_b * z / r2_2
+    cos_2beta = (z_2 - x_b * x_b) / r2_2
+    # ln(R_1^2 / R_2^2) = ln(1 + (R_1^2 - R_2^2) / R_2^2) with R_1^2 - R_2^2 = B (2x - B) evaluated without
+    # cancellation, which keeps the term accurate far from the load where R_1 and R_2 are almost equal
+    log_r1_r2 = np.log1p(load_width * (2.0 * x - load_width) / r2_2)
+    factor = INV_PI * strip_load_max
+    sigma_z = factor * ((x/load_width)*alpha - 0.5*sin_2beta)
+    sigma_x = factor * ((x/load_width)*alpha -
+                        (z/load_width)*log_r1_r2 +
+                        0.5*sin_2beta)
+    tau_zx = 0.5 * factor * (1.0 + cos_2beta - (2.0*alpha*z/load_width))
+
+    return sigma_z, sigma_x, tau_zx
+
+
 STRESSES_STRIPLOADTRIANGULAR_BOUSSINESQ = {
     'strip_load_max': {'type': 'float', 'min_value': None, 'max_value': None},
     'load_width': {'type': 'float', 'min_value': 0.0, 'max_value': None},
@@ -246,6 +463,12 @@ STRESSES_STRIPLOADTRIANGULAR_BOUSSINESQ = {
     'z': {'type': 'float', 'min_value': None, 'max_value': None},
 }
 
+STRESSES_STRIPLOADTRIANGULAR_BOUSSINESQ_ERRORRETURN = {
+    'sigma_z [kPa]': np.nan,
+    'sigma_x [kPa]': np.nan,
+    'tau_zx [kPa]': np.nan,
+}
+
 @ValidationDecorator(STRESSES_STRIPLOADTRIANGULAR_BOUSSINESQ)
 def stresses_striploadtriangular_boussinesq(strip_load_max, load_width, x, z, fail_silently=True, **kwargs):
     """
@@ -283,15 +506,7 @@ def stresses_striploadtriangular_boussinesq(strip_load_max, load_width, x, z, fa
         if not kwargs['validated']:
             raise ValueError("Error during function validation, %s" % kwargs['errorstring'])
 
-        beta = np.arctan((x - load_width) / z)
-        alpha = np.arctan(x / z) - beta
-        r1 = np.sqrt(x**2.0 + z**2.0)
-        r2 = np.sqrt((x-load_width)**2.0 + z**2.0)
-        sigma_z = (strip_load_max/np.pi) * ((x/load_width)*alpha - 0.5*np.sin(2.0*beta))
-        sigma_x = (strip_load_max/np.pi) * ((x/load_width)*alpha -
-                                            (z/load_width)*np.log((r1**2.0)/(r2**2.0)) +
-                                            0.5*np.sin(2.0*beta))
-        tau_zx = (strip_load_max/(2.0 * np.pi)) * (1.0 + np.cos(2.0*beta) - (2.0*alpha*z/load_width))
+        sigma_z, sigma_x, tau_zx = _stresses_striploadtriangular_boussinesq_raw(strip_load_max, load_width, x, z)
 
         return {
             'sigma_z [kPa]': sigma_z,
@@ -299,17 +514,138 @@ def stresses_striploadtriangular_boussinesq(strip_load_max, load_width, x, z, fa
             'tau_zx [kPa]': tau_zx,
         }
 
-    except:
+    except (ValueError, TypeError, ArithmeticError):
         if fail_silently or fail_silently is None:
-            return {
-                'sigma_z [kPa]': np.nan,
-                'sigma_x [kPa]': np.nan,
-                'tau_zx [kPa]': np.nan,
-            }
+            return STRESSES_STRIPLOADTRIANGULAR_BOUSSINESQ_ERRORRETURN.copy()
         else:
             raise
 
 
+# Digitised chart for the vertical stress increase below a uniformly loaded circular area. The chart is stored in
+# circle_chart.json next to this module. Each curve contains the values of z/R and log10(sigma_z/q) for the
+# corresponding value of r/R in CIRCLE_CHART_R. The curve at the boundary between two r/R intervals is used by both
+# intervals and is therefore stored only once
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'circle_chart.json')) as _chart_file:
+    _circle_chart = json.load(_chart_file)
+CIRCLE_CHART_R = np.array(_circle_chart['r_dimless'])
+# Convert the curves once to read-only arrays
+CIRCLE_CHART_CURVES = tuple((np.array(_curve['z_dimless']), np.array(_curve['log10_multiplier']))
+                            for _curve in _circle_chart['curves'])
+for _curve in CIRCLE_CHART_CURVES:
+    _curve[0].flags.writeable = False
+    _curve[1].flags.writeable = False
+
+# The curves are resampled on a uniform z/R grid at import, a lookup then only requires an index calculation
+CIRCLE_CHART_Z_STEP = 0.005
+CIRCLE_CHART_Z_MAX = 15.0
+CIRCLE_CHART_Z = CIRCLE_CHART_Z_STEP * np.arange(int(round(CIRCLE_CHART_Z_MAX / CIRCLE_CHART_Z_STEP)) + 1)
+# Number of grid intervals per unit of z/R, the grid index of a depth is found without searching
+CIRCLE_CHART_Z_SCALE = 1.0 / CIRCLE_CHART_Z_STEP
+CIRCLE_CHART_Z_LAST_INTERVAL = CIRCLE_CHART_Z.size - 2
+# The digitised values have only a few significant digits, single precision is sufficient and halves the table size
+CIRCLE_CHART_LOGMULT = np.array([np.interp(CIRCLE_CHART_Z, z_values, logmult_values)
+                                 for z_values, logmult_values in CIRCLE_CHART_CURVES], dtype=np.float32)
+# Reciprocal width of each r/R interval, the interval is selected by searching CIRCLE_CHART_R
+CIRCLE_CHART_R_INV_WIDTH = 1.0 / np.diff(CIRCLE_CHART_R)
+# Plain Python copies of the interval tables for the scalar lookup
+CIRCLE_CHART_R_LIST = tuple(CIRCLE_CHART_R.tolist())
+CIRCLE_CHART_R_INV_WIDTH_LIST = tuple(CIRCLE_CHART_R_INV_WIDTH.tolist())
+# The tables are shared by all lookups and must not be modified
+CIRCLE_CHART_R.flags.writeable = False
+CIRCLE_CHART_R_INV_WIDTH.flags.writeable = False
+CIRCLE_CHART_LOGMULT.flags.writeable = False
+CIRCLE_CHART_LOGMULT_FLAT = CIRCLE_CHART_LOGMULT.ravel()
+
+
+def _circle_chart_blend(logmult_lower, logmult_upper, r_fraction):
+    """
+    Converts the logarithms interpolated on the two curves surrounding a point to stress ratios and interpolates
+    these linearly along r/R. The arrays with logarithms are overwritten.
+    """
+    logmult_lower = np.asarray(logmult_lower)
+    logmult_upper = np.asarray(logmult_upper)
+    # 10^x is evaluated as exp(ln(10) x), which uses the vectorised exponential of NumPy. All operations write
+    # into the arrays with logarithms, so no temporary arrays are allocated
+    mult_lower = np.exp(np.multiply(logmult_lower, LN10, out=logmult_lower), out=logmult_lower)
+    mult_upper = np.exp(np.multiply(logmult_upper, LN10, out=logmult_upper), out=logmult_upper)
+    mult_upper -= mult_lower
+    mult_upper *= r_fraction
+    mult_upper += mult_lower
+    # A scalar is returned for a single point
+    return mult_upper[()]
+
+
+def _circle_chart_lookup(r_dimless, z_dimless):
+    """
+    Returns the ratio :math:`\\sigma_z / q` from the circle chart for scalars or arrays of r/R and z/R.
+    The logarithm is interpolated linearly along z/R on the uniform grid, the resulting values on the
+    neighbouring curves are interpolated linearly along r/R. Points beyond the chart (z/R > 15 or r/R > 10) are
+    extrapolated linearly from the last interval, the calling functions exclude these points.
+    """
+    r_dimless = np.asarray(r_dimless, dtype=np.float64)
+    z_dimless = np.asarray(z_dimless, dtype=np.float64)
+    # Index of the curve at the lower end of the r/R interval, points on a curve belong to the interval below
+    curve = np.clip(np.searchsorted(CIRCLE_CHART_R, r_dimless, side='left') - 1, 0, CIRCLE_CHART_R.size - 2)
+    r_fraction = (r_dimless - CIRCLE_CHART_R[curve]) * CIRCLE_CHART_R_INV_WIDTH[curve]
+    position = z_dimless * CIRCLE_CHART_Z_SCALE
+    index = np.minimum(position.astype(np.intp), CIRCLE_CHART_Z.size - 2)
+    z_fraction = position - index
+    # The four table values surrounding each point are gathered from the flattened table, the values on the
+    # next curve are found a fixed stride further
+    flat_index = curve * CIRCLE_CHART_Z.size + index
+    logmult_lower = np.take(CIRCLE_CHART_LOGMULT_FLAT, flat_index)
+    logmult_lower = logmult_lower + z_fraction * (np.take(CIRCLE_CHART_LOGMULT_FLAT, flat_index + 1) - logmult_lower)
+    flat_index += CIRCLE_CHART_Z.size
+    logmult_upper = np.take(CIRCLE_CHART_LOGMULT_FLAT, flat_index)
+    logmult_upper = logmult_upper + z_fraction * (np.take(CIRCLE_CHART_LOGMULT_FLAT, flat_index + 1) - logmult_upper)
+    return _circle_chart_blend(logmult_lower, logmult_upper, r_fraction)
+
+
+@lru_cache(maxsize=8192)
+def _circle_chart_lookup_scalar(r_dimless, z_dimless):
+    """
+    Scalar version of ``_circle_chart_lookup`` which works on Python floats and avoids the creation of
+    temporary arrays for single points. As the chart is constant, results are cached for repeated queries.
+    """
+    curve = min(max(bisect_left(CIRCLE_CHART_R_LIST, r_dimless) - 1, 0), len(CIRCLE_CHART_R_LIST) - 2)
+    r_fraction = (r_dimless - CIRCLE_CHART_R_LIST[curve]) * CIRCLE_CHART_R_INV_WIDTH_LIST[curve]
+    position = z_dimless * CIRCLE_CHART_Z_SCALE
+    index = min(int(position), CIRCLE_CHART_Z_LAST_INTERVAL)
+    z_fraction = position - index
+    logmult_lower = CIRCLE_CHART_LOGMULT.item(curve, index)
+    logmult_lower += z_fraction * (CIRCLE_CHART_LOGMULT.item(curve, index + 1) - logmult_lower)
+    logmult_upper = CIRCLE_CHART_LOGMULT.item(curve + 1, index)
+    logmult_upper += z_fraction * (CIRCLE_CHART_LOGMULT.item(curve + 1, index + 1) - logmult_upper)
+    mult_lower = 10.0 ** logmult_lower
+    return mult_lower + r_fraction * (10.0 ** logmult_upper - mult_lower)
+
+
+def _stresses_circle_boussinesq_raw(circle_stress, circle_radius, z, radius, poisson_coefficient):
+    """
+    Circle load stresses without validation or error handling, see ``stresses_circle_boussinesq``.
+    The interpolation limits of the chart are not checked. Returns the tuple (sigma_z, sigma_r, sigma_theta).
+    """
+    if radius==0.0:
+        # (1 + (R/z)^2)^(-1/2) and (1 + (R/z)^2)^(-3/2) from a single square root
+        ratio = circle_radius / z
+        inv_s_05 = 1.0 / np.sqrt(1.0 + ratio * ratio)
+        inv_s_15 = inv_s_05 * inv_s_05 * inv_s_05
+        sigma_z = circle_stress * (1.0 - inv_s_15)
+        sigma_r = 0.5 * circle_stress * ((1.0 + 2.0 * poisson_coefficient) -
+                                         (4.0 * (1.0 + poisson_coefficient) * inv_s_05) +
+                                         inv_s_15)
+        sigma_theta = sigma_r
+    else:
+        sigma_r = np.nan
+        sigma_theta = np.nan
+        z_dimless = z/circle_radius
+        r_dimless = radius/circle_radius
+        mult = _circle_chart_lookup_scalar(r_dimless, z_dimless)
+        sigma_z = mult * circle_stress
+
+    return sigma_z, sigma_r, sigma_theta
+
+
 STRESSES_CIRCLE_BOUSSINESQ = {
     'circle_stress': {'type': 'float', 'min_value': None, 'max_value': None},
     'circle_radius': {'type': 'float', 'min_value': 0.0, 'max_value': None},
@@ -318,12 +654,18 @@ STRESSES_CIRCLE_BOUSSINESQ = {
     'poisson_coefficient': {'type': 'float', 'min_value': 0.0, 'max_value': 0.5},
 }
 
+STRESSES_CIRCLE_BOUSSINESQ_ERRORRETURN = {
+    'sigma_z [kPa]': np.nan,
+    'sigma_r [kPa]': np.nan,
+    'sigma_theta [kPa]': np.nan,
+}
+
 
 @ValidationDecorator(STRESSES_CIRCLE_BOUSSINESQ)
 def stresses_circle_boussinesq(circle_stress, circle_radius, z, radius=0.0, poisson_coefficient=0.3, fail_silently=True,
                                **kwargs):
     """
-    Calculates the increase in stress below a uniformy loaded circular area on elastic soil. For points below the center, a closed-form solution exists. For points off center, the vertical normal stress increase is obtained from a chart derived from finite element simulations.  The function does not return radial and tangential stresses for points off center. The interpolation is limited to :math:`z/R = 15` and :math:`r/R = 10`.
+    Calculates the increase in stress below a uniformy loaded circular area on elastic soil. For points below the center, a closed-form solution exists. For points off center, the vertical normal stress increase is obtained from a chart derived from finite element simulations.  The function does not return radial and tangential stresses for points off center. The interpolation is limited to :math:`z/R = 15` and :math:`r/R = 10`. Use ``stresses_circle_boussinesq_vec`` to evaluate the stresses for arrays of depths and radial distances in a single call.
 
     :param circle_stress: Uniform stress acting on the circular area (:math:`q`) [:math:`kPa`]
     :param circle_radius: Radius of the circle (:math:`R`) [:math:`m`]  - Suggested range: 0.0<=circle_radius
@@ -356,446 +698,11 @@ def stresses_circle_boussinesq(circle_stress, circle_radius, z, radius=0.0, pois
         if not kwargs['validated']:
             raise ValueError("Error during function validation, %s" % kwargs['errorstring'])
 
-        if radius==0.0:
-            sigma_z = circle_stress * (1.0 - ((1.0 / (1.0 + (circle_radius / z) ** 2.0)) ** 1.5))
-            sigma_r = 0.5 * circle_stress * ((1.0 + 2.0 * poisson_coefficient) -
-                                             ((4.0 * (1.0 + poisson_coefficient)) / (
-                                             (1.0 + (circle_radius / z) ** 2.0) ** 0.5)) +
-                                             (1.0 / ((1.0 + (circle_radius / z) ** 2.0) ** 1.5)))
-            sigma_theta = sigma_r
-        else:
-            sigma_r = np.nan
-            sigma_theta = np.nan
-            z_dimless = z/circle_radius
-            r_dimless = radius/circle_radius
-            if r_dimless > 10.0 or z_dimless > 15.0:
-                raise ValueError("Radius or depth coordinate outside interpolation limits")
-            if 0.0 < r_dimless <= 0.5:
-                mult_1 = 10.0**(np.interp(z_dimless,
-                                          [0.0, 0.457145182849504, 0.770761216026322, 1.11255869349144, 1.68192411831236,
-                                           2.25156801590293, 2.87835452582513, 3.70491740069232, 4.56049713815676,
-                                           5.67299585289783, 6.58605237001748, 7.6419654179662, 8.92639322068753,
-                                           10.6391678376803, 11.6099239126709, 12.7234251293827, 13.9226402645919,
-                                           14.9791102580799],
-                                          [0.0, -2.05641429894007E-04, -7.05221578640714E-02, -0.181787024025774,
-                                           -0.398417417829113, -0.585808170819483, -0.773224628988589,
-                                           -0.98412276793365, -1.14825033416732, -1.33588528635569, -1.46495098879254,
-                                           -1.59408095417623, -1.72916166843747, -1.8878268841896, -1.95843901017925,
-                                           -2.04081125544093, -2.12322205847071, -2.19387274222847]))
-                mult_2 = 10**(np.interp(z_dimless,
-                                        [0.0, 0.200003427357164, 0.827179799156869, 1.28264986119203, 1.73823131233505,
-                                         2.73549799499605, 3.33410306062994, 3.87584398670185, 4.53170305377523,
-                                         4.93103300544949, 5.44464818178702, 6.07232580457209, 6.87137556979812,
-                                         7.44213335846728, 8.46964218391198, 9.2117721150221, 9.95395774068615,
-                                         10.6104851424066, 11.438496075676, 12.86611457655, 13.6370385920416,
-                                         14.2366461596462, 14.9504275628063],
-                                        [0.0, -8.99681255790168E-05, -0.146570929156528, -0.322214415464236,
-                                         -0.486162045446757, -0.773160366041748, -0.919628474483328, -1.0368312369332,
-                                         -1.17162919422833, -1.24198426843061, -1.31239075299037, -1.40624036055797,
-                                         -1.50601501182438, -1.57644720156288, -1.68802052986942, -1.76437776330672,
-                                         -1.83488706858142, -1.89950988792542, -1.95836189464304, -2.05841930287555,
-                                         -2.11139767625184, -2.15260307776673, -2.20555574596429]))
-                mult = np.interp(r_dimless,[0.0,0.5],[mult_1,mult_2])
-            elif 0.5 < radius/circle_radius <= 1.0:
-                mult_1 = 10.0 ** (np.interp(z_dimless,
-                                            [0, 0.200003427357164, 0.827179799156869, 1.28264986119203,
-                                             1.73823131233505, 2.73549799499605, 3.33410306062994, 3.87584398670185,
-                                             4.53170305377523, 4.93103300544949, 5.44464818178702, 6.07232580457209,
-                                             6.87137556979812, 7.44213335846728, 8.46964218391198, 9.2117721150221,
-                                             9.95395774068615, 10.6104851424066, 11.438496075676, 12.86611457655,
-                                             13.6370385920416, 14.2366461596462, 14.9504275628063],
-                                            [0, -8.99681255790168E-05, -0.146570929156528, -0.322214415464236,
-                                             -0.486162045446757, -0.773160366041748, -0.919628474483328,
-                                             -1.0368312369332, -1.17162919422833, -1.24198426843061, -1.31239075299037,
-                                             -1.40624036055797, -1.50601501182438, -1.57644720156288, -1.68802052986942,
-                                             -1.76437776330672, -1.83488706858142, -1.89950988792542, -1.95836189464304,
-                                             -2.05841930287555, -2.11139767625184, -2.15260307776673, -2.20555574596429]
-                                            ))
-                mult_2 = 10 ** (np.interp(z_dimless,
-                                          [0, 0.596270178565308, 1.33773177502827, 1.96496384138191, 2.64911574185145,
-                                           3.27645919731295, 3.90385834732837, 4.55988449806354, 5.10190389690509,
-                                           5.78672413202179, 6.21473677896973, 7.21356290914076, 8.18398481680776,
-                                           9.24017633752613, 10.0679644925797, 10.8673484251293, 12.0379922541728,
-                                           13.0373753298831, 13.7797837337628, 14.4936208314768, 14.979054563526],
-                                          [-0.298257188881654, -0.392081091270522, -0.538613462658945,
-                                           -0.679246495527301, -0.843296946224767, -0.972234122767934,
-                                           -1.09532337114851, -1.21257754395586, -1.30054066559276, -1.3944159783391,
-                                           -1.45308804880557, -1.57634438084793, -1.68204407581314, -1.78193440038387,
-                                           -1.86417811975186, -1.92886520204271, -2.01126315248312, -2.07604020289954,
-                                           -2.12315779552387, -2.17026253555883, -2.19972067039106]
-                                          ))
-                mult = np.interp(r_dimless, [0.5, 1.0], [mult_1, mult_2])
-            elif 1.0 < radius / circle_radius <= 1.25:
-                mult_1 = 10.0 ** (np.interp(z_dimless,
-                                            [0, 0.596270178565308, 1.33773177502827, 1.96496384138191, 2.64911574185145,
-                                             3.27645919731295, 3.90385834732837, 4.55988449806354, 5.10190389690509,
-                                             5.78672413202179, 6.21473677896973, 7.21356290914076, 8.18398481680776,
-                                             9.24017633752613, 10.0679644925797, 10.8673484251293, 12.0379922541728,
-                                             13.0373753298831, 13.7797837337628, 14.4936208314768, 14.979054563526],
-                                            [-0.298257188881654, -0.392081091270522, -0.538613462658945,
-                                             -0.679246495527301, -0.843296946224767, -0.972234122767934,
-                                             -1.09532337114851, -1.21257754395586, -1.30054066559276, -1.3944159783391,
-                                             -1.45308804880557, -1.57634438084793, -1.68204407581314, -1.78193440038387,
-                                             -1.86417811975186, -1.92886520204271, -2.01126315248312, -2.07604020289954,
-                                             -2.12315779552387, -2.17026253555883, -2.19972067039106]
-                                            ))
-                mult_2 = 10 ** (np.interp(z_dimless,
-                                          [3.79879699763512E-02, 0.126765088939918, 0.214651095040614,
-                                           0.447677108681495, 0.706879562669225, 0.879087123419131, 1.19353857490489,
-                                           1.56463138773691, 1.99247695102306, 2.30626006786167, 2.9051436062652,
-                                           3.36150478116324, 3.87495287383898, 4.38845666106865, 4.84492922507454,
-                                           5.55826507180313, 6.35725914247523, 7.21334013092504, 8.29793587414744,
-                                           9.15446241902868, 9.8965923501388, 10.5532311409672, 11.6667880522329,
-                                           12.4377120677245, 13.1229778592727, 14.0081870994276, 14.979054563526],
-                                          [-2.01171299311101, -1.69011550193646, -1.4620848613634, -0.994353429070844,
-                                           -0.778095760359188, -0.696301881619084, -0.678899475614355,
-                                           -0.714154128251706, -0.790369983205952, -0.843142715152349,
-                                           -0.960371182780961, -1.04244781848716, -1.1303980875347, -1.21250042841965,
-                                           -1.28288120780067, -1.38261730129897, -1.48823988072797, -1.5997360934983,
-                                           -1.71718305514618, -1.78189584261576, -1.85825307605306, -1.91118003907187,
-                                           -1.98770435617096, -2.04068272954725, -2.08777461699284, -2.1408044007266,
-                                           -2.19972067039106]
-                                          ))
-                mult = np.interp(r_dimless, [1.0, 1.25], [mult_1, mult_2])
-            elif 1.25 < radius / circle_radius <= 1.5:
-                mult_1 = 10.0 ** (np.interp(z_dimless,
-                                            [3.79879699763512E-02, 0.126765088939918, 0.214651095040614,
-                                             0.447677108681495, 0.706879562669225, 0.879087123419131, 1.19353857490489,
-                                             1.56463138773691, 1.99247695102306, 2.30626006786167, 2.9051436062652,
-                                             3.36150478116324, 3.87495287383898, 4.38845666106865, 4.84492922507454,
-                                             5.55826507180313, 6.35725914247523, 7.21334013092504, 8.29793587414744,
-                                             9.15446241902868, 9.8965923501388, 10.5532311409672, 11.6667880522329,
-                                             12.4377120677245, 13.1229778592727, 14.0081870994276, 14.979054563526],
-                                            [-2.01171299311101, -1.69011550193646, -1.4620848613634, -0.994353429070844,
-                                             -0.778095760359188, -0.696301881619084, -0.678899475614355,
-                                             -0.714154128251706, -0.790369983205952, -0.843142715152349,
-                                             -0.960371182780961, -1.04244781848716, -1.1303980875347, -1.21250042841965,
-                                             -1.28288120780067, -1.38261730129897, -1.48823988072797, -1.5997360934983,
-                                             -1.71718305514618, -1.78189584261576, -1.85825307605306, -1.91118003907187,
-                                             -1.98770435617096, -2.04068272954725, -2.08777461699284, -2.1408044007266,
-                                             -2.19972067039106]
-                                            ))
-                mult_2 = 10 ** (np.interp(z_dimless,
-                                          [1.71367858244453E-04, 0.119023545943722, 0.179062275079686,
-                                           0.210028447064468, 0.29830431504267, 0.444224046337868, 0.588807108338759,
-                                           0.876525173938376, 1.0771369571923, 1.39164410323199, 1.79164238955341,
-                                           2.27674195427905, 2.76178582445076, 3.16122716523288, 3.67478664701648,
-                                           4.24543304657778, 4.81607944613908, 5.3296946224766, 5.90039671659183,
-                                           6.41406758748329, 6.89922284676286, 7.61283716626109, 8.35502279192514,
-                                           8.92594766425609, 9.55401514891867, 10.039281797306, 10.5246598348013,
-                                           11.3240994619049, 11.8951914178976, 12.4662276793364, 13.5227533673784,
-                                           14.293733077424, 14.979054563526],
-                                          [-2.98245621551222, -2.502977516537, -2.19891095726086, -1.94746289885869,
-                                           -1.67849676114748, -1.35692497515166, -1.17570346505809, -0.965306577098402,
-                                           -0.901069335435448, -0.877819001268123, -0.87799893751928,
-                                           -0.942544641327074, -1.01293827329746, -1.07159749117455, -1.1478519038969,
-                                           -1.22997994996059, -1.31210799602427, -1.38251448058402, -1.45879459848511,
-                                           -1.52335315488227, -1.58205093052747, -1.65254738321281, -1.72305668848751,
-                                           -1.77594509373822, -1.82885920416767, -1.87586112348768, -1.91116718648251,
-                                           -1.97000634061076, -2.00535096137368, -2.04654351029921, -2.11134626589437,
-                                           -2.15847671110806, -2.19972067039106]
-                                          ))
-                mult = np.interp(r_dimless, [1.25, 1.5], [mult_1, mult_2])
-            elif 1.5 < radius / circle_radius <= 2.0:
-                mult_1 = 10.0 ** (np.interp(z_dimless,
-                                            [1.71367858244453E-04, 0.119023545943722, 0.179062275079686,
-                                             0.210028447064468, 0.29830431504267, 0.444224046337868, 0.588807108338759,
-                                             0.876525173938376, 1.0771369571923, 1.39164410323199, 1.79164238955341,
-                                             2.27674195427905, 2.76178582445076, 3.16122716523288, 3.67478664701648,
-                                             4.24543304657778, 4.81607944613908, 5.3296946224766, 5.90039671659183,
-                                             6.41406758748329, 6.89922284676286, 7.61283716626109, 8.35502279192514,
-                                             8.92594766425609, 9.55401514891867, 10.039281797306, 10.5246598348013,
-                                             11.3240994619049, 11.8951914178976, 12.4662276793364, 13.5227533673784,
-                                             14.293733077424, 14.979054563526],
-                                            [-2.98245621551222, -2.502977516537, -2.19891095726086, -1.94746289885869,
-                                             -1.67849676114748, -1.35692497515166, -1.17570346505809,
-                                             -0.965306577098402, -0.901069335435448, -0.877819001268123,
-                                             -0.87799893751928, -0.942544641327074, -1.01293827329746,
-                                             -1.07159749117455, -1.1478519038969, -1.22997994996059, -1.31210799602427,
-                                             -1.38251448058402, -1.45879459848511, -1.52335315488227, -1.58205093052747,
-                                             -1.65254738321281, -1.72305668848751, -1.77594509373822, -1.82885920416767,
-                                             -1.87586112348768, -1.91116718648251, -1.97000634061076, -2.00535096137368,
-                                             -2.04654351029921, -2.11134626589437, -2.15847671110806, -2.19972067039106]
-                                            ))
-                mult_2 = 10 ** (np.interp(z_dimless,
-                                          [0.171487815745278, 0.17343712513281, 0.232361963190184, 0.349710388319566,
-                                           0.437262227096685, 0.524646982212016, 0.611530486341981, 0.755946464681084,
-                                           0.928710970970284, 1.18730078486479, 1.64577835281214, 2.18902303184014,
-                                           2.8174246838263, 3.33131833293347, 3.95927442848819, 4.58717482948898,
-                                           5.10090139493436, 5.72880179593515, 6.24252836138054, 6.87042876238132,
-                                           7.41278232854645, 8.0978810364328, 8.69737721492956, 9.38253161736984,
-                                           10.7529518113582, 11.6380496624053, 12.6374327381156, 13.3227542242177,
-                                           14.1793921582068, 14.9789988689721],
-                                          [-2.99422918737362, -2.78955170168283, -2.60244370565857, -2.28085906707338,
-                                           -2.08791599547589, -1.91251670836618, -1.78974877471981, -1.62607104911403,
-                                           -1.48579788874799, -1.33386742982486, -1.1937227953525, -1.15303149741235,
-                                           -1.17085803886623, -1.21202488261302, -1.27663484936765, -1.34709274428488,
-                                           -1.40580337251945, -1.47626126743668, -1.53497189567125, -1.60542979058848,
-                                           -1.65830534324982, -1.72294101518319, -1.77584227302327, -1.83463001679405,
-                                           -1.94050964801042, -2.00523528806937, -2.07001233848579, -2.11125629776879,
-                                           -2.16427322891319, -2.20556859855366]
-                                          ))
-                mult = np.interp(r_dimless, [1.5, 2.0], [mult_1, mult_2])
-            elif 2.0 < radius / circle_radius <= 2.5:
-                mult_1 = 10.0 ** (np.interp(z_dimless,
-                                            [0.171487815745278, 0.17343712513281, 0.232361963190184, 0.349710388319566,
-                                             0.437262227096685, 0.524646982212016, 0.611530486341981, 0.755946464681084,
-                                             0.928710970970284, 1.18730078486479, 1.64577835281214, 2.18902303184014,
-                                             2.8174246838263, 3.33131833293347, 3.95927442848819, 4.58717482948898,
-                                             5.10090139493436, 5.72880179593515, 6.24252836138054, 6.87042876238132,
-                                             7.41278232854645, 8.0978810364328, 8.69737721492956, 9.38253161736984,
-                                             10.7529518113582, 11.6380496624053, 12.6374327381156, 13.3227542242177,
-                                             14.1793921582068, 14.9789988689721],
-                                            [-2.99422918737362, -2.78955170168283, -2.60244370565857, -2.28085906707338,
-                                             -2.08791599547589, -1.91251670836618, -1.78974877471981, -1.62607104911403,
-                                             -1.48579788874799, -1.33386742982486, -1.1937227953525, -1.15303149741235,
-                                             -1.17085803886623, -1.21202488261302, -1.27663484936765, -1.34709274428488,
-                                             -1.40580337251945, -1.47626126743668, -1.53497189567125, -1.60542979058848,
-                                             -1.65830534324982, -1.72294101518319, -1.77584227302327, -1.83463001679405,
-                                             -1.94050964801042, -2.00523528806937, -2.07001233848579, -2.11125629776879,
-                                             -2.16427322891319, -2.20556859855366]
-                                            ))
-                mult_2 = 10 ** (np.interp(z_dimless,
-                                          [0.314288652020427, 0.343918154710902, 0.402731603660417, 0.461433663502073,
-                                           0.519912945128011, 0.57833653220002, 0.751992151352092, 0.867502656201802,
-                                           1.15488655447784, 1.44221475819995, 1.814867018542, 2.41553278267128,
-                                           3.04421290742708, 3.84387531274634, 4.64331493984988, 5.44264317784556,
-                                           6.09928196867395, 6.72723806422867, 7.32678993727936, 8.38309284710559,
-                                           9.43945145148575, 10.2388353840353, 10.8384429516399, 11.4665661308564,
-                                           12.4945205127326, 13.3512141412756, 14.3505972169859, 14.9788874798642],
-                                          [-3.00014137848305, -2.88904359598314, -2.71363145628406, -2.54991517291017,
-                                           -2.40959060218665, -2.27511395962573, -2.04127394865819, -1.9126709394386,
-                                           -1.73736162045447, -1.56790022963293, -1.43941289371765, -1.36950766014326,
-                                           -1.35809456078418, -1.39354200226206, -1.45238115639031, -1.52291616684375,
-                                           -1.57584312986256, -1.6404530966172, -1.68750642629468, -1.77570089454022,
-                                           -1.85804743462316, -1.92273451691401, -1.9639399184289, -2.01100610069575,
-                                           -2.07579600370155, -2.12296500668335, -2.18774205709977, -2.21726445487884]))
-                mult = np.interp(r_dimless, [2.0, 2.5], [mult_1, mult_2])
-            elif 2.5 < radius / circle_radius <= 3.0:
-                mult_1 = 10.0 ** (np.interp(z_dimless,
-                                            [0.314288652020427, 0.343918154710902, 0.402731603660417, 0.461433663502073,
-                                             0.519912945128011, 0.57833653220002, 0.751992151352092, 0.867502656201802,
-                                             1.15488655447784, 1.44221475819995, 1.814867018542, 2.41553278267128,
-                                             3.04421290742708, 3.84387531274634, 4.64331493984988, 5.44264317784556,
-                                             6.09928196867395, 6.72723806422867, 7.32678993727936, 8.38309284710559,
-                                             9.43945145148575, 10.2388353840353, 10.8384429516399, 11.4665661308564,
-                                             12.4945205127326, 13.3512141412756, 14.3505972169859, 14.9788874798642],
-                                            [-3.00014137848305, -2.88904359598314, -2.71363145628406, -2.54991517291017,
-                                             -2.40959060218665, -2.27511395962573, -2.04127394865819, -1.9126709394386,
-                                             -1.73736162045447, -1.56790022963293, -1.43941289371765, -1.36950766014326,
-                                             -1.35809456078418, -1.39354200226206, -1.45238115639031, -1.52291616684375,
-                                             -1.57584312986256, -1.6404530966172, -1.68750642629468, -1.77570089454022,
-                                             -1.85804743462316, -1.92273451691401, -1.9639399184289, -2.01100610069575,
-                                             -2.07579600370155, -2.12296500668335, -2.18774205709977, -2.21726445487884]
-                                            ))
-                mult_2 = 10 ** (np.interp(z_dimless,
-                                          [0.457145182849504, 0.602897830482914, 0.71890958631799, 0.863325564657092,
-                                           1.03653562737772, 1.23803852349453, 1.46794564211536, 1.72614559413236,
-                                           1.98412276793364, 2.384956472564, 2.95688384686568, 3.67133358467285,
-                                           4.24270401343524, 5.21357147753367, 5.75603643280666, 6.38415961202316,
-                                           7.55474774651266, 8.4112742913939, 9.21071391849744, 9.78169448538232,
-                                           10.5811898070397, 11.1808530691983, 12.2088074510744, 13.0655010796175,
-                                           14.4075727456558, 14.9786647016485],
-                                          [-3.00020564142989, -2.69617763992186, -2.51494327723892, -2.35126555163314,
-                                           -2.16420896596634, -2.00640487370189, -1.86615741851458, -1.75516245672962,
-                                           -1.66755920759503, -1.58002022140727, -1.5276459197313, -1.51042344997772,
-                                           -1.51652842992768, -1.57544469959214, -1.6166243959283, -1.66369057819515,
-                                           -1.75193645679816, -1.81664924426775, -1.875488398396, -1.92252887548412,
-                                           -1.97552010144977, -2.01087757480207, -2.07566747780786, -2.12283648078966,
-                                           -2.20531154676629, -2.24065616752922]
-                                          ))
-                mult = np.interp(r_dimless, [2.5, 3.0], [mult_1, mult_2])
-            elif 3.0 < radius / circle_radius <= 4.0:
-                mult_1 = 10.0 ** (np.interp(z_dimless,
-                                            [0.457145182849504, 0.602897830482914, 0.71890958631799, 0.863325564657092,
-                                             1.03653562737772, 1.23803852349453, 1.46794564211536, 1.72614559413236,
-                                             1.98412276793364, 2.384956472564, 2.95688384686568, 3.67133358467285,
-                                             4.24270401343524, 5.21357147753367, 5.75603643280666, 6.38415961202316,
-                                             7.55474774651266, 8.4112742913939, 9.21071391849744, 9.78169448538232,
-                                             10.5811898070397, 11.1808530691983, 12.2088074510744, 13.0655010796175,
-                                             14.4075727456558, 14.9786647016485],
-                                            [-3.00020564142989, -2.69617763992186, -2.51494327723892, -2.35126555163314,
-                                             -2.16420896596634, -2.00640487370189, -1.86615741851458, -1.75516245672962,
-                                             -1.66755920759503, -1.58002022140727, -1.5276459197313, -1.51042344997772,
-                                             -1.51652842992768, -1.57544469959214, -1.6166243959283, -1.66369057819515,
-                                             -1.75193645679816, -1.81664924426775, -1.875488398396, -1.92252887548412,
-                                             -1.97552010144977, -2.01087757480207, -2.07566747780786, -2.12283648078966,
-                                             -2.20531154676629, -2.24065616752922]
-                                            ))
-                mult_2 = 10 ** (np.interp(z_dimless,
-                                          [0.80000085683929, 0.886940055523186, 1.0886657298557, 1.26154162525276,
-                                           1.52040991191692, 1.75020564142989, 2.03703259416663, 2.55276416355348,
-                                           3.03936748123521, 3.69723155225006, 4.44030829077698, 5.12601963875655,
-                                           5.69739006751893, 6.52567947355794, 7.32534187887719, 8.18214689652808,
-                                           9.1815299722384, 10.1523417417829, 11.8371576927031, 12.5509947904171,
-                                           13.5504892552352, 14.4071828837783, 15.0069018404907],
-                                          [-3.00035987250231, -2.87174401069336, -2.69054820577852, -2.5385791890873,
-                                           -2.3574090893512, -2.22885749048908, -2.11202745313089, -1.96021266751208,
-                                           -1.86686431092984, -1.79113685437159, -1.7680793090448, -1.76838777118964,
-                                           -1.7744927511396, -1.80410511704425, -1.83955255852212, -1.87502570517874,
-                                           -1.93980275559516, -2.00456695342222, -2.09889210679645, -2.14599684683141,
-                                           -2.19907804092264, -2.24624704390445, -2.27575658909415]
-                                          ))
-                mult = np.interp(r_dimless, [3.0, 4.0], [mult_1, mult_2])
-            elif 4.0 < radius / circle_radius <= 5.0:
-                mult_1 = 10.0 ** (np.interp(z_dimless,
-                                            [0.80000085683929, 0.886940055523186, 1.0886657298557, 1.26154162525276,
-                                             1.52040991191692, 1.75020564142989, 2.03703259416663, 2.55276416355348,
-                                             3.03936748123521, 3.69723155225006, 4.44030829077698, 5.12601963875655,
-                                             5.69739006751893, 6.52567947355794, 7.32534187887719, 8.18214689652808,
-                                             9.1815299722384, 10.1523417417829, 11.8371576927031, 12.5509947904171,
-                                             13.5504892552352, 14.4071828837783, 15.0069018404907],
-                                            [-3.00035987250231, -2.87174401069336, -2.69054820577852, -2.5385791890873,
-                                             -2.3574090893512, -2.22885749048908, -2.11202745313089, -1.96021266751208,
-                                             -1.86686431092984, -1.79113685437159, -1.7680793090448, -1.76838777118964,
-                                             -1.7744927511396, -1.80410511704425, -1.83955255852212, -1.87502570517874,
-                                             -1.93980275559516, -2.00456695342222, -2.09889210679645, -2.14599684683141,
-                                             -2.19907804092264, -2.24624704390445, -2.27575658909415]
-                                            ))
-                mult_2 = 10 ** (np.interp(z_dimless,
-                                          [1.22857044932652, 1.43012903999725, 1.66009185317201, 1.97582427939815,
-                                           2.29144531651643, 2.57821657469924, 3.03641566987695, 3.58010590533639,
-                                           4.29511258868286, 5.0096737155979, 5.66698084107344, 6.38126349521883,
-                                           7.00977653631284, 7.83812163690578, 8.92355279843712, 9.72315950920245,
-                                           10.4943063029098, 11.4367695445042, 12.4363197038763, 13.4644968639681,
-                                           14.3498174932309, 14.9780520615553],
-                                          [-3.00055266134284, -2.83690064091579, -2.69080525756589, -2.5389005038215,
-                                           -2.3986916064023, -2.2877094972067, -2.17680450354731, -2.08932978030641,
-                                           -2.01362802892689, -1.98470970284813, -1.96746152791582, -1.96778284265003,
-                                           -1.97391352777873, -1.99767796552079, -2.02740600472975, -2.06870137437022,
-                                           -2.09828803509614, -2.13964766768345, -2.18688093361209, -2.22827912396751,
-                                           -2.26961305137608, -2.30498337731775]
-                                          ))
-                mult = np.interp(r_dimless, [4.0, 5.0], [mult_1, mult_2])
-            elif 5.0 < radius / circle_radius <= 6.0:
-                mult_1 = 10.0 ** (np.interp(z_dimless,
-                                            [1.22857044932652, 1.43012903999725, 1.66009185317201, 1.97582427939815,
-                                             2.29144531651643, 2.57821657469924, 3.03641566987695, 3.58010590533639,
-                                             4.29511258868286, 5.0096737155979, 5.66698084107344, 6.38126349521883,
-                                             7.00977653631284, 7.83812163690578, 8.92355279843712, 9.72315950920245,
-                                             10.4943063029098, 11.4367695445042, 12.4363197038763, 13.4644968639681,
-                                             14.3498174932309, 14.9780520615553],
-                                            [-3.00055266134284, -2.83690064091579, -2.69080525756589, -2.5389005038215,
-                                             -2.3986916064023, -2.2877094972067, -2.17680450354731, -2.08932978030641,
-                                             -2.01362802892689, -1.98470970284813, -1.96746152791582, -1.96778284265003,
-                                             -1.97391352777873, -1.99767796552079, -2.02740600472975, -2.06870137437022,
-                                             -2.09828803509614, -2.13964766768345, -2.18688093361209, -2.22827912396751,
-                                             -2.26961305137608, -2.30498337731775]
-                                            ))
-                mult_2 = 10 ** (np.interp(z_dimless,
-                                          [1.79999657264283, 2.03007077492545, 2.28838211605031, 2.68982846077389,
-                                           3.20539294649895, 3.77787726633992, 4.40728142029681, 5.20789063303286,
-                                           5.86530914761627, 6.63701288686294, 7.35129554100832, 8.06552250059978,
-                                           8.86546337868869, 9.97941015183192, 10.8077552524248, 11.8931307194022,
-                                           12.8356496555506, 14.0637145696953, 15.0061221167357],
-                                          [-3.0008097131302, -2.84301847345512, -2.72032765534496, -2.56846145936868,
-                                           -2.43419045823765, -2.32333687493574, -2.23590070946293, -2.17193337217671,
-                                           -2.14298934091922, -2.11409672001919, -2.1144180347534, -2.1205872776502,
-                                           -2.12679507831511, -2.16238389827604, -2.1861483360181, -2.22172430338966,
-                                           -2.25723600781437, -2.31042002262056, -2.35762758337046]
-                                          ))
-                mult = np.interp(r_dimless, [5.0, 6.0], [mult_1, mult_2])
-            elif 6.0 < radius / circle_radius <= 7.0:
-                mult_1 = 10.0 ** (np.interp(z_dimless,
-                                            [1.79999657264283, 2.03007077492545, 2.28838211605031, 2.68982846077389,
-                                             3.20539294649895, 3.77787726633992, 4.40728142029681, 5.20789063303286,
-                                             5.86530914761627, 6.63701288686294, 7.35129554100832, 8.06552250059978,
-                                             8.86546337868869, 9.97941015183192, 10.8077552524248, 11.8931307194022,
-                                             12.8356496555506, 14.0637145696953, 15.0061221167357],
-                                            [-3.0008097131302, -2.84301847345512, -2.72032765534496, -2.56846145936868,
-                                             -2.43419045823765, -2.32333687493574, -2.23590070946293, -2.17193337217671,
-                                             -2.14298934091922, -2.11409672001919, -2.1144180347534, -2.1205872776502,
-                                             -2.12679507831511, -2.16238389827604, -2.1861483360181, -2.22172430338966,
-                                             -2.25723600781437, -2.31042002262056, -2.35762758337046]
-                                            ))
-                mult_2 = 10 ** (np.interp(z_dimless,
-                                          [2.37142269595914, 2.62984542619186, 2.85925129382732, 3.28887908283922,
-                                           3.77553809507488, 4.34785533125407, 4.92000548377146, 5.52061555334681,
-                                           6.37814460019878, 7.14984833944545, 7.95001199575007, 8.63572334372965,
-                                           9.40709291565274, 11.4065830962744, 12.4634986461939, 13.7202462556122,
-                                           14.9769938650306],
-                                          [-3.00106676491757, -2.86668009048223, -2.77906398875827, -2.66814614250951,
-                                           -2.56894985776468, -2.47564005895054, -2.39987404462419, -2.33581673921239,
-                                           -2.29526681975529, -2.26637419885526, -2.24919028686979, -2.24949874901463,
-                                           -2.25569369709017, -2.3092247318093, -2.33309199026631, -2.37459300133667,
-                                           -2.41609401240703]
-                                          ))
-                mult = np.interp(r_dimless, [6.0, 7.0], [mult_1, mult_2])
-            elif 7.0 < radius / circle_radius <= 8.0:
-                mult_1 = 10.0 ** (np.interp(z_dimless,
-                                            [2.37142269595914, 2.62984542619186, 2.85925129382732, 3.28887908283922,
-                                             3.77553809507488, 4.34785533125407, 4.92000548377146, 5.52061555334681,
-                                             6.37814460019878, 7.14984833944545, 7.95001199575007, 8.63572334372965,
-                                             9.40709291565274, 11.4065830962744, 12.4634986461939, 13.7202462556122,
-                                             14.9769938650306],
-                                            [-3.00106676491757, -2.86668009048223, -2.77906398875827, -2.66814614250951,
-                                             -2.56894985776468, -2.47564005895054, -2.39987404462419, -2.33581673921239,
-                                             -2.29526681975529, -2.26637419885526, -2.24919028686979, -2.24949874901463,
-                                             -2.25569369709017, -2.3092247318093, -2.33309199026631, -2.37459300133667,
-                                             -2.41609401240703]
-                                            ))
-                mult_2 = 10 ** (np.interp(z_dimless,
-                                          [3.25713318709942, 3.54412722349796, 4.00243770778352, 4.71800133666929,
-                                           5.26146879391301, 5.97641978270555, 6.63394968639682, 7.23428128320252,
-                                           7.86296140795832, 8.69169637042876, 9.52037563834527, 10.2918009048222,
-                                           11.0917417829111, 11.8630556602803, 13.0057408232511, 13.7484276999006,
-                                           14.4054006580525, 14.9765483085992],
-                                          [-3.00146519518799, -2.86709137334202, -2.74449052335744, -2.61030949035199,
-                                           -2.54622647976146, -2.47637265654454, -2.43573276896185, -2.40091510436303,
-                                           -2.38950200500394, -2.37233094560784, -2.36100781437434, -2.36135483428728,
-                                           -2.36756263495219, -2.37960551119032, -2.39766339925284, -2.41554135106419,
-                                           -2.43338074510745, -2.46287743770778]
-                                          ))
-                mult = np.interp(r_dimless, [7.0, 8.0], [mult_1, mult_2])
-            elif 8.0 < radius / circle_radius <= 9.0:
-                mult_1 = 10.0 ** (np.interp(z_dimless,
-                                            [3.25713318709942, 3.54412722349796, 4.00243770778352, 4.71800133666929,
-                                             5.26146879391301, 5.97641978270555, 6.63394968639682, 7.23428128320252,
-                                             7.86296140795832, 8.69169637042876, 9.52037563834527, 10.2918009048222,
-                                             11.0917417829111, 11.8630556602803, 13.0057408232511, 13.7484276999006,
-                                             14.4054006580525, 14.9765483085992],
-                                            [-3.00146519518799, -2.86709137334202, -2.74449052335744, -2.61030949035199,
-                                             -2.54622647976146, -2.47637265654454, -2.43573276896185, -2.40091510436303,
-                                             -2.38950200500394, -2.37233094560784, -2.36100781437434, -2.36135483428728,
-                                             -2.36756263495219, -2.37960551119032, -2.39766339925284, -2.41554135106419,
-                                             -2.43338074510745, -2.46287743770778]
-                                            ))
-                mult_2 = 10 ** (np.interp(z_dimless,
-                                          [3.82855931041573, 4.31544110086712, 4.85924272543441, 5.43139287795181,
-                                           6.0606299482469, 6.74689824176577, 7.46157075778867, 8.26190149775508,
-                                           8.86206601089899, 9.66222966720362, 10.4337106282345, 11.433762038592,
-                                           12.2337029166809, 13.176444631045, 14.0047897316379, 14.9759913630599],
-                                          [-3.00172224697536, -2.87913424958015, -2.77996367001405, -2.7041976556877,
-                                           -2.63430527470268, -2.57613445522158, -2.53552027281763, -2.50079257634438,
-                                           -2.48351869623333, -2.46633478424787, -2.46083387599822, -2.45543578846352,
-                                           -2.46164358912842, -2.47376358090277, -2.49752801864482, -2.52135671933372]
-
-                                          ))
-                mult = np.interp(r_dimless, [8.0, 9.0], [mult_1, mult_2])
-            elif 9.0 < radius / circle_radius <= 10.0:
-                mult_1 = 10.0 ** (np.interp(z_dimless,
-                                            [3.82855931041573, 4.31544110086712, 4.85924272543441, 5.43139287795181,
-                                             6.0606299482469, 6.74689824176577, 7.46157075778867, 8.26190149775508,
-                                             8.86206601089899, 9.66222966720362, 10.4337106282345, 11.433762038592,
-                                             12.2337029166809, 13.176444631045, 14.0047897316379, 14.9759913630599],
-                                            [-3.00172224697536, -2.87913424958015, -2.77996367001405, -2.7041976556877,
-                                             -2.63430527470268, -2.57613445522158, -2.53552027281763, -2.50079257634438,
-                                             -2.48351869623333, -2.46633478424787, -2.46083387599822, -2.45543578846352,
-                                             -2.46164358912842, -2.47376358090277, -2.49752801864482, -2.52135671933372]
-                                            ))
-                mult_2 = 10 ** (np.interp(z_dimless,
-                                          [4.77141241388765, 5.20081742468382, 5.74445196558933, 6.23072111594749,
-                                           7.00281471707166, 7.71748723309456, 8.74661120060321, 9.4325453267985,
-                                           10.1184237584398, 11.0328169448538, 11.7185839873873, 12.9186345409055,
-                                           13.804177948384, 14.5754918257531, 14.9753787229667],
-                                          [-3.00214638242451, -2.91462024882613, -2.83299345374782, -2.77473266614114,
-                                           -2.70490454810296, -2.66429036569901, -2.60627377729033, -2.5831905267848,
-                                           -2.56595520444186, -2.55467063097645, -2.5491311649587, -2.54382304554958,
-                                           -2.56176526030778, -2.57380813654591, -2.58568392912225]
-                                          ))
-                mult = np.interp(r_dimless, [9.0, 10.0], [mult_1, mult_2])
-
-            sigma_z = mult * circle_stress
+        if radius != 0.0 and (radius > 10.0 * circle_radius or z > 15.0 * circle_radius):
+            raise ValueError("Radius or depth coordinate outside interpolation limits")
+
+        sigma_z, sigma_r, sigma_theta = _stresses_circle_boussinesq_raw(
+            circle_stress, circle_radius, z, radius, poisson_coefficient)
 
         return {
             'sigma_z [kPa]': sigma_z,
@@ -803,16 +710,219 @@ def stresses_circle_boussinesq(circle_stress, circle_radius, z, radius=0.0, pois
             'sigma_theta [kPa]': sigma_theta,
         }
 
-    except:
+    except (ValueError, TypeError, ArithmeticError):
         if fail_silently or fail_silently is None:
-            return {
-                'sigma_z [kPa]': np.nan,
-                'sigma_r [kPa]': np.nan,
-                'sigma_theta [kPa]': np.nan,
-            }
+            return STRESSES_CIRCLE_BOUSSINESQ_ERRORRETURN.copy()
         else:
             raise
 
+
+# Number of off-center points above which stresses_circle_boussinesq_vec distributes the chart lookup over threads,
+# smaller lookups do not make up for the overhead of the threads
+CIRCLE_BLOCK_SIZE = 4096
+
+
+def stresses_circle_boussinesq_vec(circle_stress, circle_radius, z, radius=0.0, poisson_coefficient=0.3,
+                                   dtype=np.float64, workers=1):
+    """
+    Vectorised version of ``stresses_circle_boussinesq``. The coordinates ``z`` and ``radius`` can be NumPy arrays (or anything which can be converted to a float array) and are broadcast against each other. Points below the center and off center are separated with boolean masks, so the closed-form solution and the chart lookup are each evaluated once for all points concerned instead of branching per point. For a depth profile at a fixed radial distance, ``stresses_circle_boussinesq_profile`` avoids repeating the r/R lookup of the chart on every call.
+
+    Off-center points outside the interpolation limits of the chart (:math:`z/R > 15` or :math:`r/R > 10`) return ``nan`` instead of raising an error, as do the radial and tangential stresses for all off-center points.
+
+    Since the tangential stress equals the radial stress, ``sigma_theta`` is returned as a read-only view on the ``sigma_r`` array rather than as a copy. Changes made to ``sigma_r`` by the caller are therefore also visible in ``sigma_theta``, use ``sigma_r.copy()`` where independent arrays are needed.
+
+    :param circle_stress: Uniform stress acting on the circular area (:math:`q`) [:math:`kPa`]
+    :param circle_radius: Radius of the circle (:math:`R`) [:math:`m`]  - Suggested range: 0.0<=circle_radius
+    :param z: Array with z-coordinates of the points where stresses are calculated (:math:`z`) [:math:`m`]  - Suggested range: 0.0<=z
+    :param radius: Array with radial distances from circle center to the points where stresses are calculated (:math:`r`) [:math:`m`] (optional, default=0.0) - Suggested range: 0.0<=radius
+    :param poisson_coefficient: Poisson's coefficient (:math:`\\nu`) [:math:`-`] (optional, default=0.3) - Suggested range: 0.0<=poisson_coefficient<=0.5
+    :param dtype: Floating point type used for the calculation and the output (optional, default=np.float64)
+    :param workers: Number of threads over which the chart lookup for off-center points is distributed when there are more than ``CIRCLE_BLOCK_SIZE`` of them (optional, default=1)
+
+    :returns: Same output as ``stresses_circle_boussinesq`` with arrays instead of scalars
+
+    :rtype: Python dictionary with keys ['sigma_z [kPa]','sigma_r [kPa]','sigma_theta [kPa]']
+
+    """
+
+    dtype = np.dtype(dtype)
+    constant_radius = np.size(radius) == 1
+    z, radius = np.broadcast_arrays(np.asarray(z, dtype=dtype),
+                                    np.asarray(radius, dtype=dtype))
+    circle_stress = dtype.type(circle_stress)
+    circle_radius = dtype.type(circle_radius)
+    poisson_coefficient = dtype.type(poisson_coefficient)
+
+    if np.any(z < 0.0):
+        raise ValueError("z (%s) cannot be smaller than 0.0" % str(z.min()))
+    if np.any(radius < 0.0):
+        raise ValueError("radius (%s) cannot be smaller than 0.0" % str(radius.min()))
+    if poisson_coefficient < 0.0 or poisson_coefficient > 0.5:
+        raise ValueError("poisson_coefficient (%s) must be between 0.0 and 0.5" % str(poisson_coefficient))
+
+    center = radius == 0.0
+    chart = np.logical_not(center) & (radius <= 10.0 * circle_radius) & (z <= 15.0 * circle_radius)
+
+    sigma_z = np.full(z.shape, np.nan, dtype=dtype)
+    sigma_r = np.full(z.shape, np.nan, dtype=dtype)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sigma_z[center], sigma_r[center], _ = _stresses_circle_boussinesq_raw(
+            circle_stress, circle_radius, z[center], 0.0, poisson_coefficient)
+        if constant_radius:
+            # Depth profile at a single radial distance, the r/R interval of the chart is only determined once
+            r_dimless = radius.flat[0] / circle_radius
+        else:
+            r_dimless = radius[chart] / circle_radius
+        z_dimless = z[chart] / circle_radius
+        if workers > 1 and z_dimless.size > CIRCLE_BLOCK_SIZE:
+            # The lookup releases the GIL in NumPy, the points are split in one part per thread
+            z_parts = np.array_split(z_dimless, workers)
+            r_parts = [r_dimless] * workers if constant_radius else np.array_split(r_dimless, workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                mult = np.concatenate(list(executor.map(_circle_chart_lookup, r_parts, z_parts)))
+        else:
+            mult = _circle_chart_lookup(r_dimless, z_dimless)
+        sigma_z[chart] = circle_stress * mult
+
+    # The tangential stress equals the radial stress, it is returned as a read-only view on the same buffer
+    sigma_theta = sigma_r.view()
+    sigma_theta.flags.writeable = False
+
+    return {
+        'sigma_z [kPa]': sigma_z,
+        'sigma_r [kPa]': sigma_r,
+        'sigma_theta [kPa]': sigma_theta,
+    }
+
+
+def stresses_circle_boussinesq_profile(circle_stress, circle_radius, radius=0.0, poisson_coefficient=0.3,
+                                       dtype=np.float64):
+    """
+    Returns a function which calculates the stresses below a uniformly loaded circular area for an array of depths at a fixed radial distance, e.g. for a vertical stress profile. The returned function takes the array ``z`` as its only argument and gives the same output as ``stresses_circle_boussinesq_vec``.
+
+    For a point off center, the r/R interval of the chart, the interpolation fraction along r/R and the two chart curves used are determined once when the function is created. Each call then only interpolates along the depth. Below the center, the closed-form solution is used.
+
+    :param circle_stress: Uniform stress acting on the circular area (:math:`q`) [:math:`kPa`]
+    :param circle_radius: Radius of the circle (:math:`R`) [:math:`m`]  - Suggested range: 0.0<=circle_radius
+    :param radius: Radial distance from circle center to the vertical along which stresses are calculated (:math:`r`) [:math:`m`] (optional, default=0.0) - Suggested range: 0.0<=radius
+    :param poisson_coefficient: Poisson's coefficient (:math:`\\nu`) [:math:`-`] (optional, default=0.3) - Suggested range: 0.0<=poisson_coefficient<=0.5
+    :param dtype: Floating point type used for the calculation and the output (optional, default=np.float64)
+
+    :returns: Function of the array ``z`` with the depths of the points where stresses are calculated [:math:`m`]
+
+    :rtype: Python function returning a dictionary with keys ['sigma_z [kPa]','sigma_r [kPa]','sigma_theta [kPa]']
+
+    """
+
+    if radius < 0.0:
+        raise ValueError("radius (%s) cannot be smaller than 0.0" % str(radius))
+
+    if radius == 0.0:
+        def profile(z):
+            return stresses_circle_boussinesq_vec(circle_stress, circle_radius, z, 0.0, poisson_coefficient,
+                                                  dtype=dtype)
+        return profile
+
+    dtype = np.dtype(dtype)
+    circle_stress = dtype.type(circle_stress)
+    circle_radius = dtype.type(circle_radius)
+    r_dimless = float(dtype.type(radius) / circle_radius)
+    inside_chart = r_dimless <= 10.0
+    curve = min(max(bisect_left(CIRCLE_CHART_R_LIST, r_dimless) - 1, 0), len(CIRCLE_CHART_R_LIST) - 2)
+    r_fraction = (r_dimless - CIRCLE_CHART_R_LIST[curve]) * CIRCLE_CHART_R_INV_WIDTH_LIST[curve]
+    logmult_lower_curve = CIRCLE_CHART_LOGMULT[curve]
+    logmult_upper_curve = CIRCLE_CHART_LOGMULT[curve + 1]
+
+    def profile(z):
+        z = np.asarray(z, dtype=dtype)
+        if np.any(z < 0.0):
+            raise ValueError("z (%s) cannot be smaller than 0.0" % str(z.min()))
+
+        sigma_z = np.full(z.shape, np.nan, dtype=dtype)
+        sigma_r = np.full(z.shape, np.nan, dtype=dtype)
+
+        if inside_chart:
+            chart = z <= 15.0 * circle_radius
+            position = np.asarray(z[chart] / circle_radius, dtype=np.float64) * CIRCLE_CHART_Z_SCALE
+            index = np.minimum(position.astype(np.intp), CIRCLE_CHART_Z_LAST_INTERVAL)
+            z_fraction = position - index
+            logmult_lower = np.take(logmult_lower_curve, index)
+            logmult_lower = logmult_lower + z_fraction * (np.take(logmult_lower_curve, index + 1) - logmult_lower)
+            logmult_upper = np.take(logmult_upper_curve, index)
+            logmult_upper = logmult_upper + z_fraction * (np.take(logmult_upper_curve, index + 1) - logmult_upper)
+            sigma_z[chart] = circle_stress * _circle_chart_blend(logmult_lower, logmult_upper, r_fraction)
+
+        sigma_theta = sigma_r.view()
+        sigma_theta.flags.writeable = False
+
+        return {
+            'sigma_z [kPa]': sigma_z,
+            'sigma_r [kPa]': sigma_r,
+            'sigma_theta [kPa]': sigma_theta,
+        }
+
+    return profile
+
+
+def _stresses_rectangle_boussinesq_raw(rectangle_stress, rectangle_length, rectangle_width, z):
+    """
+    Stresses below the corner of a loaded rectangle without validation or error handling, see
+    ``stresses_rectangle_boussinesq``. Returns the tuple (sigma_z, sigma_x, sigma_y, tau_zx).
+    """
+    sqrt = np.sqrt
+    # Squares are calculated as products, R1 is only needed squared and its square root is not taken
+    length_sq = rectangle_length * rectangle_length
+    width_sq = rectangle_width * rectangle_width
+    z_sq = z * z
+    r1_sq = length_sq + z_sq
+    r2_sq = width_sq + z_sq
+    r2 = sqrt(r2_sq)
+    r3 = sqrt(length_sq + width_sq + z_sq)
+
+    # The angle and L B z / R3 are shared by the normal stresses and are evaluated once. arctan2 gives the
+    # limit value pi/2 at the surface without dividing by zero
+    area = rectangle_length * rectangle_width
+    angle = np.arctan2(area, z * r3)
+    area_z_r3 = area * z / r3
+
+    factor = INV_TWO_PI * rectangle_stress
+    sigma_z = factor * (angle + area_z_r3 * (1.0 / r1_sq + 1.0 / r2_sq))
+    sigma_x = factor * (angle - area_z_r3 / r1_sq)
+    sigma_y = factor * (angle - area_z_r3 / r2_sq)
+    tau_zx = factor * (rectangle_width / r2 - (z_sq * rectangle_width) / (r1_sq * r3))
+
+    return sigma_z, sigma_x, sigma_y, tau_zx
+
+
+@lru_cache(maxsize=4096)
+def _stresses_rectangle_boussinesq_scalar(rectangle_stress, rectangle_length, rectangle_width, z):
+    """
+    Scalar version of ``_stresses_rectangle_boussinesq_raw`` which works on Python floats. The functions of the
+    ``math`` module avoid the overhead of NumPy for a single point. At the surface, the angle is obtained with
+    ``atan2`` to give the same limit values as the array version. As the results only depend on the arguments,
+    they are cached for repeated queries. Returns the tuple (sigma_z, sigma_x, sigma_y, tau_zx).
+    """
+    length_sq = rectangle_length * rectangle_length
+    width_sq = rectangle_width * rectangle_width
+    z_sq = z * z
+    r1_sq = length_sq + z_sq
+    r2_sq = width_sq + z_sq
+    r2 = math.sqrt(r2_sq)
+    r3 = math.sqrt(length_sq + width_sq + z_sq)
+    area = rectangle_length * rectangle_width
+    angle = math.atan2(area, z * r3)
+    area_z_r3 = area * z / r3
+
+    factor = INV_TWO_PI * rectangle_stress
+    sigma_z = factor * (angle + area_z_r3 * (1.0 / r1_sq + 1.0 / r2_sq))
+    sigma_x = factor * (angle - area_z_r3 / r1_sq)
+    sigma_y = factor * (angle - area_z_r3 / r2_sq)
+    tau_zx = factor * (rectangle_width / r2 - (z_sq * rectangle_width) / (r1_sq * r3))
+
+    return sigma_z, sigma_x, sigma_y, tau_zx
+
+
 STRESSES_RECTANGLE_BOUSSINESQ = {
     'rectangle_stress': {'type': 'float', 'min_value': None, 'max_value': None},
     'rectangle_length': {'type': 'float', 'min_value': 0.0, 'max_value': None},
@@ -820,14 +930,21 @@ STRESSES_RECTANGLE_BOUSSINESQ = {
     'z': {'type': 'float', 'min_value': 0.0, 'max_value': None},
 }
 
+STRESSES_RECTANGLE_BOUSSINESQ_ERRORRETURN = {
+    'sigma_z [kPa]': np.nan,
+    'sigma_x [kPa]': np.nan,
+    'sigma_y [kPa]': np.nan,
+    'tau_zx [kPa]': np.nan,
+}
+
 @ValidationDecorator(STRESSES_RECTANGLE_BOUSSINESQ)
 def stresses_rectangle_boussinesq(rectangle_stress, rectangle_length, rectangle_width, z, fail_silently=True, **kwargs):
     """
-    Calculates the increase in stress below the corner of a uniformly loaded rectangular area.
+    Calculates the increase in stress below the corner of a uniformly loaded rectangular area. The length is measured along the x-direction and the width along the y-direction. The expressions hold for any ratio of length to width, the length does not need to be the longest side.
 
     :param rectangle_stress: Stress acting on the uniformly loaded rectangle (:math:`q`) [:math:`kPa`]
-    :param rectangle_length: Length of the longest side of the rectangle (:math:`L`) [:math:`m`]  - Suggested range: 0.0<=rectangle_length
-    :param rectangle_width: Width of the rectangle (:math:`B`) [:math:`m`]  - Suggested range: 0.0<=rectangle_width
+    :param rectangle_length: Length of the rectangle in the x-direction (:math:`L`) [:math:`m`]  - Suggested range: 0.0<=rectangle_length
+    :param rectangle_width: Width of the rectangle in the y-direction (:math:`B`) [:math:`m`]  - Suggested range: 0.0<=rectangle_width
     :param z: z-coordinate of the point where stresses are calculated (:math:`z`) [:math:`m`]  - Suggested range: 0.0<=z
 
     .. math::
@@ -868,22 +985,11 @@ def stresses_rectangle_boussinesq(rectangle_stress, rectangle_length, rectangle_
         if not kwargs['validated']:
             raise ValueError("Error during function validation, %s" % kwargs['errorstring'])
 
-        if rectangle_width > rectangle_length:
-            raise ValueError("Rectangle length must be greater than rectangle width")
-
-        r1 = np.sqrt(rectangle_length**2.0 + z**2.0)
-        r2 = np.sqrt(rectangle_width**2.0 + z**2.0)
-        r3 = np.sqrt(rectangle_length**2.0 + rectangle_width**2.0 + z**2.0)
+        if (rectangle_length == 0.0 or rectangle_width == 0.0) and z == 0.0:
+            raise ValueError("Stresses are undefined at the surface for a rectangle with zero length or width")
 
-        sigma_z = (rectangle_stress/(2.0*np.pi))*(np.arctan((rectangle_length*rectangle_width)/(z*r3)) +
-                                                  ((rectangle_length*rectangle_width*z)/r3) *
-                                                  ((1.0/(r1**2.0))+(1.0/(r2**2.0))))
-        sigma_x = (rectangle_stress/(2.0*np.pi))*(np.arctan((rectangle_length*rectangle_width)/(z*r3)) -
-                                                  ((rectangle_length*rectangle_width*z)/((r1**2.0) * r3)))
-        sigma_y = (rectangle_stress / (2.0 * np.pi)) * (np.arctan((rectangle_length * rectangle_width) / (z * r3)) -
-                                                        ((rectangle_length * rectangle_width * z) / ((r2 ** 2.0) * r3)))
-        tau_zx = (rectangle_stress / (2.0 * np.pi)) * ((rectangle_width/r2) -
-                                                       (((z**2.0 * rectangle_width))/((r1**2.0) * r3)))
+        sigma_z, sigma_x, sigma_y, tau_zx = _stresses_rectangle_boussinesq_scalar(
+            float(rectangle_stress), float(rectangle_length), float(rectangle_width), float(z))
 
         return {
             'sigma_z [kPa]': sigma_z,
@@ -892,16 +998,88 @@ def stresses_rectangle_boussinesq(rectangle_stress, rectangle_length, rectangle_
             'tau_zx [kPa]': tau_zx,
         }
 
-    except:
+    except (ValueError, TypeError, ArithmeticError):
         if fail_silently or fail_silently is None:
-            return {
-                'sigma_z [kPa]': np.nan,
-                'sigma_x [kPa]': np.nan,
-                'sigma_y [kPa]': np.nan,
-                'tau_zx [kPa]': np.nan,
-            }
+            return STRESSES_RECTANGLE_BOUSSINESQ_ERRORRETURN.copy()
         else:
             raise
 
 
+# Number of points evaluated at once by stresses_rectangle_boussinesq_vec, the intermediate arrays of a block
+# remain in the processor cache
+RECTANGLE_BLOCK_SIZE = 4096
+
+
+def stresses_rectangle_boussinesq_vec(rectangle_stress, rectangle_length, rectangle_width, z, dtype=np.float64,
+                                      workers=1):
+    """
+    Vectorised version of ``stresses_rectangle_boussinesq``. The rectangle dimensions and the depth ``z`` can be NumPy arrays (or anything which can be converted to a float array) and are broadcast against each other, e.g. to calculate a stress profile below a footing or the stresses below a series of footing sizes in a single call. The closed-form expressions are evaluated once for all points instead of once per point.
+
+    The points are processed in blocks of ``RECTANGLE_BLOCK_SIZE`` to keep the intermediate results in the processor cache. As NumPy releases the GIL during the array operations, the blocks can be distributed over several threads with ``workers``.
+
+    Points at the surface (:math:`z = 0`) return the limit values of the expressions instead of ``nan``. For a rectangle with zero length or width, the stresses at the surface are undefined and ``nan`` is returned instead of raising an error.
+
+    :param rectangle_stress: Stress acting on the uniformly loaded rectangle (:math:`q`) [:math:`kPa`]
+    :param rectangle_length: Array with lengths of the rectangle in the x-direction (:math:`L`) [:math:`m`]  - Suggested range: 0.0<=rectangle_length
+    :param rectangle_width: Array with widths of the rectangle in the y-direction (:math:`B`) [:math:`m`]  - Suggested range: 0.0<=rectangle_width
+    :param z: Array with z-coordinates of the points where stresses are calculated (:math:`z`) [:math:`m`]  - Suggested range: 0.0<=z
+    :param dtype: Floating point type used for the calculation and the output (optional, default=np.float64)
+    :param workers: Number of threads over which the blocks are distributed (optional, default=1)
+
+    :returns: Same output as ``stresses_rectangle_boussinesq`` with arrays instead of scalars
+
+    :rtype: Python dictionary with keys ['sigma_z [kPa]','sigma_x [kPa]','sigma_y [kPa]','tau_zx [kPa]']
+
+    """
 
+    dtype = np.dtype(dtype)
+    rectangle_length = np.asarray(rectangle_length, dtype=dtype)
+    rectangle_width = np.asarray(rectangle_width, dtype=dtype)
+    z = np.asarray(z, dtype=dtype)
+    grid = np.broadcast(rectangle_length, rectangle_width, z)
+    shape = grid.shape
+    size = grid.size
+    rectangle_stress = dtype.type(rectangle_stress)
+
+    if np.any(rectangle_length < 0.0):
+        raise ValueError("rectangle_length (%s) cannot be smaller than 0.0" % str(rectangle_length.min()))
+    if np.any(rectangle_width < 0.0):
+        raise ValueError("rectangle_width (%s) cannot be smaller than 0.0" % str(rectangle_width.min()))
+    if np.any(z < 0.0):
+        raise ValueError("z (%s) cannot be smaller than 0.0" % str(z.min()))
+
+    rectangle_length = _flatten_grid(rectangle_length, shape)
+    rectangle_width = _flatten_grid(rectangle_width, shape)
+    z = _flatten_grid(z, shape)
+    results = np.empty((4, size), dtype=dtype)
+
+    def calculate_block(start):
+        block = slice(start, start + RECTANGLE_BLOCK_SIZE)
+        length_block, width_block, z_block = [coordinate[block] if coordinate.ndim else coordinate
+                                              for coordinate in (rectangle_length, rectangle_width, z)]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            stresses = _stresses_rectangle_boussinesq_raw(rectangle_stress, length_block, width_block, z_block)
+        for i, stress in enumerate(stresses):
+            results[i, block] = stress
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(calculate_block, range(0, size, RECTANGLE_BLOCK_SIZE)))
+    else:
+        for start in range(0, size, RECTANGLE_BLOCK_SIZE):
+            calculate_block(start)
+
+    # At the surface, the stresses for a rectangle with zero length or width are undefined. Some of the expressions
+    # evaluate to finite values there, so all outputs are set to nan explicitly
+    undefined = ((rectangle_length == 0.0) | (rectangle_width == 0.0)) & (z == 0.0)
+    if np.any(undefined):
+        results[:, np.broadcast_to(undefined, (size,))] = np.nan
+
+    results = results.reshape((4,) + shape)
+
+    return {
+        'sigma_z [kPa]': results[0],
+        'sigma_x [kPa]': results[1],
+        'sigma_y [kPa]': results[2],
+        'tau_zx [kPa]': results[3],
+    }
@@ -3,15 +3,134 @@
 
 __author__ = 'Bruno Stuyts'
 
-from pyeng.general.validation import ValidationDecorator
+from pyeng.general.validation import ValidationDecorator, Validator
+from bisect import bisect_left, bisect_right
+import json
+import math
+import os
 import numpy as np
 
+# Digitised Moody chart. The chart is stored in moody_chart.json next to this module. Each curve contains the values
+# of log10(Re) and log10(f_D) for the corresponding relative roughness in MOODY_CHART_RELATIVE_ROUGHNESS. Between two
+# curves, the friction factor is interpolated linearly on the relative roughness. The curve for smooth pipes is used
+# up to the smallest relative roughness and the curve for the largest relative roughness is used above it
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'moody_chart.json')) as _chart_file:
+    _moody_chart = json.load(_chart_file)
+MOODY_CHART_RELATIVE_ROUGHNESS = np.array(_moody_chart['relative_roughness'])
+MOODY_CHART_CURVES = tuple((np.array(_curve['log10_reynolds']), np.array(_curve['log10_friction_factor']))
+                           for _curve in _moody_chart['curves'])
+MOODY_CHART_SMOOTH = (np.array(_moody_chart['smooth']['log10_reynolds']),
+                      np.array(_moody_chart['smooth']['log10_friction_factor']))
+MOODY_CHART_COMPLETE_TURBULENCE = (np.array(_moody_chart['complete_turbulence']['log10_reynolds']),
+                                   np.array(_moody_chart['complete_turbulence']['log10_friction_factor']))
+# Plain Python copies of the tables for the scalar calculation, which avoids the overhead of NumPy calls on scalars
+MOODY_CHART_RELATIVE_ROUGHNESS_LIST = tuple(MOODY_CHART_RELATIVE_ROUGHNESS.tolist())
+MOODY_CHART_CURVES_LIST = tuple((tuple(_curve[0].tolist()), tuple(_curve[1].tolist())) for _curve in MOODY_CHART_CURVES)
+MOODY_CHART_SMOOTH_LIST = (tuple(MOODY_CHART_SMOOTH[0].tolist()), tuple(MOODY_CHART_SMOOTH[1].tolist()))
+MOODY_CHART_COMPLETE_TURBULENCE_LIST = (tuple(MOODY_CHART_COMPLETE_TURBULENCE[0].tolist()),
+                                        tuple(MOODY_CHART_COMPLETE_TURBULENCE[1].tolist()))
+# Flow regimes, in the order of the regime index returned by _moody_core
+MOODY_FLOW_REGIMES = ("Laminar Flow", "Transition Region", "Complete turbulence")
+# The tables are shared by all calculations and must not be modified
+MOODY_CHART_RELATIVE_ROUGHNESS.flags.writeable = False
+for _curve in MOODY_CHART_CURVES + (MOODY_CHART_SMOOTH, MOODY_CHART_COMPLETE_TURBULENCE):
+    _curve[0].flags.writeable = False
+    _curve[1].flags.writeable = False
+
+
+# Roughness in mm of typical pipe walls
+PIPE_ROUGHNESS = {
+    "Concrete,coarse": 0.25,
+    "Concrete,new smooth": 0.025,
+    "Drawn tubing": 0.0025,
+    "Glass,plastic,perspex": 0.0025,
+    "Iron,cast": 0.15,
+    "Sewers,old": 3.0,
+    "Steel,mortar lined": 0.1,
+    "Steel,rusted": 0.5,
+    "Steel,structural or forged": 0.025,
+    "Water mains,old": 1.0,
+}
+
+
+def _pipe_roughness(pipe_material):
+    """
+    Returns the roughness in mm of typical pipe walls
+    """
+    try:
+        return PIPE_ROUGHNESS[pipe_material]
+    except (KeyError, TypeError):
+        raise ValueError(
+            "Pipe material not recognized, select from the options or specify relative roughness directly")
+
+
+def _interp_scalar(x, x_values, y_values):
+    """
+    Linear interpolation of a scalar in a table with increasing x-values, with the same result as ``np.interp``
+    """
+    if x >= x_values[-1]:
+        return y_values[-1]
+    i = bisect_right(x_values, x) - 1
+    if i < 0:
+        return y_values[0]
+    return ((y_values[i + 1] - y_values[i]) / (x_values[i + 1] - x_values[i])) * (x - x_values[i]) + y_values[i]
+
+
+def _moody_core(reynolds_number, relative_roughness):
+    """
+    Scalar calculation of the friction factor from the Moody chart in plain Python. Returns the friction factor, the
+    friction factors for laminar flow and at the start of complete turbulence and the index of the flow regime in
+    MOODY_FLOW_REGIMES.
+    """
+    log_reynolds = math.log10(reynolds_number)
+    interval = bisect_left(MOODY_CHART_RELATIVE_ROUGHNESS_LIST, relative_roughness)
+    if interval == 0:
+        friction_factor = 10.0 ** _interp_scalar(log_reynolds, *MOODY_CHART_SMOOTH_LIST)
+    elif interval == len(MOODY_CHART_CURVES_LIST):
+        friction_factor = 10.0 ** _interp_scalar(log_reynolds, *MOODY_CHART_CURVES_LIST[-1])
+    else:
+        friction_factor_lower = 10.0 ** _interp_scalar(log_reynolds, *MOODY_CHART_CURVES_LIST[interval - 1])
+        friction_factor_upper = 10.0 ** _interp_scalar(log_reynolds, *MOODY_CHART_CURVES_LIST[interval])
+        roughness_lower = MOODY_CHART_RELATIVE_ROUGHNESS_LIST[interval - 1]
+        roughness_upper = MOODY_CHART_RELATIVE_ROUGHNESS_LIST[interval]
+        friction_factor = friction_factor_lower + ((friction_factor_upper - friction_factor_lower) /
+                                                   (roughness_upper - roughness_lower)) * \
+                          (relative_roughness - roughness_lower)
+
+    friction_factor_laminar = 64.0 / reynolds_number
+    friction_factor_turbulent = 10.0 ** _interp_scalar(log_reynolds, *MOODY_CHART_COMPLETE_TURBULENCE_LIST)
+
+    if friction_factor < friction_factor_laminar:
+        flow_regime = 0
+    elif friction_factor < friction_factor_turbulent:
+        flow_regime = 1
+    else:
+        flow_regime = 2
+
+    return friction_factor, friction_factor_laminar, friction_factor_turbulent, flow_regime
+
+
+def _moody_friction_factor(interval, log_reynolds, relative_roughness):
+    """
+    Returns the Darcy-Weisbach friction factor from the Moody chart for relative roughnesses in the given interval of
+    MOODY_CHART_RELATIVE_ROUGHNESS. The interval is the index returned by a left bisection of the relative roughness
+    in the tabulated values. log10(Re) and the relative roughness can be scalars or arrays.
+    """
+    if interval == 0:
+        return 10.0 ** np.interp(log_reynolds, *MOODY_CHART_SMOOTH)
+    if interval == len(MOODY_CHART_CURVES):
+        return 10.0 ** np.interp(log_reynolds, *MOODY_CHART_CURVES[-1])
+    friction_factor_lower = 10.0 ** np.interp(log_reynolds, *MOODY_CHART_CURVES[interval - 1])
+    friction_factor_upper = 10.0 ** np.interp(log_reynolds, *MOODY_CHART_CURVES[interval])
+    roughness_lower = MOODY_CHART_RELATIVE_ROUGHNESS_LIST[interval - 1]
+    roughness_upper = MOODY_CHART_RELATIVE_ROUGHNESS_LIST[interval]
+    return friction_factor_lower + ((friction_factor_upper - friction_factor_lower) /
+                                    (roughness_upper - roughness_lower)) * (relative_roughness - roughness_lower)
+
 PRESSUREDROP_RELATIVEROUGHNESS_MOODY = {
     'reynolds_number': {'type': 'float', 'min_value': 500.0, 'max_value': 100000000.0},
     'pipe_diameter': {'type': 'float', 'min_value': 0.0, 'max_value': None},
-    'pipe_material': {'type': 'string', 'options': (
-    "Concrete,coarse", "Concrete,new smooth", "Drawn tubing", "Glass,plastic,perspex", "Iron,cast", "Sewers,old",
-    "Steel,mortar lined", "Steel,rusted", "Steel,structural or forged", "Water mains,old"), 'regex': None},
+    'pipe_material': {'type': 'string', 'options': tuple(PIPE_ROUGHNESS.keys()), 'regex': None},
     'pipe_length': {'type': 'float', 'min_value': 0.0, 'max_value': None},
     'average_velocity': {'type': 'float', 'min_value': 0.0, 'max_value': None},
     'fluid_density': {'type': 'float', 'min_value': 500.0, 'max_value': 2500.0},
@@ -19,8 +138,18 @@ PRESSUREDROP_RELATIVEROUGHNESS_MOODY = {
     'relative_roughness': {'type': 'float', 'min_value': None, 'max_value': 0.05},
 }
 
+PRESSUREDROP_RELATIVEROUGHNESS_MOODY_ERRORRETURN = {
+    'friction_factor [-]': np.nan,
+    'roughness [mm]': np.nan,
+    'head_loss [m]': np.nan,
+    'pressure_drop [Pa]': np.nan,
+    'flow_regime [-]': None,
+    'friction_factor_laminar [-]': np.nan,
+    'friction_factor_turbulent [-]': np.nan,
+}
+
 
-@ValidationDecorator(PRESSUREDROP_RELATIVEROUGHNESS_MOODY)
+@ValidationDecorator(PRESSUREDROP_RELATIVEROUGHNESS_MOODY, cache_size=256)
 def pressuredrop_relativeroughness_moody(reynolds_number, pipe_diameter, pipe_material, pipe_length, average_velocity,
                                          fluid_density, gravity_coefficient=9.81, relative_roughness=np.nan,
                                          fail_silently=True, **kwargs):
@@ -67,440 +196,31 @@ def pressuredrop_relativeroughness_moody(reynolds_number, pipe_diameter, pipe_ma
 
     """
 
-    try:
+    # Validation errors are handled without raising and catching an exception
+    if not kwargs['validated']:
+        if fail_silently or fail_silently is None:
+            return PRESSUREDROP_RELATIVEROUGHNESS_MOODY_ERRORRETURN.copy()
+        raise ValueError("Error during function validation, %s" % kwargs['errorstring'])
 
-        if not kwargs['validated']:
-            raise ValueError("Error during function validation, %s" % kwargs['errorstring'])
+    # The calculation remains guarded for arguments which pass the validation but cannot be evaluated (e.g. a zero
+    # pipe diameter), setting up the try block costs about 10 ns on Python 3.6 and 3.7
+    try:
 
         # Calculation statements
-        if not np.isnan(relative_roughness):
+        if not math.isnan(relative_roughness):
             roughness = relative_roughness * pipe_diameter * 1000.0
         else:
-            if pipe_material == "Concrete,coarse":
-                roughness = 0.25
-            elif pipe_material == "Concrete,new smooth":
-                roughness = 0.025
-            elif pipe_material == "Drawn tubing":
-                roughness = 0.0025
-            elif pipe_material == "Glass,plastic,perspex":
-                roughness = 0.0025
-            elif pipe_material == "Iron,cast":
-                roughness = 0.15
-            elif pipe_material == "Sewers,old":
-                roughness = 3.0
-            elif pipe_material == "Steel,mortar lined":
-                roughness = 0.1
-            elif pipe_material == "Steel,rusted":
-                roughness = 0.5
-            elif pipe_material == "Steel,structural or forged":
-                roughness = 0.025
-            elif pipe_material == "Water mains,old":
-                roughness = 1.0
-            else:
-                raise ValueError(
-                    "Pipe material not recognized, select from the options or specify relative roughness directly")
-
+            roughness = _pipe_roughness(pipe_material)
             relative_roughness = 0.001 * roughness / pipe_diameter
 
-        if relative_roughness > 0.05:
-            friction_factor = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                                 [3.30443548387097, 3.48588709677419, 3.6491935483871, 3.84879032258064,
-                                                  4.06048387096774, 4.28427419354839, 4.5625, 4.74395161290323,
-                                                  5.16129032258065,
-                                                  6.21975806451613, 7.99798387096774],
-                                                 [-1.06711409395973, -1.08724832214765, -1.10290827740492,
-                                                  -1.11633109619687,
-                                                  -1.12751677852349, -1.13199105145414, -1.13870246085011,
-                                                  -1.14093959731544,
-                                                  -1.14317673378076, -1.14317673378076, -1.14541387024608]))
-        elif 0.05 >= relative_roughness > 0.04:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.30443548387097, 3.48588709677419, 3.6491935483871, 3.84879032258064,
-                                      4.06048387096774, 4.28427419354839, 4.5625, 4.74395161290323, 5.16129032258065,
-                                      6.21975806451613, 7.99798387096774],
-                                     [-1.06711409395973, -1.08724832214765, -1.10290827740492, -1.11633109619687,
-                                      -1.12751677852349, -1.13199105145414, -1.13870246085011, -1.14093959731544,
-                                      -1.14317673378076, -1.14317673378076, -1.14541387024608])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.50403225806451, 3.89112903225806, 4.24798387096774,
-                                      4.5866935483871, 4.88911290322581, 5.19758064516129, 5.83266129032258,
-                                      6.36491935483871, 6.91532258064516, 7.99798387096774],
-                                     [-1.09619686800895, -1.12527964205817, -1.15883668903803, -1.1744966442953,
-                                      -1.18120805369127, -1.18568232662192, -1.18791946308725, -1.18791946308725,
-                                      -1.18791946308725, -1.18791946308725, -1.18791946308725])
-                           )
-            friction_factor = np.interp(relative_roughness, [0.04, 0.05], [ff2, ff1])
-        elif 0.04 >= relative_roughness > 0.03:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.50403225806451, 3.89112903225806, 4.24798387096774,
-                                      4.5866935483871, 4.88911290322581, 5.19758064516129, 5.83266129032258,
-                                      6.36491935483871, 6.91532258064516, 7.99798387096774],
-                                     [-1.09619686800895, -1.12527964205817, -1.15883668903803, -1.1744966442953,
-                                      -1.18120805369127, -1.18568232662192, -1.18791946308725, -1.18791946308725,
-                                      -1.18791946308725, -1.18791946308725, -1.18791946308725])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.42540322580645, 3.57056451612903, 3.73991935483871,
-                                      3.90927419354839, 4.13306451612903, 4.51411290322581, 4.82258064516129,
-                                      5.04032258064516, 5.35483870967742, 5.53024193548387, 5.82661290322581,
-                                      6.0866935483871, 6.47379032258064, 6.90322580645161, 7.3991935483871,
-                                      7.99798387096774],
-                                     [-1.13422818791946, -1.15212527964206, -1.1744966442953, -1.1923937360179,
-                                      -1.20581655480984, -1.21923937360179, -1.23042505592841, -1.23713646532438,
-                                      -1.23937360178971, -1.24161073825503, -1.24161073825503, -1.24161073825503,
-                                      -1.24161073825503, -1.24384787472036, -1.24161073825503, -1.24161073825503,
-                                      -1.24161073825503])
-                           )
-            friction_factor = np.interp(relative_roughness, [0.03, 0.04], [ff2, ff1])
-        elif 0.03 >= relative_roughness > 0.02:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.42540322580645, 3.57056451612903, 3.73991935483871,
-                                      3.90927419354839, 4.13306451612903, 4.51411290322581, 4.82258064516129,
-                                      5.04032258064516, 5.35483870967742, 5.53024193548387, 5.82661290322581,
-                                      6.0866935483871, 6.47379032258064, 6.90322580645161, 7.3991935483871,
-                                      7.99798387096774],
-                                     [-1.13422818791946, -1.15212527964206, -1.1744966442953, -1.1923937360179,
-                                      -1.20581655480984, -1.21923937360179, -1.23042505592841, -1.23713646532438,
-                                      -1.23937360178971, -1.24161073825503, -1.24161073825503, -1.24161073825503,
-                                      -1.24161073825503, -1.24384787472036, -1.24161073825503, -1.24161073825503,
-                                      -1.24161073825503])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.43145161290322, 3.61290322580645, 3.82459677419355,
-                                      4.07258064516129, 4.29637096774193, 4.61693548387097, 4.87701612903226,
-                                      5.13709677419355, 5.37298387096774, 5.76612903225806, 6.12903225806451,
-                                      6.52822580645161, 7.14516129032258, 7.99798387096774],
-                                     [-1.17673378076063, -1.19910514541387, -1.23042505592841, -1.2572706935123,
-                                      -1.27740492170022, -1.29082774049217, -1.29977628635347, -1.30425055928412,
-                                      -1.30872483221477, -1.31096196868009, -1.31096196868009, -1.31319910514541,
-                                      -1.31319910514541, -1.31319910514541, -1.31319910514541])
-                           )
-            friction_factor = np.interp(relative_roughness, [0.02, 0.03], [ff2, ff1])
-        elif 0.02 >= relative_roughness > 0.015:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.43145161290322, 3.61290322580645, 3.82459677419355,
-                                      4.07258064516129, 4.29637096774193, 4.61693548387097, 4.87701612903226,
-                                      5.13709677419355, 5.37298387096774, 5.76612903225806, 6.12903225806451,
-                                      6.52822580645161, 7.14516129032258, 7.99798387096774],
-                                     [-1.17673378076063, -1.19910514541387, -1.23042505592841, -1.2572706935123,
-                                      -1.27740492170022, -1.29082774049217, -1.29977628635347, -1.30425055928412,
-                                      -1.30872483221477, -1.31096196868009, -1.31096196868009, -1.31319910514541,
-                                      -1.31319910514541, -1.31319910514541, -1.31319910514541])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.4616935483871, 3.66733870967742, 3.84879032258064,
-                                      4.09677419354838, 4.44153225806452, 4.7741935483871, 5.11895161290322,
-                                      5.59072580645161, 6.27419354838709, 6.84879032258064, 7.32661290322581,
-                                      7.78629032258064, 7.99798387096774],
-                                     [-1.19910514541387, -1.23266219239374, -1.26845637583893, -1.29306487695749,
-                                      -1.31767337807606, -1.33557046979866, -1.34675615212528, -1.35346756152125,
-                                      -1.35570469798658, -1.36017897091723, -1.36017897091723, -1.36017897091723,
-                                      -1.36017897091723, -1.36017897091723])
-                           )
-            friction_factor = np.interp(relative_roughness, [0.015, 0.02], [ff2, ff1])
-        elif 0.015 >= relative_roughness > 0.01:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.4616935483871, 3.66733870967742, 3.84879032258064,
-                                      4.09677419354838, 4.44153225806452, 4.7741935483871, 5.11895161290322,
-                                      5.59072580645161, 6.27419354838709, 6.84879032258064, 7.32661290322581,
-                                      7.78629032258064, 7.99798387096774],
-                                     [-1.19910514541387, -1.23266219239374, -1.26845637583893, -1.29306487695749,
-                                      -1.31767337807606, -1.33557046979866, -1.34675615212528, -1.35346756152125,
-                                      -1.35570469798658, -1.36017897091723, -1.36017897091723, -1.36017897091723,
-                                      -1.36017897091723, -1.36017897091723])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.38911290322581, 3.52217741935484, 3.74596774193548,
-                                      3.98790322580645, 4.23588709677419, 4.48387096774193, 4.83467741935484,
-                                      5.28225806451613, 5.92943548387097, 6.40725806451613, 6.9758064516129,
-                                      7.99798387096774],
-                                     [-1.22645739910314, -1.24887892376682, -1.28026905829596, -1.32062780269058,
-                                      -1.3542600896861, -1.37892376681614, -1.39461883408072, -1.40807174887892,
-                                      -1.41479820627803, -1.41928251121076, -1.42152466367713, -1.42152466367713,
-                                      -1.42152466367713])
-                           )
-            friction_factor = np.interp(relative_roughness, [0.01, 0.015], [ff2, ff1])
-        elif 0.01 >= relative_roughness > 0.005:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.38911290322581, 3.52217741935484, 3.74596774193548,
-                                      3.98790322580645, 4.23588709677419, 4.48387096774193, 4.83467741935484,
-                                      5.28225806451613, 5.92943548387097, 6.40725806451613, 6.9758064516129,
-                                      7.99798387096774],
-                                     [-1.22645739910314, -1.24887892376682, -1.28026905829596, -1.32062780269058,
-                                      -1.3542600896861, -1.37892376681614, -1.39461883408072, -1.40807174887892,
-                                      -1.41479820627803, -1.41928251121076, -1.42152466367713, -1.42152466367713,
-                                      -1.42152466367713])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.4375, 3.55846774193548, 3.74596774193548, 3.90927419354839,
-                                      4.05443548387097, 4.30241935483871, 4.57459677419355, 4.85887096774194, 5.125,
-                                      5.43951612903226, 5.76008064516129, 6.16532258064516, 6.47983870967742,
-                                      6.96370967741936, 7.99798387096774],
-                                     [-1.25784753363229, -1.29372197309417, -1.32735426008969, -1.36995515695067,
-                                      -1.39910313901345, -1.42600896860987, -1.45739910313901, -1.47982062780269,
-                                      -1.49551569506727, -1.50448430493274, -1.51121076233184, -1.51569506726457,
-                                      -1.51569506726457, -1.51793721973094, -1.51793721973094, -1.51793721973094])
-                           )
-            friction_factor = np.interp(relative_roughness, [0.005, 0.01], [ff2, ff1])
-        elif 0.005 >= relative_roughness > 0.002:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.4375, 3.55846774193548, 3.74596774193548, 3.90927419354839,
-                                      4.05443548387097, 4.30241935483871, 4.57459677419355, 4.85887096774194, 5.125,
-                                      5.43951612903226, 5.76008064516129, 6.16532258064516, 6.47983870967742,
-                                      6.96370967741936, 7.99798387096774],
-                                     [-1.25784753363229, -1.29372197309417, -1.32735426008969, -1.36995515695067,
-                                      -1.39910313901345, -1.42600896860987, -1.45739910313901, -1.47982062780269,
-                                      -1.49551569506727, -1.50448430493274, -1.51121076233184, -1.51569506726457,
-                                      -1.51569506726457, -1.51793721973094, -1.51793721973094, -1.51793721973094])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.44959677419355, 3.59475806451613, 3.77620967741935,
-                                      3.9758064516129, 4.1633064516129, 4.45967741935484, 4.73790322580645,
-                                      5.05846774193548, 5.42137096774193, 5.95362903225806, 6.55241935483871,
-                                      7.99798387096774],
-                                     [-1.2780269058296, -1.32286995515695, -1.36547085201794, -1.41479820627803,
-                                      -1.45964125560538, -1.49775784753363, -1.54484304932735, -1.5762331838565,
-                                      -1.59865470852018, -1.61659192825112, -1.62556053811659, -1.63004484304933,
-                                      -1.6322869955157])
-                           )
-            friction_factor = np.interp(relative_roughness, [0.002, 0.005], [ff2, ff1])
-        elif 0.002 >= relative_roughness > 0.001:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.44959677419355, 3.59475806451613, 3.77620967741935,
-                                      3.9758064516129, 4.1633064516129, 4.45967741935484, 4.73790322580645,
-                                      5.05846774193548, 5.42137096774193, 5.95362903225806, 6.55241935483871,
-                                      7.99798387096774],
-                                     [-1.2780269058296, -1.32286995515695, -1.36547085201794, -1.41479820627803,
-                                      -1.45964125560538, -1.49775784753363, -1.54484304932735, -1.5762331838565,
-                                      -1.59865470852018, -1.61659192825112, -1.62556053811659, -1.63004484304933,
-                                      -1.6322869955157])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.44959677419355, 3.61290322580645, 3.76411290322581,
-                                      3.91532258064516, 4.13306451612903, 4.41129032258064, 4.76814516129032,
-                                      5.01008064516129, 5.30040322580645, 5.65120967741935, 6.00201612903226,
-                                      6.32862903225806, 6.6491935483871, 6.91532258064516, 7.3991935483871,
-                                      7.99798387096774],
-                                     [-1.28699551569507, -1.33183856502242, -1.38340807174888, -1.42600896860987,
-                                      -1.46412556053812, -1.51569506726457, -1.57174887892377, -1.62556053811659,
-                                      -1.65246636771301, -1.67488789237668, -1.69058295964126, -1.69955156950673,
-                                      -1.70627802690583, -1.70627802690583, -1.70627802690583, -1.7085201793722,
-                                      -1.7085201793722])
-                           )
-            friction_factor = np.interp(relative_roughness, [0.001, 0.002], [ff2, ff1])
-        elif 0.001 >= relative_roughness > 5.0e-4:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.44959677419355, 3.61290322580645, 3.76411290322581,
-                                      3.91532258064516, 4.13306451612903, 4.41129032258064, 4.76814516129032,
-                                      5.01008064516129, 5.30040322580645, 5.65120967741935, 6.00201612903226,
-                                      6.32862903225806, 6.6491935483871, 6.91532258064516, 7.3991935483871,
-                                      7.99798387096774],
-                                     [-1.28699551569507, -1.33183856502242, -1.38340807174888, -1.42600896860987,
-                                      -1.46412556053812, -1.51569506726457, -1.57174887892377, -1.62556053811659,
-                                      -1.65246636771301, -1.67488789237668, -1.69058295964126, -1.69955156950673,
-                                      -1.70627802690583, -1.70627802690583, -1.70627802690583, -1.7085201793722,
-                                      -1.7085201793722])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.43145161290322, 3.56451612903226, 3.70967741935484,
-                                      3.84274193548387, 4.0241935483871, 4.33266129032258, 4.60483870967742,
-                                      4.97983870967742, 5.44556451612903, 5.85685483870968, 6.30443548387097,
-                                      6.96975806451613, 8.00403225806451],
-                                     [-1.28923766816144, -1.32959641255605, -1.37443946188341, -1.41704035874439,
-                                      -1.45515695067265, -1.50448430493274, -1.5762331838565, -1.63004484304933,
-                                      -1.68834080717489, -1.73542600896861, -1.75784753363229, -1.77130044843049,
-                                      -1.77578475336323, -1.78026905829597])
-                           )
-            friction_factor = np.interp(relative_roughness, [5.0e-4, 0.001], [ff2, ff1])
-        elif 5.0e-4 >= relative_roughness > 2.0e-4:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.43145161290322, 3.56451612903226, 3.70967741935484,
-                                      3.84274193548387, 4.0241935483871, 4.33266129032258, 4.60483870967742,
-                                      4.97983870967742, 5.44556451612903, 5.85685483870968, 6.30443548387097,
-                                      6.96975806451613, 8.00403225806451],
-                                     [-1.28923766816144, -1.32959641255605, -1.37443946188341, -1.41704035874439,
-                                      -1.45515695067265, -1.50448430493274, -1.5762331838565, -1.63004484304933,
-                                      -1.68834080717489, -1.73542600896861, -1.75784753363229, -1.77130044843049,
-                                      -1.77578475336323, -1.78026905829597])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.49798387096774, 3.69758064516129, 3.92741935483871,
-                                      4.13306451612903, 4.32661290322581, 4.58064516129032, 4.76209677419355,
-                                      5.02822580645161, 5.28225806451613, 5.56653225806452, 5.86895161290323,
-                                      6.30443548387097, 6.77620967741935, 7.22983870967742, 7.61693548387097,
-                                      7.99798387096774],
-                                     [-1.2914798206278, -1.35650224215247, -1.42152466367713, -1.48878923766816,
-                                      -1.54260089686099, -1.58744394618834, -1.64349775784753, -1.67937219730942,
-                                      -1.72645739910314, -1.76457399103139, -1.79820627802691, -1.82286995515695,
-                                      -1.84529147982063, -1.85650224215247, -1.8609865470852, -1.86322869955157,
-                                      -1.86322869955157])
-                           )
-            friction_factor = np.interp(relative_roughness, [2.0e-4, 5.0e-4], [ff2, ff1])
-        elif 2.0e-4 >= relative_roughness > 1.0e-4:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.49798387096774, 3.69758064516129, 3.92741935483871,
-                                      4.13306451612903, 4.32661290322581, 4.58064516129032, 4.76209677419355,
-                                      5.02822580645161, 5.28225806451613, 5.56653225806452, 5.86895161290323,
-                                      6.30443548387097, 6.77620967741935, 7.22983870967742, 7.61693548387097,
-                                      7.99798387096774],
-                                     [-1.2914798206278, -1.35650224215247, -1.42152466367713, -1.48878923766816,
-                                      -1.54260089686099, -1.58744394618834, -1.64349775784753, -1.67937219730942,
-                                      -1.72645739910314, -1.76457399103139, -1.79820627802691, -1.82286995515695,
-                                      -1.84529147982063, -1.85650224215247, -1.8609865470852, -1.86322869955157,
-                                      -1.86322869955157])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.54637096774194, 3.75806451612903, 3.94556451612903,
-                                      4.10887096774193, 4.30846774193548, 4.46572580645161, 4.61693548387097,
-                                      4.81048387096774, 5.07661290322581, 5.34274193548387, 5.53629032258064,
-                                      5.73588709677419, 6.0141129032258, 6.26814516129032, 6.54032258064516,
-                                      6.82459677419355, 7.18145161290322, 7.53225806451613, 7.99798387096774],
-                                     [-1.29372197309417, -1.37443946188341, -1.44170403587444, -1.49551569506727,
-                                      -1.54035874439462, -1.58968609865471, -1.62556053811659, -1.65919282511211,
-                                      -1.69955156950673, -1.74887892376682, -1.79372197309417, -1.82062780269058,
-                                      -1.84529147982063, -1.87219730941704, -1.89013452914798, -1.90358744394619,
-                                      -1.91255605381166, -1.9170403587444, -1.91928251121076, -1.92152466367713])
-                           )
-            friction_factor = np.interp(relative_roughness, [1.0e-4, 2.0e-4], [ff2, ff1])
-        elif 1.0e-4 >= relative_roughness > 5.0e-5:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.54637096774194, 3.75806451612903, 3.94556451612903,
-                                      4.10887096774193, 4.30846774193548, 4.46572580645161, 4.61693548387097,
-                                      4.81048387096774, 5.07661290322581, 5.34274193548387, 5.53629032258064,
-                                      5.73588709677419, 6.0141129032258, 6.26814516129032, 6.54032258064516,
-                                      6.82459677419355, 7.18145161290322, 7.53225806451613, 7.99798387096774],
-                                     [-1.29372197309417, -1.37443946188341, -1.44170403587444, -1.49551569506727,
-                                      -1.54035874439462, -1.58968609865471, -1.62556053811659, -1.65919282511211,
-                                      -1.69955156950673, -1.74887892376682, -1.79372197309417, -1.82062780269058,
-                                      -1.84529147982063, -1.87219730941704, -1.89013452914798, -1.90358744394619,
-                                      -1.91255605381166, -1.9170403587444, -1.91928251121076, -1.92152466367713])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.44959677419355, 3.70362903225806, 4.04233870967742,
-                                      4.30241935483871, 4.48991935483871, 4.76814516129032, 4.95564516129032, 5.125,
-                                      5.33064516129032, 5.56048387096774, 5.95362903225806, 6.26209677419355,
-                                      6.52822580645161, 6.91532258064516, 7.24193548387096, 7.65322580645161,
-                                      7.99798387096774],
-                                     [-1.29372197309417, -1.34304932735426, -1.4237668161435, -1.52466367713005,
-                                      -1.59192825112108, -1.63677130044843, -1.69955156950673, -1.73318385650224,
-                                      -1.76681614349776, -1.80269058295964, -1.84080717488789, -1.89237668161435,
-                                      -1.9237668161435, -1.94394618834081, -1.96188340807175, -1.96860986547085,
-                                      -1.97533632286996, -1.97757847533632])
-                           )
-            friction_factor = np.interp(relative_roughness, [5.0e-5, 1.0e-4], [ff2, ff1])
-        elif 5.0e-5 >= relative_roughness > 1.0e-5:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.44959677419355, 3.70362903225806, 4.04233870967742,
-                                      4.30241935483871, 4.48991935483871, 4.76814516129032, 4.95564516129032, 5.125,
-                                      5.33064516129032, 5.56048387096774, 5.95362903225806, 6.26209677419355,
-                                      6.52822580645161, 6.91532258064516, 7.24193548387096, 7.65322580645161,
-                                      7.99798387096774],
-                                     [-1.29372197309417, -1.34304932735426, -1.4237668161435, -1.52466367713005,
-                                      -1.59192825112108, -1.63677130044843, -1.69955156950673, -1.73318385650224,
-                                      -1.76681614349776, -1.80269058295964, -1.84080717488789, -1.89237668161435,
-                                      -1.9237668161435, -1.94394618834081, -1.96188340807175, -1.96860986547085,
-                                      -1.97533632286996, -1.97757847533632])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.52822580645161, 3.71572580645161, 3.98185483870968,
-                                      4.22983870967742, 4.50806451612903, 4.70766129032258, 4.94354838709677,
-                                      5.20362903225806, 5.57258064516129, 5.875, 6.11693548387097, 6.35282258064516,
-                                      6.61895161290323, 6.98185483870968, 7.32056451612903, 7.71975806451613,
-                                      7.99798387096774],
-                                     [-1.29372197309417, -1.3677130044843, -1.42825112107623, -1.5067264573991,
-                                      -1.57174887892377, -1.64125560538117, -1.68834080717489, -1.73766816143498,
-                                      -1.78923766816144, -1.85874439461883, -1.91031390134529, -1.94394618834081,
-                                      -1.97757847533632, -2.00896860986547, -2.04260089686099, -2.06502242152466,
-                                      -2.08071748878924, -2.08744394618834])
-                           )
-            friction_factor = np.interp(relative_roughness, [1.0e-5, 5.0e-5], [ff2, ff1])
-        elif 1.0e-5 >= relative_roughness > 5.0e-6:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.52822580645161, 3.71572580645161, 3.98185483870968,
-                                      4.22983870967742, 4.50806451612903, 4.70766129032258, 4.94354838709677,
-                                      5.20362903225806, 5.57258064516129, 5.875, 6.11693548387097, 6.35282258064516,
-                                      6.61895161290323, 6.98185483870968, 7.32056451612903, 7.71975806451613,
-                                      7.99798387096774],
-                                     [-1.29372197309417, -1.3677130044843, -1.42825112107623, -1.5067264573991,
-                                      -1.57174887892377, -1.64125560538117, -1.68834080717489, -1.73766816143498,
-                                      -1.78923766816144, -1.85874439461883, -1.91031390134529, -1.94394618834081,
-                                      -1.97757847533632, -2.00896860986547, -2.04260089686099, -2.06502242152466,
-                                      -2.08071748878924, -2.08744394618834])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.55846774193548, 3.8366935483871, 4.12701612903226,
-                                      4.3991935483871, 4.65927419354839, 4.9133064516129, 5.14314516129032, 5.6875,
-                                      6.02620967741935, 6.4133064516129, 6.81854838709677, 7.17540322580645,
-                                      7.59879032258065, 7.99798387096774],
-                                     [-1.29372197309417, -1.38116591928251, -1.46412556053812, -1.54484304932735,
-                                      -1.61434977578475, -1.67713004484305, -1.73318385650224, -1.78026905829597,
-                                      -1.88340807174888, -1.94170403587444, -1.9932735426009, -2.04484304932735,
-                                      -2.08071748878924, -2.10762331838565, -2.12556053811659])
-                           )
-            friction_factor = np.interp(relative_roughness, [5.0e-6, 1.0e-5], [ff2, ff1])
-        elif 5.0e-6 >= relative_roughness > 1.0e-6:
-            ff1 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.55846774193548, 3.8366935483871, 4.12701612903226,
-                                      4.3991935483871, 4.65927419354839, 4.9133064516129, 5.14314516129032, 5.6875,
-                                      6.02620967741935, 6.4133064516129, 6.81854838709677, 7.17540322580645,
-                                      7.59879032258065, 7.99798387096774],
-                                     [-1.29372197309417, -1.38116591928251, -1.46412556053812, -1.54484304932735,
-                                      -1.61434977578475, -1.67713004484305, -1.73318385650224, -1.78026905829597,
-                                      -1.88340807174888, -1.94170403587444, -1.9932735426009, -2.04484304932735,
-                                      -2.08071748878924, -2.10762331838565, -2.12556053811659])
-                           )
-            ff2 = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                     [3.29838709677419, 3.52217741935484, 3.78225806451613, 4.13306451612903,
-                                      4.44153225806452, 4.71370967741935, 4.94959677419355, 5.25201612903226,
-                                      5.60282258064516, 5.8508064516129, 6.14112903225806, 6.45564516129032,
-                                      6.72177419354839, 6.98185483870968, 7.25403225806451, 7.59879032258065,
-                                      7.99798387096774],
-                                     [-1.29372197309417, -1.3677130044843, -1.44618834080718, -1.54708520179372,
-                                      -1.62331838565023, -1.68834080717489, -1.73766816143498, -1.80044843049328,
-                                      -1.86771300448431, -1.91255605381166, -1.96188340807175, -2.01121076233184,
-                                      -2.04932735426009, -2.08295964125561, -2.11659192825112, -2.15470852017937,
-                                      -2.18834080717489])
-                           )
-            friction_factor = np.interp(relative_roughness, [1.0e-6, 5.0e-6], [ff2, ff1])
-        else:
-            friction_factor = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                                 [3.29838709677419, 3.42540322580645, 3.67338709677419,
-                                                  3.92137096774193, 4.25403225806452, 4.66532258064516,
-                                                  4.88911290322581, 5.40927419354839, 5.72983870967742,
-                                                  6.03225806451613, 6.29838709677419, 6.59475806451613,
-                                                  6.96370967741936, 7.27822580645161, 7.58064516129032,
-                                                  7.99798387096774],
-                                                 [-1.29372197309417, -1.33632286995516, -1.41479820627803,
-                                                  -1.48654708520179, -1.57399103139013, -1.67713004484305,
-                                                  -1.72645739910314, -1.83183856502242, -1.89013452914798,
-                                                  -1.94394618834081, -1.9865470852018, -2.03363228699552,
-                                                  -2.08520179372197, -2.13004484304933, -2.17040358744395,
-                                                  -2.2219730941704]))
+        friction_factor, friction_factor_laminar, friction_factor_turbulent, flow_regime = _moody_core(
+            reynolds_number, relative_roughness)
+        flow_regime = MOODY_FLOW_REGIMES[flow_regime]
 
         head_loss = friction_factor * (pipe_length / pipe_diameter) * (
         (average_velocity ** 2.0) / (2.0 * gravity_coefficient))
         pressure_drop = fluid_density * gravity_coefficient * head_loss
 
-        friction_factor_laminar = 64.0 / reynolds_number
-        friction_factor_turbulent = 10.0 ** (np.interp(np.log10(reynolds_number),
-                                                       [3.58266129032258, 3.89112903225806, 4.07258064516129,
-                                                        4.28427419354839, 4.48991935483871, 4.75, 5.14314516129032,
-                                                        5.43951612903226, 6.0625, 6.38306451612903, 6.70362903225806,
-                                                        7.13911290322581, 7.48991935483871, 7.99798387096774],
-                                                       [-1, -1.10313901345291, -1.16591928251121, -1.23542600896861,
-                                                        -1.29820627802691, -1.38116591928251, -1.48878923766816,
-                                                        -1.56726457399103, -1.7085201793722, -1.76457399103139,
-                                                        -1.81838565022422, -1.86995515695067, -1.89910313901345,
-                                                        -1.93946188340808]))
-
-        if friction_factor < friction_factor_laminar:
-            flow_regime = "Laminar Flow"
-        elif friction_factor_laminar <= friction_factor < friction_factor_turbulent:
-            flow_regime = "Transition Region"
-        else:
-            flow_regime = "Complete turbulence"
-
         return {
             'friction_factor [-]': friction_factor,
             'roughness [mm]': roughness,
@@ -513,14 +233,226 @@ def pressuredrop_relativeroughness_moody(reynolds_number, pipe_diameter, pipe_ma
 
     except:
         if fail_silently or fail_silently is None:
-            return {
-                'friction_factor [-]': np.nan,
-                'roughness [mm]': np.nan,
-                'head_loss [m]': np.nan,
-                'pressure_drop [Pa]': np.nan,
-                'flow_regime [-]': None,
-                'friction_factor_laminar [-]': np.nan,
-                'friction_factor_turbulent [-]': np.nan,
-            }
+            return PRESSUREDROP_RELATIVEROUGHNESS_MOODY_ERRORRETURN.copy()
         else:
-            raise
\ No newline at end of file
+            raise
+
+def pressuredrop_relativeroughness_moody_vec(reynolds_number, pipe_diameter, pipe_material, pipe_length,
+                                             average_velocity, fluid_density, gravity_coefficient=9.81,
+                                             relative_roughness=np.nan):
+    """
+    Vectorised version of ``pressuredrop_relativeroughness_moody``. The Reynolds number, pipe diameter, pipe length, average velocity, fluid density and relative roughness override can be NumPy arrays (or anything which can be converted to a float array) and are broadcast against each other, e.g. to calculate the pressure drop for a range of flow rates or pipe diameters in a single call. The pipe material applies to all pipes, the relative roughness override is used where it is not ``nan``.
+
+    The arguments are checked against the suggested ranges of ``pressuredrop_relativeroughness_moody`` and a ``ValueError`` is raised when an argument is outside its range. A pipe diameter of zero is also rejected, as the head loss is undefined (the scalar function returns ``nan`` in that case).
+
+    :param reynolds_number: Array with Reynolds numbers (:math:`Re`) [:math:`-`]  - Suggested range: 500.0<=reynolds_number<=100000000.0
+    :param pipe_diameter: Array with pipe inside diameters (:math:`d`) [:math:`m`]  - Suggested range: 0.0<=pipe_diameter
+    :param pipe_material: Pipe material [:math:`-`] Options: see ``pressuredrop_relativeroughness_moody``
+    :param pipe_length: Array with pipe lengths (:math:`L`) [:math:`m`]  - Suggested range: 0.0<=pipe_length
+    :param average_velocity: Array with average velocities of the fluid in the pipe (:math:`V`) [:math:`m/s`]  - Suggested range: 0.0<=average_velocity
+    :param fluid_density: Array with densities of the fluid (:math:`\\rho`) [:math:`kg/m3`]  - Suggested range: 500.0<=fluid_density<=2500.0
+    :param gravity_coefficient: Acceleration due to gravity (:math:`g`) [:math:`m/s2`] (optional, default=9.81) - Suggested range: 9.7<=gravity_coefficient<=10.0
+    :param relative_roughness: Array with relative roughness overrides [:math:`-`] (optional, default=np.nan) - Suggested range: relative_roughness<=0.05
+
+    :returns: Same output as ``pressuredrop_relativeroughness_moody`` with arrays instead of scalars, the flow regime is an array of strings
+
+    :rtype: Python dictionary with keys ['friction_factor [-]','roughness [mm]','head_loss [m]','pressure_drop [Pa]','flow_regime [-]','friction_factor_laminar [-]','friction_factor_turbulent [-]']
+
+    """
+
+    reynolds_number = np.asarray(reynolds_number, dtype=np.float64)
+    pipe_diameter = np.asarray(pipe_diameter, dtype=np.float64)
+    pipe_length = np.asarray(pipe_length, dtype=np.float64)
+    average_velocity = np.asarray(average_velocity, dtype=np.float64)
+    fluid_density = np.asarray(fluid_density, dtype=np.float64)
+    relative_roughness = np.asarray(relative_roughness, dtype=np.float64)
+
+    if np.any(reynolds_number < 500.0) or np.any(reynolds_number > 100000000.0):
+        raise ValueError("reynolds_number must be between 500.0 and 100000000.0")
+    if np.any(pipe_diameter <= 0.0):
+        raise ValueError("pipe_diameter (%s) must be greater than 0.0" % str(pipe_diameter.min()))
+    if np.any(pipe_length < 0.0):
+        raise ValueError("pipe_length (%s) cannot be smaller than 0.0" % str(pipe_length.min()))
+    if np.any(average_velocity < 0.0):
+        raise ValueError("average_velocity (%s) cannot be smaller than 0.0" % str(average_velocity.min()))
+    if np.any(fluid_density < 500.0) or np.any(fluid_density > 2500.0):
+        raise ValueError("fluid_density must be between 500.0 and 2500.0")
+    if not 9.7 <= gravity_coefficient <= 10.0:
+        raise ValueError("gravity_coefficient (%s) must be between 9.7 and 10.0" % str(gravity_coefficient))
+    if np.any(relative_roughness > 0.05):
+        raise ValueError("relative_roughness (%s) cannot be greater than 0.05" % str(np.nanmax(relative_roughness)))
+
+    shape = np.broadcast(reynolds_number, pipe_diameter, pipe_length, average_velocity, fluid_density,
+                         relative_roughness).shape
+    use_material = np.isnan(relative_roughness)
+    if np.any(use_material):
+        material_roughness = _pipe_roughness(pipe_material)
+    else:
+        material_roughness = np.nan
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roughness = np.broadcast_to(
+            np.where(use_material, material_roughness, relative_roughness * pipe_diameter * 1000.0), shape)
+        relative_roughness = np.broadcast_to(
+            np.where(use_material, 0.001 * material_roughness / pipe_diameter, relative_roughness), shape)
+
+        log_reynolds = np.broadcast_to(np.log10(reynolds_number), shape)
+        # As for the scalar bisection, an undefined relative roughness is treated as a smooth pipe
+        intervals = np.where(np.isnan(relative_roughness), 0,
+                             np.searchsorted(MOODY_CHART_RELATIVE_ROUGHNESS, relative_roughness, side='left'))
+        friction_factor = np.empty(shape)
+        # The chart curves are only evaluated for the relative roughness intervals which occur
+        for interval in np.unique(intervals):
+            selection = intervals == interval
+            friction_factor[selection] = _moody_friction_factor(
+                interval, log_reynolds[selection], relative_roughness[selection])
+
+        head_loss = friction_factor * (pipe_length / pipe_diameter) * (
+            (average_velocity ** 2.0) / (2.0 * gravity_coefficient))
+    pressure_drop = fluid_density * gravity_coefficient * head_loss
+
+    friction_factor_laminar = 64.0 / np.broadcast_to(reynolds_number, shape)
+    friction_factor_turbulent = 10.0 ** np.interp(log_reynolds, *MOODY_CHART_COMPLETE_TURBULENCE)
+
+    flow_regime = np.select(
+        [friction_factor < friction_factor_laminar, friction_factor < friction_factor_turbulent],
+        MOODY_FLOW_REGIMES[:2], MOODY_FLOW_REGIMES[2])
+
+    return {
+        'friction_factor [-]': friction_factor,
+        'roughness [mm]': roughness.copy(),
+        'head_loss [m]': np.broadcast_to(head_loss, shape).copy(),
+        'pressure_drop [Pa]': np.broadcast_to(pressure_drop, shape).copy(),
+        'flow_regime [-]': flow_regime,
+        'friction_factor_laminar [-]': friction_factor_laminar,
+        'friction_factor_turbulent [-]': friction_factor_turbulent,
+    }
+
+
+LN10 = math.log(10.0)
+# Python scalar types for which the plain Python calculation is used
+SCALAR_TYPES = (float, int)
+# The argument of the omega function is at least 5 for Re >= 500, two iterations are then accurate to machine precision
+COLEBROOK_ITERATIONS = 2
+
+
+def _colebrook_friction_factor(reynolds_number, relative_roughness):
+    """
+    Solves the Colebrook-White equation for the Darcy-Weisbach friction factor with the Wright omega function. The
+    omega function is evaluated with a fixed number of Fritsch-Shafer-Crowley iterations, no convergence check is
+    required. The Reynolds number and relative roughness can be scalars or arrays.
+    """
+    # Scalars are evaluated with the math module, NumPy calls on scalars are several times slower
+    if type(reynolds_number) in SCALAR_TYPES and type(relative_roughness) in SCALAR_TYPES:
+        log = math.log
+    else:
+        log = np.log
+    # Substitution z = omega(x1 + x2) which solves z + ln(z) = x1 + x2
+    x1 = LN10 * relative_roughness * reynolds_number / 18.574
+    x2 = log(LN10 * reynolds_number / 5.02)
+    x = x1 + x2
+    z = x - log(x)
+    for _ in range(COLEBROOK_ITERATIONS):
+        residual = x - z - log(z)
+        one_plus_z = 1.0 + z
+        product = one_plus_z * (one_plus_z + (2.0 / 3.0) * residual)
+        z = z * (1.0 + (residual / one_plus_z) * (product - 0.5 * residual) / (product - residual))
+    # z - x1 is evaluated as x2 - ln(z) to avoid the cancellation of two large terms at high Reynolds numbers
+    return (LN10 / (2.0 * (x2 - log(z)))) ** 2.0
+
+
+FRICTIONFACTOR_RELATIVEROUGHNESS_COLEBROOK = {
+    'reynolds_number': {'type': 'float', 'min_value': 4000.0, 'max_value': 100000000.0},
+    'relative_roughness': {'type': 'float', 'min_value': 0.0, 'max_value': 0.05},
+}
+
+FRICTIONFACTOR_RELATIVEROUGHNESS_COLEBROOK_ERRORRETURN = {
+    'friction_factor [-]': np.nan,
+}
+
+
+@Validator(FRICTIONFACTOR_RELATIVEROUGHNESS_COLEBROOK, FRICTIONFACTOR_RELATIVEROUGHNESS_COLEBROOK_ERRORRETURN)
+def frictionfactor_relativeroughness_colebrook(reynolds_number, relative_roughness, **kwargs):
+    """
+    Calculates the Darcy-Weisbach friction factor for turbulent flow in pipes from the Colebrook-White equation. The Colebrook-White equation is implicit in the friction factor but can be solved explicitly using the Wright omega function :math:`\\omega`, which is evaluated with a fixed number of iterations. Contrary to ``pressuredrop_relativeroughness_moody``, the result does not depend on a digitised chart. The equation applies to turbulent flow only.
+
+    :param reynolds_number: Reynolds number (:math:`Re`) [:math:`-`] - Suggested range: 4000.0 <= reynolds_number <= 100000000.0
+    :param relative_roughness: Relative pipe roughness (:math:`\\epsilon / d`) [:math:`-`] - Suggested range: 0.0 <= relative_roughness <= 0.05
+
+    .. math::
+        \\frac{1}{\\sqrt{f_D}} = -2 \\log_{10} \\left( \\frac{\\epsilon / d}{3.7} + \\frac{2.51}{Re \\sqrt{f_D}} \\right)
+
+        x_1 = \\frac{\\ln(10) \\cdot (\\epsilon / d) \\cdot Re}{18.574} \\quad x_2 = \\ln \\left( \\frac{\\ln(10) \\cdot Re}{5.02} \\right)
+
+        f_D = \\left( \\frac{\\ln(10)}{2 \\cdot (\\omega(x_1 + x_2) - x_1)} \\right)^2
+
+    :returns: Dictionary with the following keys:
+
+        - 'friction_factor [-]': Darcy-Weisbach friction factor (:math:`f_D`)  [:math:`-`]
+
+    Reference - Colebrook, C.F. (1939). Turbulent flow in pipes, with particular reference to the transition region between the smooth and rough pipe laws. Journal of the Institution of Civil Engineers, 11 (4): 133-156
+
+    """
+
+    _friction_factor = _colebrook_friction_factor(reynolds_number, relative_roughness)
+
+    return {
+        'friction_factor [-]': _friction_factor,
+    }
+
+
+def _swameejain_friction_factor(reynolds_number, relative_roughness, accurate=False):
+    """
+    Calculates the Darcy-Weisbach friction factor with the explicit approximation of Swamee and Jain. With
+    ``accurate=True``, one Newton step on the Colebrook-White equation is applied to the approximation. The Reynolds
+    number and relative roughness can be scalars or arrays.
+    """
+    a = relative_roughness / 3.7
+    log_swameejain = np.log10(a + 5.74 / reynolds_number ** 0.9)
+    if not accurate:
+        return 0.25 / log_swameejain ** 2.0
+    # Newton step on g(y) = y + 2 log10(a + b y) with y = 1 / sqrt(f). The starting value follows directly from the
+    # logarithm of the approximation, no square root of the approximated friction factor is needed
+    b = 2.51 / reynolds_number
+    y = -2.0 * log_swameejain
+    log_argument = a + b * y
+    y = y - (y + 2.0 * np.log10(log_argument)) / (1.0 + (2.0 / LN10) * b / log_argument)
+    return 1.0 / (y * y)
+
+
+FRICTIONFACTOR_RELATIVEROUGHNESS_SWAMEEJAIN = {
+    'reynolds_number': {'type': 'float', 'min_value': 5000.0, 'max_value': 100000000.0},
+    'relative_roughness': {'type': 'float', 'min_value': 1.0e-6, 'max_value': 0.01},
+    'accurate': {'type': 'bool'},
+}
+
+FRICTIONFACTOR_RELATIVEROUGHNESS_SWAMEEJAIN_ERRORRETURN = {
+    'friction_factor [-]': np.nan,
+}
+
+
+@Validator(FRICTIONFACTOR_RELATIVEROUGHNESS_SWAMEEJAIN, FRICTIONFACTOR_RELATIVEROUGHNESS_SWAMEEJAIN_ERRORRETURN)
+def frictionfactor_relativeroughness_swameejain(reynolds_number, relative_roughness, accurate=False, **kwargs):
+    """
+    Calculates the Darcy-Weisbach friction factor for turbulent flow in pipes with the explicit approximation of the Colebrook-White equation proposed by Swamee and Jain. Within the suggested ranges, the approximation deviates less than 3% from the Colebrook-White equation. When ``accurate`` is set, the approximation is refined with a single Newton step on the Colebrook-White equation, which reduces the deviation to less than 0.001%.
+
+    :param reynolds_number: Reynolds number (:math:`Re`) [:math:`-`] - Suggested range: 5000.0 <= reynolds_number <= 100000000.0
+    :param relative_roughness: Relative pipe roughness (:math:`\\epsilon / d`) [:math:`-`] - Suggested range: 1.0e-6 <= relative_roughness <= 0.01
+    :param accurate: Boolean determining whether a Newton step on the Colebrook-White equation is applied (optional, default= False)
+
+    .. math::
+        f_D = \\frac{0.25}{\\left[ \\log_{10} \\left( \\frac{\\epsilon / d}{3.7} + \\frac{5.74}{Re^{0.9}} \\right) \\right]^2}
+
+    :returns: Dictionary with the following keys:
+
+        - 'friction_factor [-]': Darcy-Weisbach friction factor (:math:`f_D`)  [:math:`-`]
+
+    Reference - Swamee, P.K., Jain, A.K. (1976). Explicit equations for pipe-flow problems. Journal of the Hydraulics Division, ASCE, 102 (5): 657-664
+
+    """
+
+    _friction_factor = _swameejain_friction_factor(reynolds_number, relative_roughness, accurate=accurate)
+
+    return {
+        'friction_factor [-]': _friction_factor,
+    }
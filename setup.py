@@ -1,5 +1,4 @@
 from setuptools import setup, find_packages
-import multiprocessing
 
 def readme():
     with open('README.rst') as f:
@@ -17,6 +16,6 @@ setup(name='python-engineering',
       license='Creative Commons BY-SA 4.0',
       packages=find_packages(),
       include_package_data=True,
+      package_data={'pyeng': ['geotechnical/stress_strain/*.json', 'hydraulics/pipe_flow/*.json']},
       zip_safe=False,
-      test_suite='nose.collector',
-      tests_require=['nose'],)
\ No newline at end of file
+      test_suite='tests',)
\ No newline at end of file
@@ -170,6 +170,19 @@ class TestBeamPointLoad(unittest.TestCase):
         self.assertAlmostEqual(beam_1.slope[-1],beam_1_slope_b,10)
         self.assertAlmostEqual(beam_1.deflection[-1],0.0,10)
 
+    def test_seed(self):
+        beam = deflection.BeamPointLoad(beam_length=self.beam_length,
+                                        youngs_modulus=self.youngs_modulus,
+                                        moment_inertia=self.moment_inertia,
+                                        point_load=1.0,
+                                        load_xmax=0.5,
+                                        supporttype_left="Support",
+                                        supporttype_right="Support",
+                                        seed=1001)
+        self.assertEqual(len(beam.deflection),1001)
+        # Midspan deflection of a simply supported beam with a central point load
+        self.assertAlmostEqual(beam.deflection[500],-1.0/48.0,10)
+
     def test_changes(self):
         beam = deflection.BeamPointLoad(beam_length=self.beam_length,
                                         youngs_modulus=self.youngs_modulus,
@@ -179,8 +192,10 @@ class TestBeamPointLoad(unittest.TestCase):
                                         supporttype_left="Free",
                                         supporttype_right="Clamped")
         deflection_1 = beam.deflection[0]
+        x_1 = beam.x
         beam.supporttype_left="Clamped"
         beam.calculate()
+        self.assertIs(beam.x,x_1)
         self.assertAlmostEqual(beam.deflection[0],0.0,10)
         beam.supporttype_left="Free"
         beam.youngs_modulus = 10.0
@@ -6,7 +6,7 @@ __author__ = 'Bruno Stuyts'
 import unittest
 import numpy as np
 from pyeng.general.validation import ValidationDecorator, Validator, validate_float, validate_integer, validate_string, \
-    validate_boolean, validate_list, map_args
+    validate_boolean, validate_list, map_args, LIST_VECTORISATION_SIZE
 
 VALIDATION_DATA = {
     'a': {'type':'float','min_value':0.0,'max_value':1.0},
@@ -181,6 +181,9 @@ class Test_validate_list(unittest.TestCase):
         self.assertEqual(validate_list("example_list",example_list,elementtype="string"),True)
         example_list = ['a',2.2,'c']
         self.assertRaises(ValueError,validate_list,"example_list",example_list,elementtype="string")
+        example_list = [np.float64(1.0),np.int64(2),True]
+        self.assertEqual(validate_list("example_list",example_list,elementtype="float"),True)
+        self.assertRaises(ValueError,validate_list,"example_list",example_list,elementtype="complex")
 
     def test_ascending(self):
         example_list = [1.0,2.0,3.0]
@@ -191,6 +194,10 @@ class Test_validate_list(unittest.TestCase):
         self.assertRaises(ValueError,validate_list,"example_list",example_list,order="ascending")
         example_list = [3.0,np.nan,2.0]
         self.assertRaises(ValueError,validate_list,"example_list",example_list,order="ascending")
+        example_list = list(np.linspace(0.0,1.0,101))
+        self.assertEqual(validate_list("example_list",example_list,elementtype="float",order="ascending"),True)
+        example_list[50] = float('nan')
+        self.assertRaises(ValueError,validate_list,"example_list",example_list,elementtype="float",order="ascending")
 
     def test_descending(self):
         example_list = [3.0,2.0,1.0]
@@ -201,23 +208,45 @@ class Test_validate_list(unittest.TestCase):
         self.assertRaises(ValueError,validate_list,"example_list",example_list,order="descending")
         example_list = [3.0,np.nan,2.0,1.0,]
         self.assertRaises(ValueError,validate_list,"example_list",example_list,order="descending")
+        example_list = list(range(100,0,-1)) + [1]
+        self.assertEqual(validate_list("example_list",example_list,elementtype="int",order="descending"),True)
+        example_list = [float(x) for x in range(100,0,-1)] + [2.0]
+        self.assertRaises(ValueError,validate_list,"example_list",example_list,elementtype="float",order="descending")
 
     def test_unique(self):
         example_list = [3.0,2.0,1.0]
         self.assertEqual(validate_list("example_list",example_list,unique=True),True)
         example_list = [3.0,3.0,1.0]
         self.assertRaises(ValueError,validate_list,"example_list",example_list,unique=True)
+        example_list = list(range(100))
+        self.assertEqual(validate_list("example_list",example_list,elementtype="int",unique=True),True)
+        example_list[-1] = 0.0
+        self.assertRaises(ValueError,validate_list,"example_list",example_list,elementtype="float",unique=True)
 
     def test_empty(self):
         example_list = []
         self.assertEqual(validate_list("example_list",example_list),True)
         self.assertRaises(ValueError,validate_list,"example_list",example_list,empty_allowed=False)
 
+    def test_long_list(self):
+        # Long lists are checked with numpy and give the same outcome as short lists
+        example_list = [float(i) for i in range(LIST_VECTORISATION_SIZE + 50)]
+        self.assertEqual(validate_list("example_list",example_list,elementtype="float",order="ascending",
+                                       unique=True),True)
+        for size in [5, LIST_VECTORISATION_SIZE + 50]:
+            example_list = [[1.0, 2.0]] * size
+            self.assertRaises(ValueError,validate_list,"example_list",example_list,elementtype="float")
+            self.assertRaises(ValueError,validate_list,"example_list",example_list,elementtype="float",
+                              order="ascending")
+            example_list = [[1.0], [1.0, 2.0]] * size
+            self.assertRaises(ValueError,validate_list,"example_list",example_list,elementtype="float")
+
 
 class Test_map_args(unittest.TestCase):
 
-    def setUp(self):
-        self.validation_data = {
+    @classmethod
+    def setUpClass(cls):
+        cls.validation_data = {
             'a': {'type':'float','min_value':0.0,'max_value':1.0},
             'b': {'type':'string','options':None,'regex':None},
             'c': {'type':'float','min_value':None,'max_value':None},
@@ -225,7 +254,7 @@ class Test_map_args(unittest.TestCase):
 
         def test_func(a, b, c=1.0):
             pass
-        self.test_func = test_func
+        cls.test_func = staticmethod(test_func)
 
     def test_mapping(self):
         mapped_data = map_args(self.test_func,self.validation_data,0.5,'bruno')
@@ -239,11 +268,15 @@ class Test_map_args(unittest.TestCase):
         mapped_data = map_args(self.test_func,self.validation_data,0.5,'bruno',a__min=-10.0,a__max=10.0)
         self.assertEqual(mapped_data['a']['min_value'],-10.0)
         self.assertEqual(mapped_data['a']['max_value'],10.0)
+        # The overrides and values do not modify the original validation data
+        self.assertEqual(self.validation_data['a']['min_value'],0.0)
+        self.assertNotIn('value',self.validation_data['a'])
 
 
 class Test_validate(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         @ValidationDecorator(VALIDATION_DATA)
         def test_validated_func(a, b, c=1.0, d=[], **kwargs):
 
@@ -251,7 +284,7 @@ class Test_validate(unittest.TestCase):
                 raise ValueError("Error during function validation: %s" % kwargs['errorstring'])
 
             return True
-        self.test_validated_func = test_validated_func
+        cls.test_validated_func = staticmethod(test_validated_func)
 
         @ValidationDecorator(VALIDATION_DATA)
         def test_fail_silentfunc(a, b, c=1.0, d=[], fail_silently=True, **kwargs):
@@ -265,7 +298,7 @@ class Test_validate(unittest.TestCase):
                     return np.nan
                 else:
                     raise ValueError("Error during function execution")
-        self.test_fail_silentfunc = test_fail_silentfunc
+        cls.test_fail_silentfunc = staticmethod(test_fail_silentfunc)
 
     def test_validate_errors(self):
         self.assertRaises(ValueError,self.test_validated_func,2.0,'bruno')
@@ -287,6 +320,19 @@ class Test_validate(unittest.TestCase):
         self.assertRaises(ValueError,self.test_fail_silentfunc,0.0,'bruno',fail_silently=False)
         self.assertEqual(np.isnan(self.test_fail_silentfunc(0.0,'bruno')),True)
 
+    def test_cache(self):
+        @ValidationDecorator(VALIDATION_DATA, cache_size=8)
+        def test_cached_func(a, b, c=1.0, d=[], **kwargs):
+            return {'validated': kwargs['validated']}
+
+        self.assertEqual(test_cached_func(0.5,'bruno')['validated'],True)
+        self.assertEqual(test_cached_func(0.5,'bruno')['validated'],True)
+        self.assertEqual(test_cached_func.cache_info().hits,1)
+        self.assertEqual(test_cached_func(0.5,'bruno',c__min=2.0)['validated'],False)
+        # Unhashable arguments are not cached
+        self.assertEqual(test_cached_func(0.5,'bruno',d=[1.0,2.0])['validated'],True)
+        self.assertEqual(test_cached_func.cache_info().currsize,2)
+
 
 class Test_validate_new(unittest.TestCase):
 
@@ -9,12 +9,18 @@ from pyeng.geotechnical.classification import index_tests
 class Test_plasticity_chart(unittest.TestCase):
 
     def test_values(self):
-        self.assertEqual(index_tests.plasticity_chart(40.0,
-                                                      1.0)
-                         ['classification [-]'],
+        result = index_tests.plasticity_chart(40.0, 1.0)
+        self.assertEqual(result['classification [-]'],
                          "Inorganic Silts of Medium Comprssibility and Organic Silts")
 
-        self.assertEqual(index_tests.plasticity_chart(40.0,
-                                                      1.0)
-                         ['aline_PI [%]'],
-                         0.73*20.0)
\ No newline at end of file
+        self.assertEqual(result['aline_PI [%]'],
+                         0.73*20.0)
+
+    def test_cache(self):
+        result = index_tests.plasticity_chart(40.0, 1.0)
+        hits = index_tests.plasticity_chart.cache_info().hits
+        result['classification [-]'] = None
+        cached_result = index_tests.plasticity_chart(40.0, 1.0)
+        self.assertEqual(index_tests.plasticity_chart.cache_info().hits, hits + 1)
+        self.assertEqual(cached_result['classification [-]'],
+                         "Inorganic Silts of Medium Comprssibility and Organic Silts")
@@ -39,4 +39,22 @@ class Test_consolidation_drainage_janbu(unittest.TestCase):
                                                         drainage_path_length=1.0,
                                                         drainage_type="single",
                                                         stress_distribution="triangular decreasing")[
-                'consolidation_degree [%]'], 79.0, 1)
\ No newline at end of file
+                'consolidation_degree [%]'], 79.0, 1)
+
+    def test_cache(self):
+        result = onedimensional.consolidation_drainage_janbu(time=(3600.0 * 24.0 * 365.0),
+                                                             consolidation_coefficient=0.4,
+                                                             drainage_path_length=2.0)
+        hits = onedimensional.consolidation_drainage_janbu.cache_info().hits
+        result['time_factor [-]'] = 0.0
+        cached_result = onedimensional.consolidation_drainage_janbu(time=(3600.0 * 24.0 * 365.0),
+                                                                    consolidation_coefficient=0.4,
+                                                                    drainage_path_length=2.0)
+        self.assertEqual(onedimensional.consolidation_drainage_janbu.cache_info().hits, hits + 1)
+        self.assertAlmostEqual(cached_result['time_factor [-]'], 0.1, 10)
+        # Overrides of the validation ranges are not served from the cached result without override
+        self.assertTrue(np.isnan(
+            onedimensional.consolidation_drainage_janbu(time=(3600.0 * 24.0 * 365.0),
+                                                        consolidation_coefficient=0.4,
+                                                        drainage_path_length=2.0,
+                                                        consolidation_coefficient__min=1.0)['time_factor [-]']))
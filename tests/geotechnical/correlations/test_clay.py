@@ -7,6 +7,7 @@ __author__ = 'Bruno Stuyts'
 import unittest
 
 # 3rd party packages
+import numpy as np
 
 # Project imports
 from pyeng.geotechnical.correlations import clay
@@ -34,4 +35,19 @@ class Test_gmax_cptclay_maynerix95(unittest.TestCase):
     def test_values(self):
         self.assertAlmostEqual(
             clay.gmax_cptclay_maynerix95(cone_resistance=1.0, density=1750)['Gmax [kPa]'],
-            30982.3, 1)
\ No newline at end of file
+            30982.3, 1)
+
+class Test_gmax_cptclay_maynerix95_soa(unittest.TestCase):
+    def test_values(self):
+        cone_resistance = np.array([0.5, 1.0, 2.0])
+        density = np.array([1700.0, 1750.0, 1800.0])
+        vs = np.empty(3)
+        gmax = np.empty(3)
+        result = clay.gmax_cptclay_maynerix95_soa(cone_resistance, density, vs, gmax)
+        self.assertIs(result['Gmax [kPa]'], gmax)
+        self.assertAlmostEqual(gmax[1], 30982.3, 1)
+        for i in range(3):
+            self.assertAlmostEqual(
+                vs[i],
+                clay.gmax_cptclay_maynerix95(
+                    cone_resistance=cone_resistance[i], density=density[i])['Vs [m/s]'], 8)
@@ -4,6 +4,7 @@
 __author__ = 'Bruno Stuyts'
 
 import unittest
+import numpy as np
 from pyeng.geotechnical.stress_strain import elastic
 
 class Test_stresses_pointload_boussinesq(unittest.TestCase):
@@ -15,56 +16,259 @@ class Test_stresses_pointload_boussinesq(unittest.TestCase):
                                                   1.0)['sigma_z [kPa]'],
             47.75, 2)
 
+    def test_raw(self):
+        result = elastic.stresses_pointload_boussinesq(100.0, 1.0, 0.5, 2.0)
+        raw_result = elastic._stresses_pointload_boussinesq_raw(100.0, 1.0, 0.5, 2.0, 0.3)
+        for i, key in enumerate(['sigma_z [kPa]', 'sigma_x [kPa]', 'sigma_y [kPa]', 'tau_zx [kPa]',
+                                 'tau_yz [kPa]', 'tau_xy [kPa]', 'radius [m]']):
+            self.assertEqual(raw_result[i], result[key])
+
+
+class Test_stresses_pointload_boussinesq_vec(unittest.TestCase):
+    def test_values(self):
+        x = np.array([0.0, 1.0, -0.3])
+        y = np.array([0.0, 0.5, 2.0])
+        z = np.array([1.0, 2.0, 0.7])
+        result = elastic.stresses_pointload_boussinesq_vec(100.0, x, y, z, poisson_coefficient=0.25)
+        for i in range(3):
+            scalar_result = elastic.stresses_pointload_boussinesq(100.0, x[i], y[i], z[i], poisson_coefficient=0.25)
+            for key in scalar_result.keys():
+                self.assertAlmostEqual(result[key][i], scalar_result[key], 10)
+
+    def test_blocks(self):
+        x = np.linspace(-5.0, 5.0, 2 * elastic.POINTLOAD_BLOCK_SIZE + 11)
+        result = elastic.stresses_pointload_boussinesq_vec(100.0, x, np.array([[0.5], [1.0]]), 2.0)
+        self.assertEqual(result['sigma_z [kPa]'].shape, (2, x.size))
+        scalar_result = elastic.stresses_pointload_boussinesq(100.0, x[-1], 1.0, 2.0)
+        for key in scalar_result.keys():
+            self.assertAlmostEqual(result[key][1, -1], scalar_result[key], 10)
+        threaded_result = elastic.stresses_pointload_boussinesq_vec(100.0, x, np.array([[0.5], [1.0]]), 2.0, workers=3)
+        for key in result.keys():
+            self.assertTrue(np.array_equal(threaded_result[key], result[key]))
+
+    def test_broadcasting(self):
+        z = np.linspace(0.5, 10.0, 20)
+        result = elastic.stresses_pointload_boussinesq_vec(100.0, 1.0, 0.5, z)
+        self.assertEqual(result['sigma_z [kPa]'].shape, z.shape)
+        for i in [0, 7, 19]:
+            scalar_result = elastic.stresses_pointload_boussinesq(100.0, 1.0, 0.5, z[i])
+            for key in scalar_result.keys():
+                self.assertAlmostEqual(result[key][i], scalar_result[key], 10)
+        result = elastic.stresses_pointload_boussinesq_vec(100.0, 1.0, 0.5, 2.0)
+        self.assertEqual(result['sigma_z [kPa]'].shape, ())
+        self.assertAlmostEqual(float(result['sigma_z [kPa]']),
+                               elastic.stresses_pointload_boussinesq(100.0, 1.0, 0.5, 2.0)['sigma_z [kPa]'], 10)
+
+    def test_dtype(self):
+        x = np.linspace(-5.0, 5.0, 101)
+        result = elastic.stresses_pointload_boussinesq_vec(100.0, x, 1.0, 2.0)
+        result_32 = elastic.stresses_pointload_boussinesq_vec(100.0, x, 1.0, 2.0, dtype=np.float32)
+        for key in result.keys():
+            self.assertEqual(result_32[key].dtype, np.float32)
+            self.assertTrue(np.allclose(result_32[key], result[key], rtol=1e-5, atol=1e-5))
+
+    def test_errors(self):
+        self.assertRaises(ValueError, elastic.stresses_pointload_boussinesq_vec, 100.0, 0.0, 0.0,
+                          np.array([1.0, -1.0]))
+
 
 class Test_stresses_lineload_boussinesq(unittest.TestCase):
     def test_values(self):
-        self.assertAlmostEqual(elastic.stresses_lineload_boussinesq(1.0, 1.0, 1.0)['sigma_z [kPa]'], 0.159, 3)
-        self.assertAlmostEqual(elastic.stresses_lineload_boussinesq(1.0, 1.0, 1.0)['sigma_x [kPa]'], 0.159, 3)
-        self.assertAlmostEqual(elastic.stresses_lineload_boussinesq(1.0, 1.0, 1.0)['tau_zx [kPa]'], 0.159, 3)
+        result = elastic.stresses_lineload_boussinesq(1.0, 1.0, 1.0)
+        self.assertAlmostEqual(result['sigma_z [kPa]'], 0.159, 3)
+        self.assertAlmostEqual(result['sigma_x [kPa]'], 0.159, 3)
+        self.assertAlmostEqual(result['tau_zx [kPa]'], 0.159, 3)
 
 
 
 class Test_stresses_striploadconstant_boussinesq(unittest.TestCase):
     def test_values(self):
-        self.assertAlmostEqual(elastic.stresses_striploadconstant_boussinesq(1.0, 1.0, 0.0, 1.0)['sigma_z [kPa]'],
-                               0.409, 3)
-        self.assertAlmostEqual(elastic.stresses_striploadconstant_boussinesq(1.0, 1.0, 0.0, 1.0)['sigma_x [kPa]'],
-                               0.091, 3)
-        self.assertAlmostEqual(elastic.stresses_striploadconstant_boussinesq(1.0, 1.0, 0.0, 1.0)['tau_zx [kPa]'],
-                               -0.159, 3)
+        result = elastic.stresses_striploadconstant_boussinesq(1.0, 1.0, 0.0, 1.0)
+        self.assertAlmostEqual(result['sigma_z [kPa]'], 0.409, 3)
+        self.assertAlmostEqual(result['sigma_x [kPa]'], 0.091, 3)
+        self.assertAlmostEqual(result['tau_zx [kPa]'], -0.159, 3)
+        # At the surface, the vertical stress increase equals the strip load below the strip
+        self.assertAlmostEqual(elastic.stresses_striploadconstant_boussinesq(1.0, 1.0, 0.5, 0.0)['sigma_z [kPa]'],
+                               1.0, 10)
 
 # Unit test
 
 class Test_stresses_striploadtriangular_boussinesq(unittest.TestCase):
     def test_values(self):
+        result = elastic.stresses_striploadtriangular_boussinesq(1.0, 1.0, 0.0, 1.0)
+        self.assertAlmostEqual(result['sigma_z [kPa]'], 0.159, 3)
+        self.assertAlmostEqual(result['sigma_x [kPa]'], 0.061, 3)
+        self.assertAlmostEqual(result['tau_zx [kPa]'], -0.091, 3)
+
+
+class Test_stresses_circle_boussinesq(unittest.TestCase):
+    def test_values(self):
+        result = elastic.stresses_circle_boussinesq(1.0, 1.0, 1.0)
+        self.assertAlmostEqual(result['sigma_z [kPa]'], 0.646, 3)
+        self.assertAlmostEqual(result['sigma_r [kPa]'], -0.862, 3)
         self.assertAlmostEqual(
-            elastic.stresses_striploadtriangular_boussinesq(1.0, 1.0, 0.0, 1.0)['sigma_z [kPa]'],
-            0.159, 3)
-        self.assertAlmostEqual(
-            elastic.stresses_striploadtriangular_boussinesq(1.0, 1.0, 0.0, 1.0)['sigma_x [kPa]'],
-            0.061, 3)
+            elastic.stresses_circle_boussinesq(1.0, 1.0, 1.0, radius=0.25)['sigma_z [kPa]'], 0.664, 3)
         self.assertAlmostEqual(
-            elastic.stresses_striploadtriangular_boussinesq(1.0, 1.0, 0.0, 1.0)['tau_zx [kPa]'],
-            -0.091, 3)
+            elastic.stresses_circle_boussinesq(1.0, 1.0, 3.3, radius=1.7)['sigma_z [kPa]'], 0.073, 3)
 
+    def test_chart_tables(self):
+        # One curve per breakpoint, shared by the two neighbouring r/R intervals
+        self.assertEqual(len(elastic.CIRCLE_CHART_CURVES), elastic.CIRCLE_CHART_R.size)
+        self.assertEqual(elastic.CIRCLE_CHART_LOGMULT.shape, (elastic.CIRCLE_CHART_R.size, elastic.CIRCLE_CHART_Z.size))
+        # The lookup relies on sorted breakpoints and depths, the shared tables cannot be modified
+        self.assertTrue(np.all(np.diff(elastic.CIRCLE_CHART_R) > 0.0))
+        for z_values, logmult_values in elastic.CIRCLE_CHART_CURVES:
+            self.assertTrue(np.all(np.diff(z_values) >= 0.0))
+            self.assertFalse(z_values.flags.writeable)
+            self.assertFalse(logmult_values.flags.writeable)
+        self.assertFalse(elastic.CIRCLE_CHART_LOGMULT.flags.writeable)
 
-class Test_stresses_circle_boussinesq(unittest.TestCase):
+    def test_chart_breakpoints(self):
+        # On a chart curve, the stress follows from that curve only, whichever r/R interval is selected
+        for i, r_dimless in enumerate(elastic.CIRCLE_CHART_R[1:], start=1):
+            self.assertAlmostEqual(
+                elastic.stresses_circle_boussinesq(1.0, 1.0, 2.0, radius=r_dimless)['sigma_z [kPa]'],
+                10.0 ** float(elastic.CIRCLE_CHART_LOGMULT[i, 400]), 10)
+
+    def test_chart_continuity(self):
+        # Each chart curve is shared by the two neighbouring r/R intervals
+        for r_dimless in elastic.CIRCLE_CHART_R[1:-1]:
+            self.assertAlmostEqual(
+                elastic.stresses_circle_boussinesq(1.0, 1.0, 2.0, radius=r_dimless - 1e-9)['sigma_z [kPa]'],
+                elastic.stresses_circle_boussinesq(1.0, 1.0, 2.0, radius=r_dimless + 1e-9)['sigma_z [kPa]'], 6)
+
+
+class Test_stresses_circle_boussinesq_vec(unittest.TestCase):
+    def test_values(self):
+        z = np.array([0.5, 1.0, 3.3, 20.0])
+        radius = np.array([0.0, 0.25, 1.7, 1.0])
+        result = elastic.stresses_circle_boussinesq_vec(10.0, 1.0, z, radius, poisson_coefficient=0.25)
+        for i in range(4):
+            scalar_result = elastic.stresses_circle_boussinesq(10.0, 1.0, z[i], radius[i], poisson_coefficient=0.25)
+            for key in scalar_result.keys():
+                if np.isnan(scalar_result[key]):
+                    self.assertTrue(np.isnan(result[key][i]))
+                else:
+                    self.assertAlmostEqual(result[key][i], scalar_result[key], 10)
+        self.assertFalse(result['sigma_theta [kPa]'].flags.writeable)
+        self.assertTrue(np.shares_memory(result['sigma_theta [kPa]'], result['sigma_r [kPa]']))
+
+    def test_profile(self):
+        z = np.linspace(0.0, 20.0, 41)
+        result = elastic.stresses_circle_boussinesq_vec(10.0, 2.0, z, 3.0)
+        for i in [1, 10, 25, 40]:
+            scalar_result = elastic.stresses_circle_boussinesq(10.0, 2.0, z[i], 3.0)
+            if np.isnan(scalar_result['sigma_z [kPa]']):
+                self.assertTrue(np.isnan(result['sigma_z [kPa]'][i]))
+            else:
+                self.assertAlmostEqual(result['sigma_z [kPa]'][i], scalar_result['sigma_z [kPa]'], 10)
+
+    def test_workers(self):
+        z = np.linspace(0.0, 20.0, 3 * elastic.CIRCLE_BLOCK_SIZE)
+        radius = np.linspace(0.0, 12.0, 3 * elastic.CIRCLE_BLOCK_SIZE)
+        result = elastic.stresses_circle_boussinesq_vec(10.0, 2.0, z, radius)
+        threaded_result = elastic.stresses_circle_boussinesq_vec(10.0, 2.0, z, radius, workers=4)
+        self.assertTrue(np.array_equal(threaded_result['sigma_z [kPa]'], result['sigma_z [kPa]'], equal_nan=True))
+
+    def test_errors(self):
+        self.assertRaises(ValueError, elastic.stresses_circle_boussinesq_vec, 1.0, 1.0, np.array([1.0, 2.0]), -1.0)
+
+
+class Test_stresses_circle_boussinesq_profile(unittest.TestCase):
     def test_values(self):
-        self.assertAlmostEqual(elastic.stresses_circle_boussinesq(1.0, 1.0, 1.0,)['sigma_z [kPa]'], 0.646, 3)
-        self.assertAlmostEqual(elastic.stresses_circle_boussinesq(1.0, 1.0, 1.0, )['sigma_r [kPa]'], -0.862, 3)
+        z = np.linspace(0.0, 40.0, 81)
+        for radius in [0.0, 0.3, 2.5, 7.3, 30.0]:
+            profile = elastic.stresses_circle_boussinesq_profile(10.0, 2.0, radius)
+            result = profile(z)
+            vec_result = elastic.stresses_circle_boussinesq_vec(10.0, 2.0, z, radius)
+            for key in vec_result.keys():
+                self.assertTrue(np.array_equal(result[key], vec_result[key], equal_nan=True))
+
+    def test_errors(self):
+        self.assertRaises(ValueError, elastic.stresses_circle_boussinesq_profile, 1.0, 1.0, -1.0)
+        self.assertRaises(ValueError, elastic.stresses_circle_boussinesq_profile(1.0, 1.0, 1.0), np.array([1.0, -1.0]))
 
 
 class Test_stresses_rectangle_boussinesq(unittest.TestCase):
     def test_values(self):
-        self.assertAlmostEqual(
-            elastic.stresses_rectangle_boussinesq(1.0, 1.0, 0.5, 1.0)['sigma_z [kPa]'], 0.1202, 4)
-        self.assertAlmostEqual(
-            elastic.stresses_rectangle_boussinesq(1.0, 1.0, 0.5, 1.0)['sigma_x [kPa]'], 0.0247, 4)
-        self.assertAlmostEqual(
-            elastic.stresses_rectangle_boussinesq(1.0, 1.0, 0.5, 1.0)['sigma_y [kPa]'], 0.0088, 4)
-        self.assertAlmostEqual(
-            elastic.stresses_rectangle_boussinesq(1.0, 1.0, 0.5, 1.0)['tau_zx [kPa]'], 0.0447, 4)
+        result = elastic.stresses_rectangle_boussinesq(1.0, 1.0, 0.5, 1.0)
+        self.assertAlmostEqual(result['sigma_z [kPa]'], 0.1202, 4)
+        self.assertAlmostEqual(result['sigma_x [kPa]'], 0.0247, 4)
+        self.assertAlmostEqual(result['sigma_y [kPa]'], 0.0088, 4)
+        self.assertAlmostEqual(result['tau_zx [kPa]'], 0.0447, 4)
+
+    def test_scalar(self):
+        for rectangle_length, rectangle_width, z in [(1.0, 0.5, 1.0), (2.0, 1.0, 0.5), (5.0, 0.2, 3.0), (1.0, 0.5, 0.0)]:
+            scalar_result = elastic._stresses_rectangle_boussinesq_scalar(1.0, rectangle_length, rectangle_width, z)
+            raw_result = elastic._stresses_rectangle_boussinesq_raw(
+                1.0, np.float64(rectangle_length), np.float64(rectangle_width), np.float64(z))
+            for i in range(4):
+                self.assertAlmostEqual(scalar_result[i], raw_result[i], 12)
+
+    def test_cache(self):
+        result = elastic.stresses_rectangle_boussinesq(1.0, 3.0, 2.0, 4.0)
+        hits = elastic._stresses_rectangle_boussinesq_scalar.cache_info().hits
+        self.assertEqual(elastic.stresses_rectangle_boussinesq(1.0, 3.0, 2.0, 4.0), result)
+        self.assertEqual(elastic._stresses_rectangle_boussinesq_scalar.cache_info().hits, hits + 1)
+
+    def test_width_exceeding_length(self):
+        result = elastic.stresses_rectangle_boussinesq(1.0, 0.5, 1.0, 1.0, fail_silently=False)
+        result_swapped = elastic.stresses_rectangle_boussinesq(1.0, 1.0, 0.5, 1.0)
+        self.assertAlmostEqual(result['sigma_z [kPa]'], result_swapped['sigma_z [kPa]'], 10)
+        self.assertAlmostEqual(result['sigma_x [kPa]'], result_swapped['sigma_y [kPa]'], 10)
+        self.assertAlmostEqual(result['sigma_y [kPa]'], result_swapped['sigma_x [kPa]'], 10)
+
+    def test_errors(self):
+        self.assertRaises(ValueError, elastic.stresses_rectangle_boussinesq, 1.0, 1.0,
+                          0.0, 0.0, fail_silently=False)
+        self.assertTrue(np.isnan(elastic.stresses_rectangle_boussinesq(1.0, 1.0, 0.0, 0.0)['sigma_z [kPa]']))
+        self.assertRaises(ValueError, elastic.stresses_rectangle_boussinesq, 1.0, 0.0,
+                          1.0, 0.0, fail_silently=False)
+        self.assertTrue(np.isnan(elastic.stresses_rectangle_boussinesq(1.0, 0.0, 1.0, 0.0)['sigma_z [kPa]']))
+
+
+class Test_stresses_rectangle_boussinesq_vec(unittest.TestCase):
+    def test_values(self):
+        rectangle_length = np.array([1.0, 2.0, 1.0, 5.0])
+        rectangle_width = np.array([0.5, 1.0, 1.0, 0.2])
+        z = np.array([1.0, 0.5, 1.0, 3.0])
+        result = elastic.stresses_rectangle_boussinesq_vec(1.0, rectangle_length, rectangle_width, z)
+        for i in range(4):
+            scalar_result = elastic.stresses_rectangle_boussinesq(
+                1.0, rectangle_length[i], rectangle_width[i], z[i])
+            for key in scalar_result.keys():
+                self.assertAlmostEqual(result[key][i], scalar_result[key], 10)
+
+    def test_width_exceeding_length(self):
+        result = elastic.stresses_rectangle_boussinesq_vec(1.0, 1.0, np.array([0.5, 2.0]), 1.0)
+        self.assertAlmostEqual(result['sigma_z [kPa]'][1],
+                               elastic.stresses_rectangle_boussinesq(1.0, 2.0, 1.0, 1.0)['sigma_z [kPa]'], 10)
+
+    def test_profile(self):
+        z = np.linspace(0.0, 10.0, 21)
+        result = elastic.stresses_rectangle_boussinesq_vec(1.0, 1.0, 0.5, z)
+        self.assertEqual(result['sigma_z [kPa]'].shape, z.shape)
+        # Below the corner at the surface, a quarter of the applied stress is found
+        self.assertAlmostEqual(result['sigma_z [kPa]'][0], 0.25, 10)
+        self.assertAlmostEqual(result['sigma_z [kPa]'][2], 0.1202, 4)
+
+    def test_blocks(self):
+        z = np.linspace(0.0, 10.0, 2 * elastic.RECTANGLE_BLOCK_SIZE + 11)
+        result = elastic.stresses_rectangle_boussinesq_vec(1.0, np.array([[1.0], [2.0]]), 0.5, z)
+        self.assertEqual(result['sigma_z [kPa]'].shape, (2, z.size))
+        scalar_result = elastic.stresses_rectangle_boussinesq(1.0, 2.0, 0.5, z[-1])
+        for key in scalar_result.keys():
+            self.assertAlmostEqual(result[key][1, -1], scalar_result[key], 10)
+        threaded_result = elastic.stresses_rectangle_boussinesq_vec(1.0, np.array([[1.0], [2.0]]), 0.5, z, workers=3)
+        for key in result.keys():
+            self.assertTrue(np.array_equal(threaded_result[key], result[key]))
 
     def test_errors(self):
-        self.assertRaises(ValueError, elastic.stresses_rectangle_boussinesq, 1.0, 0.5,
-                          1.0, 1.0, fail_silently=False)
\ No newline at end of file
+        self.assertRaises(ValueError, elastic.stresses_rectangle_boussinesq_vec, 1.0, np.array([1.0, -1.0]), 0.5, 1.0)
+        self.assertRaises(ValueError, elastic.stresses_rectangle_boussinesq_vec, 1.0, 1.0, 0.5, np.array([1.0, -1.0]))
+        result = elastic.stresses_rectangle_boussinesq_vec(1.0, np.array([1.0, 0.0, 1.0]), np.array([0.0, 1.0, 0.0]),
+                                                           np.array([0.0, 0.0, 1.0]))
+        for key in result.keys():
+            self.assertTrue(np.isnan(result[key][0]))
+            self.assertTrue(np.isnan(result[key][1]))
+        self.assertAlmostEqual(result['sigma_z [kPa]'][2], 0.0, 10)
@@ -12,21 +12,15 @@ import math
 class Test_pressuredrop_relativeroughness_moody(unittest.TestCase):
 
     def test_fail_silently(self):
-        pressure_calcs.pressuredrop_relativeroughness_moody(100.0,
-                                                            1.0,
-                                                            "Water mains,old",
-                                                            10.0,
-                                                            5.0,
-                                                            1050.0)
-        self.assertEqual(math.isnan(
-            pressure_calcs.pressuredrop_relativeroughness_moody(
-                100.0,
-                1.0,
-                "Water mains,old",
-                10.0,
-                5.0,
-                1050.0)['friction_factor [-]']),
-                         True)
+        result = pressure_calcs.pressuredrop_relativeroughness_moody(100.0,
+                                                                     1.0,
+                                                                     "Water mains,old",
+                                                                     10.0,
+                                                                     5.0,
+                                                                     1050.0)
+        self.assertEqual(math.isnan(result['friction_factor [-]']), True)
+        self.assertEqual(result, pressure_calcs.PRESSUREDROP_RELATIVEROUGHNESS_MOODY_ERRORRETURN)
+        self.assertIsNot(result, pressure_calcs.PRESSUREDROP_RELATIVEROUGHNESS_MOODY_ERRORRETURN)
 
     def test_fail_with_error(self):
         self.assertRaises(ValueError,
@@ -40,39 +34,116 @@ class Test_pressuredrop_relativeroughness_moody(unittest.TestCase):
                           fail_silently=False)
 
     def test_values(self):
-        self.assertAlmostEqual(
-            pressure_calcs.pressuredrop_relativeroughness_moody(1.0e6,
-                                                                1.0,
-                                                                "Water mains,old",
-                                                                10.0,
-                                                                5.0,
-                                                                1050.0)['friction_factor [-]'],
-            0.02, 2)
-
-        self.assertAlmostEqual(
-            pressure_calcs.pressuredrop_relativeroughness_moody(1.0e6,
-                                                                1.0,
-                                                                "Water mains,old",
-                                                                10.0,
-                                                                5.0,
-                                                                1050.0,
-                                                                relative_roughness=0.001)['friction_factor [-]'],
-            0.02, 2)
-
-        self.assertEqual(
-            pressure_calcs.pressuredrop_relativeroughness_moody(1.0e6,
-                                                                0.3,
-                                                                "Water mains,old",
-                                                                10.0,
-                                                                5.0,
-                                                                1050.0)['flow_regime [-]'],
-            "Complete turbulence")
-
-        self.assertEqual(
-            pressure_calcs.pressuredrop_relativeroughness_moody(1.0e6,
-                                                                2.0,
-                                                                "Water mains,old",
-                                                                10.0,
-                                                                5.0,
-                                                                1050.0)['flow_regime [-]'],
-            "Transition Region")
+        # The cases are evaluated in a single call of the vectorised function, which gives the same results as the
+        # scalar function (see Test_pressuredrop_relativeroughness_moody_vec)
+        result = pressure_calcs.pressuredrop_relativeroughness_moody_vec(
+            np.array([1.0e6, 1.0e6, 1.0e6, 1.0e6]),
+            np.array([1.0, 1.0, 0.3, 2.0]),
+            "Water mains,old",
+            10.0,
+            5.0,
+            1050.0,
+            relative_roughness=np.array([np.nan, 0.001, np.nan, np.nan]))
+        np.testing.assert_allclose(result['friction_factor [-]'][0:2], 0.02, atol=0.005)
+        np.testing.assert_array_equal(result['flow_regime [-]'][2:4], ["Complete turbulence", "Transition Region"])
+
+    def test_cache(self):
+        result = pressure_calcs.pressuredrop_relativeroughness_moody(1.0e5, 0.5, "Iron,cast", 10.0, 2.0, 1000.0)
+        hits = pressure_calcs.pressuredrop_relativeroughness_moody.cache_info().hits
+        result['friction_factor [-]'] = 0.0
+        cached_result = pressure_calcs.pressuredrop_relativeroughness_moody(1.0e5, 0.5, "Iron,cast", 10.0, 2.0, 1000.0)
+        self.assertEqual(pressure_calcs.pressuredrop_relativeroughness_moody.cache_info().hits, hits + 1)
+        self.assertAlmostEqual(cached_result['friction_factor [-]'], 0.02, 2)
+
+    def test_core(self):
+        # The plain Python calculation gives the same friction factors as the NumPy chart lookup
+        for reynolds_number in [500.0, 2000.0, 1.0e5, 1.0e8]:
+            for relative_roughness in [0.0, 1.0e-6, 3.0e-4, 0.05, 0.1]:
+                interval = np.searchsorted(pressure_calcs.MOODY_CHART_RELATIVE_ROUGHNESS, relative_roughness)
+                self.assertAlmostEqual(
+                    pressure_calcs._moody_core(reynolds_number, relative_roughness)[0],
+                    pressure_calcs._moody_friction_factor(interval, np.log10(reynolds_number), relative_roughness), 14)
+
+
+class Test_pressuredrop_relativeroughness_moody_vec(unittest.TestCase):
+
+    def test_values(self):
+        reynolds_number = np.array([1.0e6, 1.0e6, 1.0e6, 1.0e6])
+        pipe_diameter = np.array([1.0, 0.3, 2.0, 1.0])
+        relative_roughness = np.array([np.nan, np.nan, np.nan, 0.001])
+        result = pressure_calcs.pressuredrop_relativeroughness_moody_vec(
+            reynolds_number, pipe_diameter, "Water mains,old", 10.0, 5.0, 1050.0,
+            relative_roughness=relative_roughness)
+        for i in range(4):
+            scalar_result = pressure_calcs.pressuredrop_relativeroughness_moody(
+                reynolds_number[i], pipe_diameter[i], "Water mains,old", 10.0, 5.0, 1050.0,
+                relative_roughness=relative_roughness[i])
+            for key in scalar_result.keys():
+                if key == 'flow_regime [-]':
+                    self.assertEqual(result[key][i], scalar_result[key])
+                else:
+                    self.assertAlmostEqual(result[key][i], scalar_result[key], 12)
+
+    def test_broadcasting(self):
+        reynolds_number = np.logspace(3.0, 7.9, 25)
+        result = pressure_calcs.pressuredrop_relativeroughness_moody_vec(
+            reynolds_number[:, np.newaxis], np.array([0.05, 0.5, 5.0]), "Iron,cast", 10.0, 1.0, 1000.0)
+        self.assertEqual(result['friction_factor [-]'].shape, (25, 3))
+        self.assertEqual(result['flow_regime [-]'].shape, (25, 3))
+        scalar_result = pressure_calcs.pressuredrop_relativeroughness_moody(
+            reynolds_number[7], 5.0, "Iron,cast", 10.0, 1.0, 1000.0)
+        self.assertAlmostEqual(result['pressure_drop [Pa]'][7, 2], scalar_result['pressure_drop [Pa]'], 10)
+
+    def test_errors(self):
+        self.assertRaises(ValueError, pressure_calcs.pressuredrop_relativeroughness_moody_vec,
+                          np.array([100.0, 1.0e6]), 1.0, "Water mains,old", 10.0, 5.0, 1050.0)
+        self.assertRaises(ValueError, pressure_calcs.pressuredrop_relativeroughness_moody_vec,
+                          1.0e6, 1.0, "Unknown material", 10.0, 5.0, 1050.0)
+        # The head loss is undefined for a zero diameter, the scalar function returns nan
+        self.assertRaises(ValueError, pressure_calcs.pressuredrop_relativeroughness_moody_vec,
+                          1.0e6, np.array([1.0, 0.0]), "Water mains,old", 10.0, 5.0, 1050.0)
+        self.assertTrue(math.isnan(pressure_calcs.pressuredrop_relativeroughness_moody(
+            1.0e6, 0.0, "Water mains,old", 10.0, 5.0, 1050.0)['head_loss [m]']))
+
+
+class Test_frictionfactor_relativeroughness_colebrook(unittest.TestCase):
+
+    def test_values(self):
+        friction_factor = pressure_calcs.frictionfactor_relativeroughness_colebrook(1.0e6, 0.001)['friction_factor [-]']
+        self.assertAlmostEqual(friction_factor, 0.02, 2)
+        # The friction factor satisfies the Colebrook-White equation
+        for reynolds_number, relative_roughness in [(4000.0, 0.0), (1.0e5, 1.0e-4), (1.0e8, 0.05)]:
+            friction_factor = pressure_calcs.frictionfactor_relativeroughness_colebrook(
+                reynolds_number, relative_roughness)['friction_factor [-]']
+            self.assertAlmostEqual(
+                1.0 / math.sqrt(friction_factor),
+                -2.0 * math.log10(relative_roughness / 3.7 + 2.51 / (reynolds_number * math.sqrt(friction_factor))),
+                12)
+
+    def test_arrays(self):
+        reynolds_number = np.logspace(3.0, 8.0, 11)
+        friction_factor = pressure_calcs._colebrook_friction_factor(reynolds_number, 1.0e-4)
+        for i in [0, 5, 10]:
+            self.assertEqual(friction_factor[i],
+                             pressure_calcs._colebrook_friction_factor(reynolds_number[i], 1.0e-4))
+            # Python floats are evaluated with the math module
+            self.assertEqual(friction_factor[i],
+                             pressure_calcs._colebrook_friction_factor(float(reynolds_number[i]), 1.0e-4))
+
+    def test_errors(self):
+        self.assertRaises(ValueError, pressure_calcs.frictionfactor_relativeroughness_colebrook, 1000.0, 0.001)
+        self.assertRaises(ValueError, pressure_calcs.frictionfactor_relativeroughness_colebrook, 1.0e6, 0.1)
+
+
+class Test_frictionfactor_relativeroughness_swameejain(unittest.TestCase):
+
+    def test_values(self):
+        for reynolds_number, relative_roughness in [(5000.0, 1.0e-6), (1.0e6, 0.001), (1.0e8, 0.01)]:
+            colebrook = pressure_calcs.frictionfactor_relativeroughness_colebrook(
+                reynolds_number, relative_roughness)['friction_factor [-]']
+            approximation = pressure_calcs.frictionfactor_relativeroughness_swameejain(
+                reynolds_number, relative_roughness)['friction_factor [-]']
+            refined = pressure_calcs.frictionfactor_relativeroughness_swameejain(
+                reynolds_number, relative_roughness, accurate=True)['friction_factor [-]']
+            self.assertLess(abs(approximation / colebrook - 1.0), 0.03)
+            self.assertLess(abs(refined / colebrook - 1.0), 1.0e-5)